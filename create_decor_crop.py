@@ -1,9 +1,13 @@
+from pathlib import Path
+
 from PIL import Image
 
+PUBLIC_DIR = Path(__file__).resolve().parent / 'frontend' / 'public'
+
 def create_decor_crop():
     try:
         # Open the destination wedding image (Beach wedding with floral arch)
-        img = Image.open('c:/Users/sneha/OneDrive/Desktop/internship/frontend/public/cat_dest_wedding.png')
+        img = Image.open(PUBLIC_DIR / 'cat_dest_wedding.png')
         
         # Crop to focus on the floral details (assuming arch is somewhat central/left)
         # Original is likely 1024x1024
@@ -24,7 +28,7 @@ def create_decor_crop():
         # Resize back to a good thumbnail size for consistency if needed, or just save
         cropped_img = cropped_img.resize((800, 600), Image.Resampling.LANCZOS)
         
-        output_path = 'c:/Users/sneha/OneDrive/Desktop/internship/frontend/public/cat_decor.png'
+        output_path = PUBLIC_DIR / 'cat_decor.png'
         cropped_img.save(output_path)
         print(f"Successfully created decor image at {output_path}")
         
@@ -1,5 +1,6 @@
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import random
+from pathlib import Path
 
 def create_luxury_decor_image(path):
     # Create a base image with a luxury gradient
@@ -24,4 +25,4 @@ def create_luxury_decor_image(path):
     image.save(path)
     print(f"Created {path}")
 
-create_luxury_decor_image('c:/Users/sneha/OneDrive/Desktop/internship/frontend/public/cat_decor.png')
+create_luxury_decor_image(Path(__file__).resolve().parent / 'frontend' / 'public' / 'cat_decor.png')
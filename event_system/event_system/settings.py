@@ -46,10 +46,40 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        'main.auth.ClaimsJWTAuthentication',
+    ),
+    # Cursor pagination, opt-in per request via ?page_size= or ?cursor=
+    'DEFAULT_PAGINATION_CLASS': 'main.pagination.KeysetPagination',
 }
 
+API_PAGE_SIZE = 25
+API_MAX_PAGE_SIZE = 200
+
+# Shared by every worker process: token revocation, the recent blacklist entries,
+# catalog versions and the hall of fame snapshot must agree across processes.
+# Redis keeps them in memory, so reading them costs no database query.
+# Rendered catalog pages go to a bounded per-process cache instead: any number
+# of query strings can only push out other pages, never the shared keys above,
+# and the shared catalog versions still invalidate them everywhere.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+    },
+    'catalog': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'catalog-pages',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+# Seconds a rendered public catalog response stays cached (ETag/304 served from it)
+CATALOG_CACHE_TIMEOUT = 300
+
+# Seconds a process keeps its in-memory price list before rereading it, even
+# if no catalog version bump reached it
+PRICE_CATALOG_TTL = 300
+
 from datetime import timedelta
 
 SIMPLE_JWT = {
@@ -57,8 +87,15 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': True,
+    # Puts role/is_staff/is_superuser into access tokens (see main/auth.py)
+    'TOKEN_OBTAIN_SERIALIZER': 'main.auth.ClaimsTokenObtainPairSerializer',
+    # Skips the blacklist table for tokens the in-process filter rules out
+    'TOKEN_REFRESH_SERIALIZER': 'main.auth.FilteredTokenRefreshSerializer',
 }
 
+# Seconds between rebuilds of each process's blacklist filter (main/auth.py)
+TOKEN_BLACKLIST_FILTER_TTL = 300
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -157,5 +194,14 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded event images (content-addressed, see main/media.py)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Responsive variants written by `manage.py build_image_variants`
+IMAGE_VARIANTS_URL = MEDIA_URL + 'variants/'
+IMAGE_VARIANTS_MANIFEST = MEDIA_ROOT / 'variants' / 'manifest.json'
+
 # Email Backend for Development (Prints to Console)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
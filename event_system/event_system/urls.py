@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from main.views import serve_media
 
 from django.http import HttpResponse
 
@@ -26,4 +27,6 @@ urlpatterns = [
     path('', home),
     path('admin/', admin.site.urls),
     path('api/', include('main.urls')),
+    path('media/cas/<path:path>', serve_media, name='media-cas'),
+    path('media/variants/<path:path>', serve_media, {'store': 'variants'}, name='media-variants'),
 ]
@@ -1,15 +1,22 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, Decoration, Booking, ConcertBooking, FestivalBooking, Tournament, SportsRegistration, Fixture
+from .models import User, Decoration, CateringPackage, PerformerPackage, Booking, ConcertBooking, FestivalBooking, Tournament, SportsRegistration, Fixture, OutboundEmail, DailyRevenue
+
+class SoftDeleteAdmin(admin.ModelAdmin):
+    # The default manager hides soft-deleted rows; the Django admin shows them all
+    def get_queryset(self, request):
+        queryset = self.model.objects.with_deleted()
+        ordering = self.get_ordering(request)
+        return queryset.order_by(*ordering) if ordering else queryset
 
 @admin.register(Tournament)
-class TournamentAdmin(admin.ModelAdmin):
+class TournamentAdmin(SoftDeleteAdmin):
     list_display = ('id', 'name', 'sport', 'date', 'registration_deadline', 'status')
     list_filter = ('sport', 'status', 'date')
     search_fields = ('name', 'sport')
 
 @admin.register(SportsRegistration)
-class SportsRegistrationAdmin(admin.ModelAdmin):
+class SportsRegistrationAdmin(SoftDeleteAdmin):
     list_display = ('id', 'user', 'tournament', 'registration_type', 'status', 'registration_date')
     list_filter = ('status', 'registration_type', 'tournament')
     search_fields = ('user__username', 'team_name', 'player_name')
@@ -20,7 +27,7 @@ class FixtureAdmin(admin.ModelAdmin):
     list_filter = ('tournament', 'status', 'round_number')
 
 @admin.register(FestivalBooking)
-class FestivalBookingAdmin(admin.ModelAdmin):
+class FestivalBookingAdmin(SoftDeleteAdmin):
     list_display = ('id', 'user', 'festival_name', 'pass_type', 'quantity', 'total_price', 'status', 'booking_date')
     list_filter = ('festival_name', 'status', 'booking_date')
     search_fields = ('user__username', 'festival_name')
@@ -38,8 +45,18 @@ class CustomUserAdmin(UserAdmin):
 class DecorationAdmin(admin.ModelAdmin):
     list_display = ('name', 'price')
 
+@admin.register(CateringPackage)
+class CateringPackageAdmin(admin.ModelAdmin):
+    list_display = ('name', 'price_per_plate', 'is_active')
+    list_filter = ('is_active',)
+
+@admin.register(PerformerPackage)
+class PerformerPackageAdmin(admin.ModelAdmin):
+    list_display = ('name', 'price', 'is_active')
+    list_filter = ('is_active',)
+
 @admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(SoftDeleteAdmin):
     list_display = ('id', 'user', 'event_type', 'event_date', 'total_cost', 'payment_status', 'status')
     list_filter = ('status', 'payment_status', 'event_type', 'event_date')
     search_fields = ('user__username', 'event_type', 'address')
@@ -58,8 +75,20 @@ class BookingAdmin(admin.ModelAdmin):
     )
 
 @admin.register(ConcertBooking)
-class ConcertBookingAdmin(admin.ModelAdmin):
+class ConcertBookingAdmin(SoftDeleteAdmin):
     list_display = ('id', 'user', 'concert_title', 'artist_name', 'ticket_type', 'quantity', 'total_price', 'payment_status', 'booking_date')
     list_filter = ('concert_title', 'ticket_type', 'payment_status')
     search_fields = ('user__username', 'concert_title', 'artist_name')
     readonly_fields = ('booking_date',)
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('id', 'subject', 'status', 'attempts', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+
+@admin.register(DailyRevenue)
+class DailyRevenueAdmin(admin.ModelAdmin):
+    list_display = ('day', 'product_line', 'status', 'count', 'revenue', 'refunds', 'cancellation_fees')
+    list_filter = ('product_line', 'status')
+    date_hierarchy = 'day'
@@ -0,0 +1,266 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import permissions
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+# --- CLAIMS-BASED TOKEN USERS ---
+# Access tokens carry the user's role and flags, so authenticated requests build
+# request.user from the token instead of loading the auth row. Any change to
+# those fields revokes the user's tokens (see revoke_tokens), which forces a new
+# login with fresh claims.
+
+CLAIM_FIELDS = User.TOKEN_CLAIM_FIELDS
+
+
+def is_admin(user):
+    # Worked out once per user object and cached on it
+    cached = getattr(user, '_is_admin', None)
+    if cached is None:
+        cached = bool(user and user.is_authenticated and (
+            (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        ))
+        user._is_admin = cached
+    return cached
+
+
+class IsAdminRole(permissions.BasePermission):
+    message = "Unauthorized"
+
+    def has_permission(self, request, view):
+        return is_admin(request.user)
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        remember_not_before(user)
+        token = super().get_token(user)
+        for field in CLAIM_FIELDS:
+            token[field] = getattr(user, field)
+        return token
+
+
+def _not_before_key(user_id):
+    return f"auth:not-before:{user_id}"
+
+
+def _not_before_timeout():
+    # Long enough to outlive any access token issued before the cutoff
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()) + 60
+
+
+def _timestamp(moment):
+    # 0 means "never revoked"
+    return int(moment.timestamp()) if moment else 0
+
+
+def revoke_tokens(user_id):
+    # Access tokens issued before now stop working, and outstanding refresh tokens
+    # are blacklisted so they cannot mint new access tokens with the old claims.
+    # The cutoff is stored on the user row and copied into the shared cache,
+    # which is what requests read. Returns the cutoff.
+    cutoff = timezone.now()
+    User.objects.filter(pk=user_id).update(tokens_valid_after=cutoff)
+    cache.set(_not_before_key(user_id), _timestamp(cutoff), _not_before_timeout())
+    outstanding = OutstandingToken.objects.filter(user_id=user_id, expires_at__gt=timezone.now(),
+                                                  blacklistedtoken__isnull=True)
+    outstanding = list(outstanding.only('id', 'jti'))
+    BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in outstanding],
+                                         ignore_conflicts=True)
+    # bulk_create sends no post_save, so tell the refresh filter directly
+    note_blacklisted(token.jti for token in outstanding)
+    return cutoff
+
+
+def remember_not_before(user):
+    # Called at login, where the row is already loaded, so the next request hits the cache
+    cache.add(_not_before_key(user.pk), _timestamp(user.tokens_valid_after), _not_before_timeout())
+
+
+def is_revoked(user_id, issued_at):
+    # iat has one second resolution, so tokens from the revocation second count as revoked
+    key = _not_before_key(user_id)
+    not_before = cache.get(key)
+    if not_before is None:
+        # Cold or evicted cache: the user row has the cutoff. add() never
+        # overwrites a cutoff that revoke_tokens stored in the meantime.
+        stored = User.objects.filter(pk=user_id).values_list('tokens_valid_after', flat=True).first()
+        not_before = _timestamp(stored)
+        cache.add(key, not_before, _not_before_timeout())
+    return bool(not_before) and (issued_at or 0) <= not_before
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None and is_revoked(user_id, validated_token.get('iat')):
+            raise AuthenticationFailed("Token has been revoked.", code='token_revoked')
+        if any(field not in validated_token for field in CLAIM_FIELDS):
+            # Issued before the claims were added: fall back to the database
+            return super().get_user(validated_token)
+        if not validated_token['is_active']:
+            raise AuthenticationFailed("User is inactive", code='user_inactive')
+
+        # A User built from the claims; any other field is loaded on first access.
+        # from_db expects the values in model field order.
+        claims = {'id': user_id, **{field: validated_token[field] for field in CLAIM_FIELDS}}
+        fields = [f.attname for f in User._meta.concrete_fields if f.attname in claims]
+        return User.from_db('default', fields, [claims[name] for name in fields])
+
+
+# --- REFRESH TOKEN BLACKLIST FILTER ---
+# Every refresh used to probe the blacklist table. Each process now keeps a
+# Bloom filter of the blacklisted, unexpired jtis, rebuilt from the table every
+# TOKEN_BLACKLIST_FILTER_TTL seconds. A "definitely not in the set" answer skips
+# the table. Between rebuilds, new blacklistings reach other processes through
+# a short numbered list in the shared cache: each refresh reads the latest
+# number and adds only the jtis it has not seen. A gap in the list (evicted or
+# too far behind) falls back to a full rebuild, so no process can miss a token.
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(int(capacity), 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hashing: k positions from two 64 bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big') | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def _filter_ttl():
+    return getattr(settings, 'TOKEN_BLACKLIST_FILTER_TTL', 300)
+
+
+BLACKLIST_SEQUENCE_KEY = 'auth:blacklist:sequence'
+# Entries a process catches up on before it rebuilds from the table instead
+MAX_RECENT_BLACKLISTED = 1000
+
+
+def _recent_key(number):
+    return f"auth:blacklist:recent:{number}"
+
+
+def blacklist_sequence():
+    # Number of the last jti published to the recent list; seeded once
+    number = cache.get(BLACKLIST_SEQUENCE_KEY)
+    if number is None:
+        cache.add(BLACKLIST_SEQUENCE_KEY, 0, None)
+        number = cache.get(BLACKLIST_SEQUENCE_KEY, 0)
+    return number
+
+
+def _publish_blacklisted(jtis):
+    try:
+        last = cache.incr(BLACKLIST_SEQUENCE_KEY, len(jtis))
+    except ValueError:
+        # Evicted: start over; processes ahead of the new numbers rebuild
+        cache.add(BLACKLIST_SEQUENCE_KEY, 0, None)
+        last = cache.incr(BLACKLIST_SEQUENCE_KEY, len(jtis))
+    first = last - len(jtis) + 1
+    cache.set_many({_recent_key(first + i): jti for i, jti in enumerate(jtis)}, _filter_ttl())
+
+
+_blacklist_filter = {'filter': None, 'expires': 0.0, 'sequence': None}
+_blacklist_filter_lock = threading.Lock()
+
+
+def build_blacklist_filter():
+    jtis = list(
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list('token__jti', flat=True).iterator(chunk_size=5000)
+    )
+    bloom = BloomFilter(max(len(jtis) * 2, 1024))
+    for jti in jtis:
+        bloom.add(jti)
+    return bloom
+
+
+def _catch_up(sequence):
+    # Adds the jtis published since this filter was built; False when some are gone
+    seen = _blacklist_filter['sequence']
+    if seen is None or sequence < seen or sequence - seen > MAX_RECENT_BLACKLISTED:
+        return False
+    if sequence > seen:
+        keys = [_recent_key(number) for number in range(seen + 1, sequence + 1)]
+        recent = cache.get_many(keys)
+        if len(recent) != len(keys):
+            return False
+        for jti in recent.values():
+            _blacklist_filter['filter'].add(jti)
+        _blacklist_filter['sequence'] = sequence
+    return True
+
+
+def blacklist_filter():
+    # This process's filter, rebuilt once it is older than the TTL and topped up
+    # from the recent list in between. The sequence is read before the table,
+    # and jtis are published only after their rows commit, so a rebuild always
+    # holds everything up to the number it records.
+    sequence = blacklist_sequence()
+    if _blacklist_filter['filter'] is None or time.monotonic() >= _blacklist_filter['expires'] \
+            or _blacklist_filter['sequence'] != sequence:
+        with _blacklist_filter_lock:
+            fresh = _blacklist_filter['filter'] is not None and time.monotonic() < _blacklist_filter['expires']
+            if not (fresh and _catch_up(sequence)):
+                _blacklist_filter['filter'] = build_blacklist_filter()
+                _blacklist_filter['expires'] = time.monotonic() + _filter_ttl()
+                _blacklist_filter['sequence'] = sequence
+    return _blacklist_filter['filter']
+
+
+def reset_blacklist_filter():
+    _blacklist_filter['expires'] = 0.0
+
+
+def note_blacklisted(jtis):
+    jtis = list(jtis)
+    if not jtis:
+        return
+    # This process sees them at once; the others once the rows have committed
+    bloom = _blacklist_filter['filter']
+    if bloom is not None:
+        for jti in jtis:
+            bloom.add(jti)
+    transaction.on_commit(lambda: _publish_blacklisted(jtis))
+
+
+def may_be_blacklisted(jti):
+    return jti in blacklist_filter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    def check_blacklist(self):
+        # Only tokens the filter cannot rule out go to the database
+        if may_be_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
+
+
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = FilteredRefreshToken
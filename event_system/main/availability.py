@@ -0,0 +1,146 @@
+import re
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from .models import Booking, ResourceReservation
+
+# --- RESOURCE AVAILABILITY ---
+# An approved, live wedding occupies its decoration set and its performer on
+# each day of the event. ResourceReservation holds one row per (resource, day)
+# and has a unique constraint on the pair. Conflict checks and calendar reads
+# are index lookups, and two approvals can never hold the same slot.
+
+RESOURCE_KINDS = ('decoration', 'performer')
+# Upper bound on wedding_details.schedule.numberOfDays
+MAX_BOOKING_DAYS = 7
+MAX_CALENDAR_DAYS = 366
+
+
+class ResourceConflict(Exception):
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        names = ', '.join(sorted({label for _, label, _ in conflicts}))
+        days = ', '.join(sorted({day.isoformat() for _, _, day in conflicts}))
+        super().__init__(f"Already booked on {days}: {names}")
+
+
+def performer_key(name):
+    return 'performer:' + re.sub(r'\s+', ' ', (name or '').strip().lower())
+
+
+def booking_resources(booking):
+    # {resource key: display label} for what the wedding takes up
+    resources = {}
+    # Bookings from before decoration_ids only have selected_decoration
+    ids = booking.decoration_ids or ([booking.selected_decoration_id] if booking.selected_decoration_id else [])
+    names = (booking.decoration_name or '').split(', ') if len(ids) > 1 else [booking.decoration_name]
+    for position, pk in enumerate(ids):
+        resources[f'decoration:{pk}'] = names[position] if len(names) == len(ids) and names[position] else f'Decoration #{pk}'
+    if (booking.performer_name or '').strip():
+        resources[performer_key(booking.performer_name)] = booking.performer_name.strip()
+    return resources
+
+
+def booking_days(booking):
+    schedule = (booking.wedding_details or {}).get('schedule') or {}
+    try:
+        length = int(schedule.get('numberOfDays') or 1)
+    except (TypeError, ValueError):
+        length = 1
+    length = min(max(length, 1), MAX_BOOKING_DAYS)
+    return [booking.event_date + timedelta(days=offset) for offset in range(length)]
+
+
+def holds_resources(booking):
+    return booking.status == 'Approved' and not booking.is_deleted and booking.event_date is not None
+
+
+def wanted_slots(booking):
+    if not holds_resources(booking):
+        return {}
+    return {(resource, day): label
+            for resource, label in booking_resources(booking).items()
+            for day in booking_days(booking)}
+
+
+def find_conflicts(booking):
+    # Slots the booking would need that another booking already holds
+    slots = wanted_slots(booking)
+    if not slots:
+        return []
+    resources = {resource for resource, _ in slots}
+    days = {day for _, day in slots}
+    taken = (
+        ResourceReservation.objects.filter(resource__in=resources, day__in=days)
+        .exclude(booking_id=booking.pk)
+        .values_list('resource', 'day')
+    )
+    return [(resource, slots[(resource, day)], day) for resource, day in taken if (resource, day) in slots]
+
+
+def sync_reservations(booking):
+    # Brings the booking's rows in line with its current state. Raises
+    # ResourceConflict, leaving the rows as they were, if another booking
+    # holds a slot it needs.
+    slots = wanted_slots(booking)
+    held = set(ResourceReservation.objects.filter(booking_id=booking.pk).values_list('resource', 'day'))
+    stale = held - set(slots)
+    missing = [slot for slot in slots if slot not in held]
+
+    conflicts = find_conflicts(booking) if missing else []
+    if conflicts:
+        raise ResourceConflict(conflicts)
+    try:
+        with transaction.atomic():
+            if stale:
+                ResourceReservation.objects.filter(
+                    reduce(or_, (Q(resource=resource, day=day) for resource, day in stale)), booking_id=booking.pk,
+                ).delete()
+            ResourceReservation.objects.bulk_create([
+                ResourceReservation(resource=resource, day=day, booking_id=booking.pk, label=slots[(resource, day)])
+                for resource, day in missing
+            ])
+    except IntegrityError:
+        # Lost a race with a concurrent approval
+        raise ResourceConflict(find_conflicts(booking))
+
+
+def rebuild_reservations(batch_size=500):
+    # Recreates every row from the approved bookings, oldest first. Slots that
+    # were already double-booked go to the earlier booking and are reported.
+    claimed, clashes = set(), []
+    with transaction.atomic():
+        ResourceReservation.objects.all().delete()
+        bookings = Booking.objects.filter(status='Approved', is_deleted=False).order_by('pk')
+        for booking in bookings.iterator(chunk_size=batch_size):
+            rows = []
+            for (resource, day), label in wanted_slots(booking).items():
+                if (resource, day) in claimed:
+                    clashes.append((booking.pk, resource, day))
+                    continue
+                claimed.add((resource, day))
+                rows.append(ResourceReservation(resource=resource, day=day, booking_id=booking.pk, label=label))
+            ResourceReservation.objects.bulk_create(rows)
+    for booking_id, resource, day in clashes:
+        print(f"Availability: booking #{booking_id} double-books {resource} on {day}")
+    return len(claimed), clashes
+
+
+def calendar(start, end, resources=None):
+    # [{date, resources: [{resource, label}, ...]}, ...] for the booked days in [start, end].
+    # resources may hold kinds ('performer') or full keys ('decoration:3').
+    rows = ResourceReservation.objects.filter(day__gte=start, day__lte=end)
+    if resources:
+        keys = [performer_key(r.split(':', 1)[1]) if r.startswith('performer:') else r
+                for r in resources if r not in RESOURCE_KINDS]
+        wanted = [Q(resource__startswith=f'{kind}:') for kind in resources if kind in RESOURCE_KINDS]
+        rows = rows.filter(reduce(or_, wanted + [Q(resource__in=keys)]))
+
+    days = {}
+    for resource, label, day in rows.order_by('day', 'resource').values_list('resource', 'label', 'day'):
+        days.setdefault(day, []).append({'resource': resource, 'label': label})
+    return [{'date': day.isoformat(), 'resources': booked} for day, booked in days.items()]
@@ -0,0 +1,135 @@
+from django.db import transaction
+
+from .caching import invalidate_catalog
+from .models import Fixture, SportsRegistration, Tournament
+
+# --- SINGLE-ELIMINATION BRACKETS ---
+# A whole bracket is written in one transaction: every round's fixtures are
+# bulk-created from the final backwards, so each match can point at the
+# fixture and slot its winner moves into. Byes go to the top seeds and are
+# resolved up front.
+
+
+class BracketError(Exception):
+    pass
+
+
+def seed_order(size):
+    # Bracket order of seeds 1..size so that seed 1 and 2 can only meet in the final:
+    # [1, 8, 4, 5, 2, 7, 3, 6] for 8
+    order = [1]
+    while len(order) < size:
+        mirror = len(order) * 2 + 1
+        order = [seed for top in order for seed in (top, mirror - top)]
+    return order
+
+
+def bracket_entrants(tournament):
+    # Confirmed registrations in seeding order (earliest registration first)
+    return list(
+        SportsRegistration.objects.alive()
+        .filter(tournament=tournament, status='Confirmed')
+        .order_by('registration_date', 'pk')
+    )
+
+
+def _create_round(fixtures):
+    Fixture.objects.bulk_create(fixtures)
+    if any(fixture.pk is None for fixture in fixtures):
+        # Backends that cannot return ids from a bulk insert (MySQL)
+        first = fixtures[0]
+        pks = dict(Fixture.objects.filter(tournament_id=first.tournament_id, round_number=first.round_number)
+                   .values_list('bracket_position', 'pk'))
+        for fixture in fixtures:
+            fixture.pk = pks[fixture.bracket_position]
+    return fixtures
+
+
+def generate_bracket(tournament, match_date=None):
+    with transaction.atomic():
+        # Two admins generating at once queue on the tournament row, so the
+        # second one sees the first one's fixtures
+        Tournament._base_manager.select_for_update().filter(pk=tournament.pk).first()
+        if Fixture.objects.filter(tournament=tournament).exists():
+            raise BracketError("This tournament already has fixtures.")
+
+        entrants = bracket_entrants(tournament)
+        if len(entrants) < 2:
+            raise BracketError("At least two confirmed registrations are needed for a bracket.")
+
+        size = 1
+        while size < len(entrants):
+            size *= 2
+        rounds = size.bit_length() - 1
+        slots = [entrants[seed - 1] if seed <= len(entrants) else None for seed in seed_order(size)]
+
+        created = []
+        later_round = []
+        for round_number in range(rounds, 0, -1):
+            fixtures = [
+                Fixture(tournament=tournament, round_number=str(round_number), bracket_position=position,
+                        match_date=match_date if round_number == 1 else None,
+                        next_fixture=later_round[position // 2] if later_round else None,
+                        next_slot=position % 2 + 1 if later_round else None)
+                for position in range(2 ** (rounds - round_number))
+            ]
+            if round_number == 1:
+                for fixture in fixtures:
+                    fixture.player1 = slots[fixture.bracket_position * 2]
+                    fixture.player2 = slots[fixture.bracket_position * 2 + 1]
+                    if fixture.player2 is None:
+                        # A bye: the seed goes straight into its round two slot
+                        fixture.winner, fixture.status = fixture.player1, 'Bye'
+                        setattr(fixture.next_fixture, f'player{fixture.next_slot}', fixture.player1)
+            created[:0] = _create_round(fixtures)
+            later_round = fixtures
+
+        # Round two was saved before the byes were known
+        advanced = [fixture for fixture in created if fixture.round_number == '2' and (fixture.player1 or fixture.player2)]
+        Fixture.objects.bulk_update(advanced, ['player1', 'player2'])
+    return created
+
+
+# --- TOURNAMENT PROGRESSION ---
+# Results are applied from Fixture's post_save, and only when the winner
+# actually changes. The loser is eliminated, the winner moves into the
+# pre-linked next fixture, and Tournament.remaining_participants (kept up to
+# date by SportsRegistration.save) says when it is over. Every result costs a
+# fixed number of queries however big the bracket is.
+
+def record_result(fixture):
+    # Returns the champion when this result finishes the tournament
+    winner_id = fixture.winner_id
+    if winner_id is None or winner_id == fixture.previous_winner_id:
+        return None
+
+    with transaction.atomic():
+        winner = fixture.winner
+        if winner.status == 'Eliminated':
+            # A corrected result puts the new winner back in
+            winner.status = 'Confirmed'
+            winner.save()
+        loser_id = fixture.player2_id if fixture.player1_id == winner_id else fixture.player1_id
+        if loser_id:
+            loser = SportsRegistration.objects.with_deleted().get(pk=loser_id)
+            if loser.status != 'Eliminated':
+                print(f"Eliminating loser: {loser}")
+                loser.status = 'Eliminated'
+                loser.save()
+
+        if fixture.next_fixture_id:
+            Fixture.objects.filter(pk=fixture.next_fixture_id).update(**{f'player{fixture.next_slot}_id': winner_id})
+
+        remaining = Tournament.objects.with_deleted().filter(pk=fixture.tournament_id).values_list(
+            'remaining_participants', flat=True
+        ).first()
+        is_final = fixture.bracket_position is not None and fixture.next_fixture_id is None
+        if remaining != 1 and not is_final:
+            return None
+
+        print(f"Tournament #{fixture.tournament_id} decided, champion: {winner}")
+        winner.status = 'Winner'
+        winner.save()
+        Tournament.objects.with_deleted().filter(pk=fixture.tournament_id).update(status='Completed')
+        invalidate_catalog('tournament')
+    return winner
@@ -0,0 +1,90 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from rest_framework.renderers import JSONRenderer
+
+from .auth import is_admin
+
+# --- PUBLIC CATALOG RESPONSE CACHE ---
+# Public catalog GETs are rendered once per catalog version and then served from
+# the cache with a strong ETag. Any write to a catalog bumps its version, which
+# orphans every cached page of it at once. Versions live in the shared default
+# cache; the rendered pages live in the 'catalog' cache.
+
+
+def _version_key(catalog):
+    return f"catalog:version:{catalog}"
+
+
+def catalog_version(catalog):
+    key = _version_key(catalog)
+    cache.add(key, time.time_ns(), None)
+    return cache.get(key)
+
+
+def _bump(catalogs):
+    for catalog in catalogs:
+        cache.set(_version_key(catalog), time.time_ns(), None)
+
+
+def invalidate_catalog(*catalogs):
+    # Bump now, and again once the write commits, so a reader that re-cached the
+    # old rows in between cannot keep serving them.
+    _bump(catalogs)
+    transaction.on_commit(lambda: _bump(catalogs))
+
+
+def _etag_matches(request, etag):
+    header = request.META.get('HTTP_IF_NONE_MATCH', '')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    # Weak validators (W/"...") match on the opaque tag for GET, per RFC 9110
+    tags = [tag.strip() for tag in header.split(',')]
+    return etag in [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+
+
+class CatalogCacheMixin:
+    # Set `catalog` to the name passed to invalidate_catalog() when the data changes
+    catalog = None
+
+    def is_cacheable(self, request):
+        if getattr(request.accepted_renderer, 'format', None) != 'json':
+            return False
+        # Admins see deleted/unpublished rows, so they always get a fresh response
+        return not is_admin(request.user)
+
+    def cache_key(self, request):
+        # Host is part of the key: bodies carry absolute media URLs built from it
+        query = request.META.get('QUERY_STRING', '')
+        return f"catalog:{self.catalog}:{catalog_version(self.catalog)}:{request.get_host()}{request.path}?{query}"
+
+    def get(self, request, *args, **kwargs):
+        if not self.catalog or not self.is_cacheable(request):
+            return super().get(request, *args, **kwargs)
+
+        key = self.cache_key(request)
+        pages = caches['catalog']
+        entry = pages.get(key)
+        if entry is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            content = JSONRenderer().render(response.data)
+            entry = ('"%s"' % hashlib.sha256(content).hexdigest(), content)
+            pages.set(key, entry, getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300))
+
+        etag, content = entry
+        if _etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        response['Vary'] = 'Authorization'
+        return response
@@ -0,0 +1,31 @@
+import re
+from datetime import datetime
+
+# --- EVENT DATE PARSING ---
+# Concert and festival dates are typed into the admin forms as display strings
+# ("2026-12-20", "Dec 20, 2026", "Saturday, 20th December 2026"). The string
+# stays what the frontend shows; parse_event_date fills the typed, indexed
+# column next to it. Anything it cannot read becomes None.
+
+DATE_FORMATS = (
+    '%Y-%m-%d', '%d-%m-%Y', '%d/%m/%Y', '%Y/%m/%d', '%d.%m.%Y',
+    '%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y',
+)
+_WEEKDAY = re.compile(r'^(mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+', re.IGNORECASE)
+_ORDINAL = re.compile(r'(\d)(st|nd|rd|th)\b', re.IGNORECASE)
+
+
+def parse_event_date(value):
+    if not value:
+        return None
+    text = str(value).strip()
+    if re.match(r'^\d{4}-\d{2}-\d{2}T', text):
+        text = text[:10]
+    text = _ORDINAL.sub(r'\1', _WEEKDAY.sub('', text)).replace(',', ' ')
+    text = ' '.join(text.split())
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,120 @@
+import csv
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import ADMIN_ITEM_TYPES
+
+# --- STREAMING ADMIN EXPORTS ---
+# Rows are read with values_list in primary key order, one keyset page at a
+# time, and written out as they arrive. Memory stays flat however large the
+# table is, and the first bytes go out before the last page is read.
+
+# type -> field the ?from= / ?to= range applies to
+EXPORT_DATE_FIELDS = {
+    'wedding': 'booking_date',
+    'concert': 'booking_date',
+    'festival': 'booking_date',
+    'tournament': 'created_at',
+    'sports-registration': 'registration_date',
+    'job': 'applied_at',
+    'blog': 'created_at',
+    'concert-master': 'created_at',
+    'festival-master': 'created_at',
+}
+EXPORT_FORMATS = ('csv', 'ndjson')
+PAGE_SIZE = 2000
+
+
+class ExportError(Exception):
+    pass
+
+
+class _Echo:
+    # csv.writer target that hands each formatted line straight back
+    def write(self, value):
+        return value
+
+
+def export_columns(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def _day_start(value):
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def export_queryset(item_type, start=None, end=None, statuses=None, include_deleted=False):
+    model = ADMIN_ITEM_TYPES.get(item_type)
+    if model is None:
+        raise ExportError(f"Unknown export type: {item_type}")
+
+    queryset = model.objects.with_deleted() if include_deleted else model.objects.all()
+    date_field = EXPORT_DATE_FIELDS[item_type]
+    # Whole days as half-open datetime ranges, so the date column's index is usable
+    if start:
+        queryset = queryset.filter(**{f'{date_field}__gte': _day_start(start)})
+    if end:
+        queryset = queryset.filter(**{f'{date_field}__lt': _day_start(end + timedelta(days=1))})
+    if statuses:
+        if 'status' not in export_columns(model):
+            raise ExportError(f"{item_type} has no status to filter on")
+        queryset = queryset.filter(status__in=statuses)
+    return queryset
+
+
+def iter_rows(queryset, columns, page_size=PAGE_SIZE):
+    # Keyset pages rather than one big cursor: MySQL drivers buffer a whole
+    # result set client-side, so each page is a separate bounded query
+    pk_index = columns.index('id')
+    last_pk = None
+    while True:
+        page = queryset.order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        count = 0
+        for row in page.values_list(*columns)[:page_size].iterator(chunk_size=page_size):
+            count += 1
+            last_pk = row[pk_index]
+            yield row
+        if count < page_size:
+            return
+
+
+def _cell(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def stream_csv(rows, columns):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_cell(value) for value in row])
+
+
+def stream_ndjson(rows, columns):
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), default=_cell) + '\n'
+
+
+def export_response(queryset, item_type, output='csv'):
+    if output not in EXPORT_FORMATS:
+        raise ExportError(f"Unknown output format: {output}")
+    columns = export_columns(queryset.model)
+    rows = iter_rows(queryset, columns)
+    if output == 'csv':
+        response = StreamingHttpResponse(stream_csv(rows, columns), content_type='text/csv')
+    else:
+        response = StreamingHttpResponse(stream_ndjson(rows, columns), content_type='application/x-ndjson')
+    stamp = timezone.localdate().isoformat()
+    response['Content-Disposition'] = f'attachment; filename="{item_type}-{stamp}.{output}"'
+    return response
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+
+from .caching import invalidate_catalog
+
+# --- RESPONSIVE IMAGE VARIANTS ---
+# Resizes every source image to a few widths as WebP plus a JPEG fallback,
+# in parallel across all cores. A manifest maps each source to its variants;
+# serializers read it to return srcset strings next to the original URL.
+# Cached catalog responses embed those srcsets, so a manifest change drops
+# them too.
+
+SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp', '.gif'}
+DEFAULT_WIDTHS = (320, 640, 1024, 1600)
+SRCSET_CATALOGS = ('concert', 'festival', 'tournament')
+FORMATS = (('webp', 'WEBP', {'quality': 80, 'method': 6}), ('jpeg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}))
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_sources(source_dir):
+    source_dir = Path(source_dir)
+    return sorted(p for p in source_dir.rglob('*') if p.is_file() and p.suffix.lower() in SOURCE_EXTENSIONS)
+
+
+def render_variants(source, digest, output_dir, widths):
+    # Runs in a worker process. Returns (width, height, [variant, ...]).
+    from PIL import Image
+
+    output_dir = Path(output_dir)
+    variants = []
+    with Image.open(source) as img:
+        img.load()
+        width, height = img.size
+        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+
+        # Never upscale; always keep at least one variant at the original width
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        for target in targets:
+            resized = img if target == width else img.resize(
+                (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS
+            )
+            for ext, pil_format, options in FORMATS:
+                frame = resized
+                if pil_format == 'JPEG':
+                    frame = frame.convert('RGB') if not has_alpha else _flatten(frame)
+                elif frame.mode not in ('RGB', 'RGBA'):
+                    frame = frame.convert('RGBA' if has_alpha else 'RGB')
+                name = f"{digest[:2]}/{digest}-{target}w.{ext}"
+                target_path = output_dir / name
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                frame.save(target_path, pil_format, **options)
+                variants.append({'path': name, 'width': target, 'format': ext})
+    return width, height, variants
+
+
+def _flatten(frame):
+    # JPEG has no alpha channel: composite transparent images onto white
+    from PIL import Image
+
+    rgba = frame.convert('RGBA')
+    background = Image.new('RGB', rgba.size, (255, 255, 255))
+    background.paste(rgba, mask=rgba.split()[-1])
+    return background
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_variants(source_dir, output_dir, manifest_path=None, widths=DEFAULT_WIDTHS, workers=None, force=False):
+    # Returns (built, skipped, failed) counts and rewrites the manifest
+    source_dir, output_dir = Path(source_dir), Path(output_dir)
+    manifest_path = Path(manifest_path or output_dir / 'manifest.json')
+    manifest = load_manifest(manifest_path)
+    images = manifest.setdefault('images', {})
+    before = json.dumps(images, sort_keys=True)
+
+    todo, failed = [], []
+    for source in find_sources(source_dir):
+        key = source.relative_to(source_dir).as_posix()
+        digest = file_hash(source)
+        entry = images.get(key)
+        unchanged = entry and entry.get('hash') == digest and entry.get('widths') == list(widths) and all(
+            (output_dir / v['path']).exists() for v in entry.get('variants', [])
+        )
+        if unchanged and not force:
+            continue
+        todo.append((key, source, digest))
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {
+                key: (digest, pool.submit(render_variants, str(source), digest, str(output_dir), tuple(widths)))
+                for key, source, digest in todo
+            }
+            for key, (digest, future) in futures.items():
+                try:
+                    width, height, variants = future.result()
+                except Exception as e:
+                    print(f"Could not process {key}: {e}")
+                    failed.append(key)
+                    continue
+                images[key] = {'hash': digest, 'width': width, 'height': height,
+                               'widths': list(widths), 'variants': variants}
+
+    # Forget sources that no longer exist
+    live = {source.relative_to(source_dir).as_posix() for source in find_sources(source_dir)}
+    for key in set(images) - live:
+        del images[key]
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = manifest_path.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, manifest_path)
+    if json.dumps(images, sort_keys=True) != before:
+        invalidate_catalog(*SRCSET_CATALOGS)
+    return len(todo) - len(failed), len(live) - len(todo), len(failed)
+
+
+# --- srcset lookup for the API ---
+
+_manifest_cache = {'mtime': None, 'data': {}}
+
+
+def variants_manifest():
+    path = Path(getattr(settings, 'IMAGE_VARIANTS_MANIFEST', ''))
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+    if _manifest_cache['mtime'] != mtime:
+        _manifest_cache['data'] = load_manifest(path).get('images', {})
+        _manifest_cache['mtime'] = mtime
+    return _manifest_cache['data']
+
+
+def srcset_for(url, build_url=None):
+    # Maps a stored media URL (/media/cas/ab/<hash>.png) to {'webp': srcset, 'jpeg': srcset}
+    prefix = f"{settings.MEDIA_URL.rstrip('/')}/cas/"
+    if not isinstance(url, str) or not url.startswith(prefix):
+        return None
+    entry = variants_manifest().get(url[len(prefix):])
+    if not entry:
+        return None
+
+    base = getattr(settings, 'IMAGE_VARIANTS_URL', settings.MEDIA_URL + 'variants/')
+    srcsets = {}
+    for variant in entry['variants']:
+        variant_url = base + variant['path']
+        if build_url:
+            variant_url = build_url(variant_url)
+        srcsets.setdefault(variant['format'], []).append(f"{variant_url} {variant['width']}w")
+    return {fmt: ', '.join(items) for fmt, items in srcsets.items()}
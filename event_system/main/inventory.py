@@ -0,0 +1,130 @@
+from django.db import transaction
+from django.db.models import F, Q
+
+from .caching import invalidate_catalog
+from .models import Concert, ConcertBooking, Festival, TicketInventory
+
+# --- TICKET INVENTORY ---
+# Concert.tickets and Festival.passes stay the admin-editable source of tiers and
+# capacities ('total'); TicketInventory keeps the sold counters. Seats are taken
+# with a single conditional UPDATE, so concurrent checkouts can never oversell.
+
+
+class InventoryError(Exception):
+    pass
+
+
+class SoldOut(InventoryError):
+    pass
+
+
+class UnknownTier(InventoryError):
+    pass
+
+
+def _event_field(event):
+    if isinstance(event, Concert):
+        return 'concert'
+    if isinstance(event, Festival):
+        return 'festival'
+    raise TypeError(f"No ticket inventory for {type(event).__name__}")
+
+
+def _event_tiers(event):
+    return (event.tickets if isinstance(event, Concert) else event.passes) or []
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def sync_inventory(event):
+    # Mirrors the tiers in the event's JSON into ledger rows. Sold counts are only
+    # seeded from the JSON when a tier is first seen; afterwards the ledger owns them.
+    field = _event_field(event)
+    existing = {row.tier: row for row in TicketInventory.objects.filter(**{field: event})}
+    seen = set()
+
+    for tier in _event_tiers(event):
+        if not isinstance(tier, dict):
+            continue
+        name = str(tier.get('type') or '').strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        capacity = _as_int(tier.get('total'))
+
+        row = existing.get(name)
+        if row is None:
+            TicketInventory.objects.create(**{field: event}, tier=name, capacity=capacity,
+                                           sold=_as_int(tier.get('sold')) or 0)
+        elif row.capacity != capacity:
+            TicketInventory.objects.filter(pk=row.pk).update(capacity=capacity)
+
+    # Tiers removed from the JSON are dropped unless seats were already sold
+    stale = [row.pk for name, row in existing.items() if name not in seen and row.sold == 0]
+    if stale:
+        TicketInventory.objects.filter(pk__in=stale).delete()
+
+
+def reserve(event, tier, quantity):
+    field = _event_field(event)
+    rows = TicketInventory.objects.filter(**{field: event, 'tier': tier})
+    taken = rows.filter(
+        Q(capacity__isnull=True) | Q(sold__lte=F('capacity') - quantity)
+    ).update(sold=F('sold') + quantity)
+    if taken:
+        # Public listings show live sold counts
+        invalidate_catalog(field)
+        return
+
+    row = rows.first()
+    if row is None:
+        raise UnknownTier(f"'{tier}' is not available for {event}.")
+    raise SoldOut(f"Only {row.remaining} '{tier}' tickets left." if row.remaining else f"'{tier}' is sold out.")
+
+
+def release(event, tier, quantity):
+    field = _event_field(event)
+    released = TicketInventory.objects.filter(**{field: event, 'tier': tier}, sold__gte=quantity).update(
+        sold=F('sold') - quantity
+    )
+    if released:
+        invalidate_catalog(field)
+
+
+def sold_by_tier(event):
+    # Uses the prefetched ledger when the queryset asked for it
+    return {row.tier: row.sold for row in event.inventory.all()}
+
+
+def _booking_seats(booking):
+    # (event, tier) a concert or festival booking takes its seats from
+    if isinstance(booking, ConcertBooking):
+        return booking.concert, booking.ticket_type
+    return booking.festival, booking.pass_type
+
+
+def release_booking(booking, **changes):
+    # Applies `changes` (a cancel or a soft delete) and hands the seats back in
+    # one transaction. Only a booking that still holds seats gives them back,
+    # so repeated or racing calls release once.
+    with transaction.atomic():
+        moved = (
+            type(booking)._base_manager.filter(pk=booking.pk, is_deleted=False)
+            .exclude(status='Cancelled').update(**changes)
+        )
+        event, tier = _booking_seats(booking)
+        if moved and event is not None:
+            release(event, tier, booking.quantity)
+    return bool(moved)
+
+
+def reserve_booking(booking):
+    # Takes the seats back for a booking restored from the recycle bin
+    event, tier = _booking_seats(booking)
+    if event is not None and booking.status != 'Cancelled':
+        reserve(event, tier, booking.quantity)
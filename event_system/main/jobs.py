@@ -0,0 +1,175 @@
+import os
+import socket
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from .caching import invalidate_catalog
+from .models import Booking, Tournament, Concert, Festival, JobLock
+from .reports import move_rollup_status
+
+# --- PERIODIC JOBS ---
+# Time based state transitions live here instead of inside request handlers,
+# so list endpoints stay pure reads. Run them with `manage.py run_scheduler`.
+
+SCHEDULER_LOCK = 'scheduler'
+# Seconds the leader lease stays valid without a heartbeat
+SCHEDULER_LOCK_TTL = 120
+
+
+def get_batch_size():
+    return getattr(settings, 'SCHEDULER_BATCH_SIZE', 500)
+
+
+def _update_in_chunks(queryset, batch_size=None, before_update=None, **changes):
+    # Updates matching rows a chunk of primary keys at a time so that a large
+    # backlog never holds a lock on the whole table. The filter is re-applied on
+    # every chunk, which keeps it safe against concurrent edits.
+    batch_size = batch_size or get_batch_size()
+    total = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        with transaction.atomic():
+            chunk = queryset.filter(pk__in=ids)
+            if before_update:
+                before_update(chunk)
+            total += chunk.update(**changes)
+        if len(ids) < batch_size:
+            break
+    return total
+
+
+def reject_stale_bookings(batch_size=None):
+    # Auto-Reject Pending bookings older than 2 days
+    cutoff = timezone.now() - timedelta(days=2)
+    stale = Booking.objects.filter(status='Pending', booking_date__lt=cutoff)
+    # .update() skips save(), so the revenue rollup is moved explicitly
+    return _update_in_chunks(stale, batch_size, status='Rejected',
+                             before_update=lambda chunk: move_rollup_status(chunk, 'weddings', 'Rejected'))
+
+
+def close_tournament_registrations(batch_size=None):
+    today = timezone.localdate()
+    expired = Tournament.objects.alive().filter(
+        status='Registration Open',
+        registration_deadline__lt=today,
+    )
+    closed = _update_in_chunks(expired, batch_size, status='Registration Closed')
+    if closed:
+        invalidate_catalog('tournament')
+    return closed
+
+
+def close_concert_bookings(batch_size=None):
+    today = timezone.localdate()
+    expired = Concert.objects.filter(bookings_closed=False, booking_deadline__lt=today)
+    closed = _update_in_chunks(expired, batch_size, bookings_closed=True)
+    if closed:
+        invalidate_catalog('concert')
+    return closed
+
+
+def close_festival_bookings(batch_size=None):
+    today = timezone.localdate()
+    expired = Festival.objects.filter(bookings_closed=False, booking_deadline__lt=today)
+    closed = _update_in_chunks(expired, batch_size, bookings_closed=True)
+    if closed:
+        invalidate_catalog('festival')
+    return closed
+
+
+def prune_expired_tokens(batch_size=None):
+    # Expired refresh tokens can never be used again, so their outstanding and
+    # blacklist rows only slow down the lookups. Deleted a chunk at a time.
+    batch_size = batch_size or get_batch_size()
+    expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now())
+    total = 0
+    while True:
+        ids = list(expired.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            total += OutstandingToken.objects.filter(pk__in=ids).delete()[0]
+        if len(ids) < batch_size:
+            break
+    return total
+
+
+# (name, interval in seconds, callable)
+JOBS = [
+    ('reject_stale_bookings', 300, reject_stale_bookings),
+    ('close_tournament_registrations', 3600, close_tournament_registrations),
+    ('close_concert_bookings', 3600, close_concert_bookings),
+    ('close_festival_bookings', 3600, close_festival_bookings),
+    ('prune_expired_tokens', 3600, prune_expired_tokens),
+]
+
+
+def default_owner():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def acquire_lock(name, owner, ttl_seconds):
+    # Leader election through a lock row: the lease is taken with a conditional
+    # UPDATE, so only one process can win it until it expires or is renewed.
+    now = timezone.now()
+    JobLock.objects.get_or_create(name=name)
+    taken = JobLock.objects.filter(name=name).filter(
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now) | Q(owner=owner)
+    ).update(owner=owner, locked_until=now + timedelta(seconds=ttl_seconds), last_heartbeat=now)
+    return taken == 1
+
+
+def release_lock(name, owner):
+    JobLock.objects.filter(name=name, owner=owner).update(owner='', locked_until=None)
+
+
+class Scheduler:
+    def __init__(self, jobs=None, owner=None, lock_ttl=SCHEDULER_LOCK_TTL):
+        self.jobs = jobs if jobs is not None else JOBS
+        self.owner = owner or default_owner()
+        self.lock_ttl = lock_ttl
+        self.last_run = {}
+
+    def due_jobs(self, now):
+        for name, interval, func in self.jobs:
+            last = self.last_run.get(name)
+            if last is None or now - last >= interval:
+                yield name, func
+
+    def tick(self, force=False):
+        # Runs every due job once if this process holds the leader lock.
+        # Returns {job_name: rows_changed} for the jobs that ran.
+        if not acquire_lock(SCHEDULER_LOCK, self.owner, self.lock_ttl):
+            return {}
+
+        results = {}
+        now = time.monotonic()
+        jobs = [(name, func) for name, _, func in self.jobs] if force else list(self.due_jobs(now))
+        for name, func in jobs:
+            try:
+                results[name] = func()
+            except Exception as e:
+                print(f"Scheduled job {name} failed: {e}")
+                results[name] = None
+            self.last_run[name] = now
+        return results
+
+    def run_forever(self, poll_seconds=30):
+        try:
+            while True:
+                results = self.tick()
+                for name, count in results.items():
+                    if count:
+                        print(f"[scheduler] {name}: {count} row(s) updated")
+                time.sleep(poll_seconds)
+        finally:
+            release_lock(SCHEDULER_LOCK, self.owner)
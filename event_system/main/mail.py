@@ -0,0 +1,125 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+# --- TRANSACTIONAL EMAIL OUTBOX ---
+# Views and signals call queue_mail() instead of send_mail(). The row is written
+# in the caller's transaction, so a rolled back booking never sends mail, and the
+# SMTP round-trips happen in the `send_outbox` worker instead of the request.
+# The worker is a separate process and finds new rows by polling.
+
+
+def queue_mail(subject, message, from_email, recipient_list):
+    recipients = [r for r in recipient_list if r]
+    if not recipients:
+        return None
+    email = OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or '',
+        recipients=recipients,
+    )
+    return email
+
+
+def queue_mass_mail(datatuple):
+    # send_mass_mail() style: (subject, message, from_email, recipient_list) tuples,
+    # written with a single INSERT however many recipients there are.
+    rows = [
+        OutboundEmail(subject=subject, body=message, from_email=from_email or '', recipients=[r for r in recipients if r])
+        for subject, message, from_email, recipients in datatuple
+    ]
+    rows = [row for row in rows if row.recipients]
+    if not rows:
+        return []
+    return OutboundEmail.objects.bulk_create(rows)
+
+
+def _claim_batch(batch_size, lease_seconds):
+    # Marks a batch of due messages as 'Sending'. Rows stuck in 'Sending' past
+    # their lease (crashed worker) become due again.
+    now = timezone.now()
+    due = Q(status='Pending') | Q(status='Sending')
+    with transaction.atomic():
+        rows = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(due, next_attempt_at__lte=now)
+            .order_by('id')[:batch_size]
+        )
+        ids = [row.pk for row in rows]
+        OutboundEmail.objects.filter(pk__in=ids).update(
+            status='Sending', next_attempt_at=now + timedelta(seconds=lease_seconds)
+        )
+    return rows
+
+
+def retry_delay(attempts):
+    base = getattr(settings, 'EMAIL_OUTBOX_RETRY_BASE_SECONDS', 30)
+    return timedelta(seconds=base * (2 ** (attempts - 1)))
+
+
+def drain_outbox(batch_size=None, connection=None):
+    # Sends every due message over one SMTP connection per batch.
+    # Returns (sent, failed) counts.
+    batch_size = batch_size or getattr(settings, 'EMAIL_OUTBOX_BATCH_SIZE', 100)
+    max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+    sent = failed = 0
+
+    while True:
+        rows = _claim_batch(batch_size, lease_seconds=300)
+        if not rows:
+            break
+
+        # A connection passed in by the caller stays open for the caller to close
+        conn = connection or get_connection(fail_silently=False)
+        try:
+            conn.open()
+        except Exception as e:
+            # The whole batch waits for the next attempt if the server is unreachable
+            for row in rows:
+                failed += _record_failure(row, e, max_attempts)
+            break
+
+        try:
+            for row in rows:
+                message = EmailMessage(row.subject, row.body, row.from_email or None, row.recipients, connection=conn)
+                try:
+                    message.send()
+                except Exception as e:
+                    failed += _record_failure(row, e, max_attempts)
+                    continue
+                OutboundEmail.objects.filter(pk=row.pk).update(
+                    status='Sent', attempts=row.attempts + 1, sent_at=timezone.now(), last_error=''
+                )
+                sent += 1
+        finally:
+            if connection is None:
+                conn.close()
+
+        if len(rows) < batch_size:
+            break
+    return sent, failed
+
+
+def _record_failure(row, error, max_attempts):
+    attempts = row.attempts + 1
+    if attempts >= max_attempts:
+        changes = {'status': 'Failed'}
+    else:
+        changes = {'status': 'Pending', 'next_attempt_at': timezone.now() + retry_delay(attempts)}
+    OutboundEmail.objects.filter(pk=row.pk).update(attempts=attempts, last_error=str(error)[:1000], **changes)
+    print(f"Outbox email #{row.pk} failed (attempt {attempts}): {error}")
+    return 1
+
+
+def run_worker(poll_seconds=10):
+    while True:
+        drain_outbox()
+        time.sleep(poll_seconds)
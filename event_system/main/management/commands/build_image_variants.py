@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.images import DEFAULT_WIDTHS, build_variants
+from main.media import CAS_DIR
+
+
+class Command(BaseCommand):
+    help = "Builds WebP + JPEG responsive variants for every image in a directory and writes a srcset manifest."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', help="Image directory (default: the media store).")
+        parser.add_argument('--output', help="Variant directory (default: MEDIA_ROOT/variants).")
+        parser.add_argument('--manifest', help="Manifest path (default: IMAGE_VARIANTS_MANIFEST, or <output>/manifest.json with --output).")
+        parser.add_argument('--widths', default=','.join(str(w) for w in DEFAULT_WIDTHS), help="Comma separated target widths.")
+        parser.add_argument('--workers', type=int, help="Worker processes (default: all cores).")
+        parser.add_argument('--force', action='store_true', help="Rebuild even when the source hash is unchanged.")
+
+    def handle(self, *args, **options):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise CommandError("Pillow is required: pip install Pillow")
+
+        source = Path(options['source'] or Path(settings.MEDIA_ROOT) / CAS_DIR)
+        if not source.is_dir():
+            raise CommandError(f"{source} is not a directory")
+        output = Path(options['output'] or Path(settings.MEDIA_ROOT) / 'variants')
+        manifest = options['manifest'] or (None if options['output'] else settings.IMAGE_VARIANTS_MANIFEST)
+
+        try:
+            widths = sorted({int(w) for w in options['widths'].split(',') if w.strip()})
+        except ValueError:
+            raise CommandError("--widths must be a comma separated list of integers")
+        if not widths or min(widths) <= 0:
+            raise CommandError("--widths must be positive")
+
+        built, skipped, failed = build_variants(source, output, manifest, widths=widths,
+                                                workers=options['workers'], force=options['force'])
+        self.stdout.write(f"Built variants for {built} image(s), {skipped} unchanged.")
+        if failed:
+            raise CommandError(f"{failed} image(s) could not be processed.")
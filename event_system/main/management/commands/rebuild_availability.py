@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main.availability import rebuild_reservations
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the decoration/performer availability table from the approved weddings."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Bookings read per database round trip.")
+
+    def handle(self, *args, **options):
+        slots, clashes = rebuild_reservations(batch_size=options['batch_size'])
+        self.stdout.write(f"Reserved {slots} resource day(s), {len(clashes)} double booking(s) left unreserved")
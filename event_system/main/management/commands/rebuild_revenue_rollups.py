@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main.reports import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recomputes the daily revenue rollup table from the booking tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows read per primary key range.")
+
+    def handle(self, *args, **options):
+        buckets = rebuild_rollups(batch_size=options['batch_size'])
+        self.stdout.write(f"Rebuilt {buckets} daily revenue bucket(s)")
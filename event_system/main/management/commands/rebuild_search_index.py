@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the catalog search index from the concert, festival, blog and tournament tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Documents read per primary key range.")
+
+    def handle(self, *args, **options):
+        documents = rebuild_search_index(batch_size=options['batch_size'])
+        self.stdout.write(f"Indexed {documents} document(s)")
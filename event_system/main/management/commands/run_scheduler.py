@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from main.jobs import Scheduler, SCHEDULER_LOCK, SCHEDULER_LOCK_TTL, release_lock
+
+
+class Command(BaseCommand):
+    help = "Runs the periodic background jobs (auto-reject sweep, deadline closing, token pruning)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Run every job once and exit.")
+        parser.add_argument('--poll', type=int, default=30, help="Seconds between scheduler ticks.")
+        parser.add_argument('--lock-ttl', type=int, default=SCHEDULER_LOCK_TTL, help="Seconds the leader lease stays valid.")
+
+    def handle(self, *args, **options):
+        scheduler = Scheduler(lock_ttl=options['lock_ttl'])
+
+        if options['once']:
+            results = scheduler.tick(force=True)
+            release_lock(SCHEDULER_LOCK, scheduler.owner)
+            if not results:
+                self.stdout.write("Another scheduler holds the lock, nothing ran.")
+            for name, count in results.items():
+                self.stdout.write(f"{name}: {count}")
+            return
+
+        self.stdout.write(f"Scheduler started as {scheduler.owner}")
+        scheduler.run_forever(poll_seconds=options['poll'])
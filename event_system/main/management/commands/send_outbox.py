@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from main.mail import drain_outbox, run_worker
+
+
+class Command(BaseCommand):
+    help = "Sends queued outbox emails over a shared SMTP connection, retrying with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Drain the outbox once and exit.")
+        parser.add_argument('--poll', type=int, default=10, help="Seconds between outbox polls.")
+
+    def handle(self, *args, **options):
+        if options['once']:
+            sent, failed = drain_outbox()
+            self.stdout.write(f"Sent {sent}, failed {failed}")
+            return
+
+        self.stdout.write("Outbox worker started")
+        run_worker(poll_seconds=options['poll'])
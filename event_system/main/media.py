@@ -0,0 +1,105 @@
+import base64
+import binascii
+import hashlib
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+
+# --- CONTENT-ADDRESSED MEDIA STORE ---
+# Images are stored once under MEDIA_ROOT/cas/<2 hex>/<sha256>.<ext>. The file
+# name is the hash of its bytes, so a URL never changes meaning and can be
+# cached forever; uploading the same image twice reuses the same file.
+
+CAS_DIR = 'cas'
+DATA_URL_RE = re.compile(r'^data:(?P<mime>[\w.+-]+/[\w.+-]+)?(?P<params>(;[^,;]+)*?)(?P<b64>;base64)?,', re.I)
+
+EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/avif': '.avif',
+}
+
+
+class InvalidMedia(ValueError):
+    pass
+
+
+def media_root():
+    return Path(settings.MEDIA_ROOT)
+
+
+def cas_path(digest, ext):
+    return Path(CAS_DIR) / digest[:2] / f"{digest}{ext}"
+
+
+def media_url(relative_path):
+    return f"{settings.MEDIA_URL.rstrip('/')}/{Path(relative_path).as_posix()}"
+
+
+def sniff_image_type(data):
+    # The type is taken from the bytes, never from the client's label, so a
+    # script or HTML page cannot be stored under an image name
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return 'image/gif'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    if data[4:8] == b'ftyp' and data[8:12] in (b'avif', b'avis'):
+        return 'image/avif'
+    return None
+
+
+def store_bytes(data, content_type=None, filename=None):
+    # Returns the public URL of the stored file. content_type and filename are
+    # only used to word the error when the bytes are not a supported image.
+    if not data:
+        raise InvalidMedia("Empty image.")
+    max_bytes = getattr(settings, 'MEDIA_MAX_UPLOAD_BYTES', 10 * 1024 * 1024)
+    if len(data) > max_bytes:
+        raise InvalidMedia(f"Image is larger than {max_bytes // (1024 * 1024)} MB.")
+
+    claimed = content_type or (mimetypes.guess_type(filename)[0] if filename else None)
+    content_type = sniff_image_type(data)
+    if content_type not in EXTENSIONS:
+        raise InvalidMedia(f"Unsupported image type: {claimed or 'unknown'}.")
+
+    digest = hashlib.sha256(data).hexdigest()
+    relative = cas_path(digest, EXTENSIONS[content_type])
+    target = media_root() / relative
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp name first so readers never see a half written file
+        tmp = target.with_suffix(target.suffix + f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    return media_url(relative)
+
+
+def is_data_url(value):
+    return isinstance(value, str) and value[:5].lower() == 'data:'
+
+
+def store_data_url(value):
+    match = DATA_URL_RE.match(value)
+    if not match or not match.group('b64'):
+        raise InvalidMedia("Only base64 encoded data URLs can be stored.")
+    try:
+        data = base64.b64decode(value[match.end():], validate=False)
+    except (binascii.Error, ValueError):
+        raise InvalidMedia("Image data is not valid base64.")
+    return store_bytes(data, (match.group('mime') or '').lower())
+
+
+def extract_inline_image(value):
+    # Data URLs are moved into the store; anything else (URLs, references) is kept
+    if is_data_url(value):
+        return store_data_url(value)
+    return value
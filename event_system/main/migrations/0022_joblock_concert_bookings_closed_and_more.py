@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_concert_booking_deadline_festival_booking_deadline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('owner', models.CharField(blank=True, default='', max_length=200)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('last_heartbeat', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='concert',
+            name='bookings_closed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='festival',
+            name='bookings_closed',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-18 15:40
+
+from django.db import migrations, models
+from django.db.models import Q, Sum
+
+
+def backfill_prize_pool(apps, schema_editor):
+    Tournament = apps.get_model('main', 'Tournament')
+    totals = Tournament.objects.annotate(
+        pool=Sum('sportsregistration__price', filter=Q(sportsregistration__is_deleted=False))
+    ).values_list('pk', 'pool')
+    for pk, pool in totals.iterator(chunk_size=500):
+        Tournament.objects.filter(pk=pk).update(prize_pool=pool or 0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0022_joblock_concert_bookings_closed_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='prize_pool',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.RunPython(backfill_prize_pool, migrations.RunPython.noop),
+    ]
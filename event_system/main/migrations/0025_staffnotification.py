@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 16:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0024_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StaffNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notified_at', models.DateTimeField(auto_now_add=True)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='main.jobapplication')),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='staff_notifications', to='main.booking')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('booking', 'application'), name='unique_staff_notification')],
+            },
+        ),
+    ]
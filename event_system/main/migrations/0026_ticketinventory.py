@@ -0,0 +1,76 @@
+# Generated by Django 6.0 on 2026-10-18 17:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_ledger(apps, schema_editor):
+    # Links existing bookings to their event by title and seeds the sold counters
+    # from the larger of the JSON 'sold' value and the live bookings on record.
+    TicketInventory = apps.get_model('main', 'TicketInventory')
+    sources = [
+        (apps.get_model('main', 'Concert'), apps.get_model('main', 'ConcertBooking'),
+         'concert', 'title', 'tickets', 'concert_title', 'ticket_type'),
+        (apps.get_model('main', 'Festival'), apps.get_model('main', 'FestivalBooking'),
+         'festival', 'name', 'passes', 'festival_name', 'pass_type'),
+    ]
+    for Event, EventBooking, field, title_field, tiers_field, booking_title, booking_tier in sources:
+        for event in Event.objects.filter(is_deleted=False).iterator(chunk_size=200):
+            title = getattr(event, title_field)
+            EventBooking.objects.filter(**{booking_title: title, field + '__isnull': True}).update(**{field: event})
+            booked = dict(
+                EventBooking.objects.filter(**{field: event}, is_deleted=False).exclude(status='Cancelled')
+                .values(booking_tier).annotate(total=Sum('quantity')).values_list(booking_tier, 'total')
+            )
+            rows, seen = [], set()
+            for tier in getattr(event, tiers_field) or []:
+                name = str(tier.get('type') or '').strip() if isinstance(tier, dict) else ''
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                sold = max(_as_int(tier.get('sold')) or 0, booked.get(name) or 0)
+                rows.append(TicketInventory(**{field: event}, tier=name, capacity=_as_int(tier.get('total')), sold=sold))
+            TicketInventory.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_staffnotification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concertbooking',
+            name='concert',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='main.concert'),
+        ),
+        migrations.AddField(
+            model_name='festivalbooking',
+            name='festival',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='main.festival'),
+        ),
+        migrations.CreateModel(
+            name='TicketInventory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tier', models.CharField(max_length=100)),
+                ('capacity', models.IntegerField(blank=True, null=True)),
+                ('sold', models.IntegerField(default=0)),
+                ('concert', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inventory', to='main.concert')),
+                ('festival', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inventory', to='main.festival')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('concert', 'tier'), name='unique_concert_tier'), models.UniqueConstraint(fields=('festival', 'tier'), name='unique_festival_tier')],
+            },
+        ),
+        migrations.RunPython(build_ledger, migrations.RunPython.noop),
+    ]
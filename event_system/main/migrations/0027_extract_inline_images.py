@@ -0,0 +1,90 @@
+# Generated by Django 6.0 on 2026-10-18 18:20
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.db import migrations
+
+IMAGE_FIELDS = [
+    ('Concert', 'bannerImage'),
+    ('Concert', 'thumbnail'),
+    ('Festival', 'image'),
+    ('Tournament', 'image'),
+]
+BATCH_SIZE = 50
+DATA_URL_RE = re.compile(r'^data:(?P<mime>[\w.+-]+/[\w.+-]+)?(?P<params>(;[^,;]+)*?)(?P<b64>;base64)?,', re.I)
+# Frozen copy of the media store layout (main/media.py) at this migration:
+# leading bytes -> extension
+MAGIC = (
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+)
+
+
+def image_extension(data):
+    for magic, ext in MAGIC:
+        if data.startswith(magic):
+            return ext
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return '.webp'
+    if data[4:8] == b'ftyp' and data[8:12] in (b'avif', b'avis'):
+        return '.avif'
+    return None
+
+
+def store_data_url(value):
+    # Returns the /media/ URL, or None when the value is not a storable image
+    match = DATA_URL_RE.match(value)
+    if not match or not match.group('b64'):
+        return None
+    try:
+        data = base64.b64decode(value[match.end():], validate=False)
+    except (binascii.Error, ValueError):
+        return None
+    ext = image_extension(data)
+    if not data or ext is None:
+        return None
+
+    digest = hashlib.sha256(data).hexdigest()
+    relative = Path('cas') / digest[:2] / f"{digest}{ext}"
+    target = Path(settings.MEDIA_ROOT) / relative
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    return f"{settings.MEDIA_URL.rstrip('/')}/{relative.as_posix()}"
+
+
+def extract_inline_images(apps, schema_editor):
+    # Moves base64 data URLs out of the rows and into the media store. Only the
+    # primary keys are listed up front; each blob is loaded one batch at a time.
+    for model_name, field in IMAGE_FIELDS:
+        Model = apps.get_model('main', model_name)
+        pks = list(Model.objects.filter(**{f'{field}__startswith': 'data:'}).values_list('pk', flat=True))
+        for start in range(0, len(pks), BATCH_SIZE):
+            batch = Model.objects.filter(pk__in=pks[start:start + BATCH_SIZE]).values_list('pk', field)
+            for pk, value in batch:
+                url = store_data_url(value)
+                if url is None:
+                    print(f"Skipping {model_name} #{pk} {field}: not a supported image")
+                    continue
+                Model.objects.filter(pk=pk).update(**{field: url})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0026_ticketinventory'),
+    ]
+
+    operations = [
+        migrations.RunPython(extract_inline_images, migrations.RunPython.noop),
+    ]
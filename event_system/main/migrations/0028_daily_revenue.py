@@ -0,0 +1,66 @@
+# Generated by Django 6.0 on 2026-10-18 19:05
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Sum, Value
+from django.db.models.functions import TruncDate
+
+ZERO = Decimal('0')
+# line -> (model name, amount field, date field, has refund/cancellation columns)
+ROLLUP_LINES = {
+    'weddings': ('Booking', 'total_cost', 'booking_date', True),
+    'concerts': ('ConcertBooking', 'total_price', 'booking_date', True),
+    'festivals': ('FestivalBooking', 'total_price', 'booking_date', True),
+    'sports': ('SportsRegistration', 'price', 'registration_date', False),
+}
+
+
+def backfill_rollups(apps, schema_editor):
+    # One GROUP BY per product line, bucketed like main.reports.rollup_groups
+    DailyRevenue = apps.get_model('main', 'DailyRevenue')
+    rows = []
+    for line, (model_name, amount_field, date_field, with_refunds) in ROLLUP_LINES.items():
+        model = apps.get_model('main', model_name)
+        groups = model._base_manager.filter(is_deleted=False, **{f'{date_field}__isnull': False}).order_by().values(
+            'status', day=TruncDate(date_field)
+        ).annotate(
+            count=Count('pk'),
+            revenue=Sum(amount_field),
+            refunds=Sum('refund_amount') if with_refunds else Value(ZERO),
+            fees=Sum('cancellation_fee') if with_refunds else Value(ZERO),
+        )
+        rows.extend(
+            DailyRevenue(day=group['day'], product_line=line, status=group['status'], count=group['count'],
+                         revenue=group['revenue'] or ZERO, refunds=group['refunds'] or ZERO,
+                         cancellation_fees=group['fees'] or ZERO)
+            for group in groups
+        )
+    DailyRevenue.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0027_extract_inline_images'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('product_line', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('refunds', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('cancellation_fees', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'product_line', 'status'), name='unique_daily_revenue_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 6.0 on 2026-10-18 19:40
+
+import main.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0028_daily_revenue'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blog',
+            index=main.models.LiveRowsIndex(fields=['is_published', 'created_at'], name='blog_live_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blog',
+            index=main.models.LiveRowsIndex(fields=['created_at'], name='blog_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=main.models.LiveRowsIndex(fields=['user', 'id'], name='booking_live_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=main.models.LiveRowsIndex(fields=['id'], name='booking_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'booking_date'], name='booking_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concert',
+            index=main.models.LiveRowsIndex(fields=['id'], name='concert_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concertbooking',
+            index=main.models.LiveRowsIndex(fields=['user', 'id'], name='concertbooking_live_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concertbooking',
+            index=main.models.LiveRowsIndex(fields=['id'], name='concertbooking_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festival',
+            index=main.models.LiveRowsIndex(fields=['id'], name='festival_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festivalbooking',
+            index=main.models.LiveRowsIndex(fields=['user', 'id'], name='festivalbooking_live_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festivalbooking',
+            index=main.models.LiveRowsIndex(fields=['id'], name='festivalbooking_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=main.models.LiveRowsIndex(fields=['applied_at'], name='jobapplication_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sportsregistration',
+            index=main.models.LiveRowsIndex(fields=['user', 'id'], name='sportsreg_live_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sportsregistration',
+            index=main.models.LiveRowsIndex(fields=['id'], name='sportsreg_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sportsregistration',
+            index=main.models.LiveRowsIndex(fields=['tournament', 'status'], name='sportsreg_live_tournament_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sportsregistration',
+            index=main.models.LiveRowsIndex(fields=['status', 'id'], name='sportsreg_live_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournament',
+            index=main.models.LiveRowsIndex(fields=['id'], name='tournament_live_idx'),
+        ),
+    ]
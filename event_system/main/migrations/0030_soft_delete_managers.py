@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 20:15
+
+import main.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0029_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='concert',
+            index=main.models.LiveRowsIndex(fields=['title'], name='concert_live_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festival',
+            index=main.models.LiveRowsIndex(fields=['name'], name='festival_live_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=main.models.LiveRowsIndex(fields=['position'], name='jobapplication_live_pos_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournament',
+            index=main.models.LiveRowsIndex(fields=['status', 'registration_deadline'], name='tournament_live_status_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-18 20:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0030_soft_delete_managers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fixture',
+            name='bracket_position',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='fixture',
+            name='next_fixture',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='feeder_fixtures', to='main.fixture'),
+        ),
+        migrations.AddField(
+            model_name='fixture',
+            name='next_slot',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
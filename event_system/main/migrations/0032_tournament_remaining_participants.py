@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-18 21:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_remaining(apps, schema_editor):
+    Tournament = apps.get_model('main', 'Tournament')
+    SportsRegistration = apps.get_model('main', 'SportsRegistration')
+    remaining = (
+        SportsRegistration.objects.filter(tournament=OuterRef('pk'), is_deleted=False)
+        .exclude(status='Eliminated').order_by().values('tournament').annotate(n=Count('pk')).values('n')
+    )
+    Tournament.objects.update(remaining_participants=Coalesce(Subquery(remaining), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0031_fixture_bracket_links'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='remaining_participants',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_remaining, migrations.RunPython.noop),
+    ]
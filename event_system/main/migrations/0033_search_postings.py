@@ -0,0 +1,79 @@
+# Generated by Django 6.0 on 2026-10-18 21:40
+
+import re
+from collections import Counter
+
+from django.db import migrations, models
+
+# Frozen copy of the tokenizer and field weights in main/search.py
+# doc type -> (model name, {field: weight})
+SEARCH_DOCUMENTS = {
+    'concert': ('Concert', {'title': 5, 'artist': 4, 'genre': 2, 'city': 2, 'description': 1}),
+    'festival': ('Festival', {'name': 5, 'theme': 3, 'about': 1}),
+    'blog': ('Blog', {'title': 5, 'content': 1}),
+    'tournament': ('Tournament', {'name': 5, 'sport': 3}),
+}
+MAX_TERM_LENGTH = 64
+MAX_FIELD_HITS = 10
+STOPWORDS = frozenset(
+    'a an and are as at be by for from in is it of on or that the this to was with will'.split()
+)
+BATCH_SIZE = 500
+_TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in _TOKEN.findall((text or '').lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def backfill_search_index(apps, schema_editor):
+    # Indexes every live (and, for blogs, published) document one primary key range at a time
+    Posting = apps.get_model('main', 'SearchPosting')
+    for doc_type, (model_name, fields) in SEARCH_DOCUMENTS.items():
+        model = apps.get_model('main', model_name)
+        last_pk = 0
+        while True:
+            batch = list(model._base_manager.filter(pk__gt=last_pk).order_by('pk')[:BATCH_SIZE])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            postings = []
+            for instance in batch:
+                if instance.is_deleted or not getattr(instance, 'is_published', True):
+                    continue
+                weights = Counter()
+                for field, field_weight in fields.items():
+                    for term, hits in Counter(tokenize(getattr(instance, field))).items():
+                        weights[term] += field_weight * min(hits, MAX_FIELD_HITS)
+                postings.extend(Posting(term=term, doc_type=doc_type, doc_id=instance.pk, weight=weight)
+                                for term, weight in weights.items())
+            Posting.objects.bulk_create(postings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0032_tournament_remaining_participants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('doc_type', models.CharField(max_length=20)),
+                ('doc_id', models.IntegerField()),
+                ('weight', models.IntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['doc_type', 'doc_id'], name='search_posting_doc_idx')],
+                'constraints': [models.UniqueConstraint(fields=('term', 'doc_type', 'doc_id'), name='unique_search_posting')],
+            },
+        ),
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
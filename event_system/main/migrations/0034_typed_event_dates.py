@@ -0,0 +1,113 @@
+# Generated by Django 6.0 on 2026-10-18 22:10
+
+import re
+from datetime import datetime
+
+import main.models
+from django.db import migrations, models
+
+# model -> {typed column: display string column}
+DATE_COLUMNS = {
+    'Concert': {'starts_on': 'date'},
+    'Festival': {'starts_on': 'startDate', 'ends_on': 'endDate'},
+    'ConcertBooking': {'event_on': 'event_date'},
+}
+BATCH_SIZE = 1000
+
+# Frozen copy of main.dates.parse_event_date
+DATE_FORMATS = (
+    '%Y-%m-%d', '%d-%m-%Y', '%d/%m/%Y', '%Y/%m/%d', '%d.%m.%Y',
+    '%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y',
+)
+_WEEKDAY = re.compile(r'^(mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+', re.IGNORECASE)
+_ORDINAL = re.compile(r'(\d)(st|nd|rd|th)\b', re.IGNORECASE)
+
+
+def parse_event_date(value):
+    if not value:
+        return None
+    text = str(value).strip()
+    if re.match(r'^\d{4}-\d{2}-\d{2}T', text):
+        text = text[:10]
+    text = _ORDINAL.sub(r'\1', _WEEKDAY.sub('', text)).replace(',', ' ')
+    text = ' '.join(text.split())
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def backfill_dates(apps, schema_editor):
+    # Parses the existing strings one primary key range at a time
+    for model_name, columns in DATE_COLUMNS.items():
+        model = apps.get_model('main', model_name)
+        last_pk = 0
+        while True:
+            batch = list(model._base_manager.filter(pk__gt=last_pk).order_by('pk')
+                         .only('pk', *columns.values())[:BATCH_SIZE])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            for row in batch:
+                for typed, text in columns.items():
+                    setattr(row, typed, parse_event_date(getattr(row, text)))
+                if model_name == 'Festival' and row.ends_on is None:
+                    row.ends_on = row.starts_on
+            model._base_manager.bulk_update(batch, list(columns))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0033_search_postings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concert',
+            name='starts_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='concertbooking',
+            name='event_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='festival',
+            name='ends_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='festival',
+            name='starts_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='concert',
+            index=main.models.LiveRowsIndex(fields=['city', 'starts_on'], name='concert_live_city_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concert',
+            index=main.models.LiveRowsIndex(fields=['genre', 'starts_on'], name='concert_live_genre_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concert',
+            index=main.models.LiveRowsIndex(fields=['starts_on'], name='concert_live_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='concertbooking',
+            index=main.models.LiveRowsIndex(fields=['event_on'], name='concertbooking_live_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festival',
+            index=main.models.LiveRowsIndex(fields=['city', 'starts_on'], name='festival_live_city_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='festival',
+            index=main.models.LiveRowsIndex(fields=['starts_on'], name='festival_live_date_idx'),
+        ),
+        migrations.RunPython(backfill_dates, migrations.RunPython.noop),
+    ]
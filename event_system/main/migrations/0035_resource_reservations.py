@@ -0,0 +1,72 @@
+# Generated by Django 6.0 on 2026-10-18 22:20
+
+import re
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of the slot rules in main/availability.py
+MAX_BOOKING_DAYS = 7
+
+
+def wanted_slots(booking):
+    # {(resource, day): label} an approved, live wedding occupies
+    resources = {}
+    if booking.selected_decoration_id:
+        resources[f'decoration:{booking.selected_decoration_id}'] = (
+            booking.decoration_name or f'Decoration #{booking.selected_decoration_id}'
+        )
+    if (booking.performer_name or '').strip():
+        resources['performer:' + re.sub(r'\s+', ' ', booking.performer_name.strip().lower())] = booking.performer_name.strip()
+
+    schedule = (booking.wedding_details or {}).get('schedule') or {}
+    try:
+        length = int(schedule.get('numberOfDays') or 1)
+    except (TypeError, ValueError):
+        length = 1
+    length = min(max(length, 1), MAX_BOOKING_DAYS)
+    days = [booking.event_date + timedelta(days=offset) for offset in range(length)]
+    return {(resource, day): label for resource, label in resources.items() for day in days}
+
+
+def backfill_reservations(apps, schema_editor):
+    # Oldest booking wins a slot that was already double-booked
+    Booking = apps.get_model('main', 'Booking')
+    Reservation = apps.get_model('main', 'ResourceReservation')
+    claimed = set()
+    bookings = Booking._base_manager.filter(status='Approved', is_deleted=False, event_date__isnull=False).order_by('pk')
+    for booking in bookings.iterator(chunk_size=500):
+        rows = []
+        for (resource, day), label in wanted_slots(booking).items():
+            if (resource, day) in claimed:
+                print(f"Availability: booking #{booking.pk} double-books {resource} on {day}")
+                continue
+            claimed.add((resource, day))
+            rows.append(Reservation(resource=resource, day=day, booking_id=booking.pk, label=label))
+        Reservation.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0034_typed_event_dates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceReservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=160)),
+                ('day', models.DateField()),
+                ('label', models.CharField(blank=True, default='', max_length=150)),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='main.booking')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day', 'resource'], name='reservation_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('resource', 'day'), name='unique_resource_day')],
+            },
+        ),
+        migrations.RunPython(backfill_reservations, migrations.RunPython.noop),
+    ]
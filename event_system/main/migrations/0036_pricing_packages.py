@@ -0,0 +1,56 @@
+# Generated by Django 6.0 on 2026-10-18 22:45
+
+from django.db import migrations, models
+
+# The menus and acts the booking pages have offered so far
+CATERING = [
+    ('Basic High Tea', 150), ('Street Food Gala', 350), ('Standard Indian Buffet', 500),
+    ('Heritage Gujarati Thali', 800), ('Royal Indian Feast', 1200), ('Continental Luxe', 1800),
+    ('Grand Emperor Menu', 2500), ('Royal South Indian Wedding Feast', 950), ('Punjabi Shaadi Da Swad', 750),
+    ('Italian Live Wedding Counter', 900), ('Mexican Wedding Fiesta', 1050), ('Pan-Asian Royal Wedding Spread', 700),
+    ('Grand Wedding Dessert Bazaar', 850), ('Kids Wedding Treat Menu', 450),
+]
+PERFORMERS = [
+    ('Live DJ', 15000), ('Bollywood Band', 25000), ('Dance Performance', 12000), ('Classical Ensemble', 12000),
+    ('Jaysigh Gadhvi', 100000), ('Osman Mir', 90000), ('Kinjal Dave', 82000), ('Hariom Gadhvi', 88000),
+]
+
+
+def seed_packages(apps, schema_editor):
+    CateringPackage = apps.get_model('main', 'CateringPackage')
+    PerformerPackage = apps.get_model('main', 'PerformerPackage')
+    CateringPackage.objects.bulk_create([CateringPackage(name=name, price_per_plate=price) for name, price in CATERING],
+                                        ignore_conflicts=True)
+    PerformerPackage.objects.bulk_create([PerformerPackage(name=name, price=price) for name, price in PERFORMERS],
+                                         ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0035_resource_reservations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CateringPackage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True)),
+                ('price_per_plate', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('description', models.TextField(blank=True, default='')),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PerformerPackage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('description', models.TextField(blank=True, default='')),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.RunPython(seed_packages, migrations.RunPython.noop),
+    ]
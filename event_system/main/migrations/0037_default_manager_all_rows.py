@@ -0,0 +1,104 @@
+# Generated by Django 6.0 on 2026-10-18 23:05
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0036_pricing_packages'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blog',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='booking',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='concert',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='concertbooking',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='festival',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='festivalbooking',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='jobapplication',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='sportsregistration',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='tournament',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AlterModelManagers(
+            name='blog',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='booking',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='concert',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='concertbooking',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='festival',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='festivalbooking',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='jobapplication',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='sportsregistration',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='tournament',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-18 23:50
+
+from django.db import migrations
+
+# The styles the decoration page offers; bookings send their names to be priced
+STYLES = [
+    ('Haldi Ceremony', 'Sunny Marigold Oasis', 15000, 'https://i.pinimg.com/1200x/ad/4e/da/ad4eda2ce1d9878d5c75a15e0b59fbee.jpg'),
+    ('Haldi Ceremony', 'Classic Yellow Drapes', 25000, 'https://i.pinimg.com/1200x/46/ab/aa/46abaa841d27d491531c0f346c5a5ba7.jpg'),
+    ('Haldi Ceremony', 'Floral Genda Phool Gala', 35000, 'https://i.pinimg.com/736x/40/58/a9/4058a910599dd466c2c2234af3f73ec8.jpg'),
+    ('Haldi Ceremony', 'Contemporary Minimal Haldi', 45000, 'https://cdn0.weddingwire.in/article/8567/original/1280/png/117658-haldi-decoration-marriage-colours.jpeg'),
+    ('Haldi Ceremony', 'Royal Rajwadi Haldi', 75000, 'https://i.pinimg.com/1200x/eb/14/c9/eb14c92174acadbbd65c4a15ac85405a.jpg'),
+    ('Haldi Ceremony', 'Luxury Exotic Floral Haldi', 125000, 'https://i.pinimg.com/736x/be/35/5c/be355cb6eb0e64f6069e91d3210d8be9.jpg'),
+    ('Mehendi Ceremony', 'Bohemian Backyard Mehendi', 18000, 'https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcSDHebW2TS5OI9GaDfjHPKZ56ND1bzxk-eGpQ&s'),
+    ('Mehendi Ceremony', 'Rainbow Drapes Theme', 28000, 'https://i.pinimg.com/236x/42/02/b1/4202b1cac7642050fd7cde7b7d3d2855.jpg'),
+    ('Mehendi Ceremony', 'Traditional Henna Lounge', 38000, 'https://i.pinimg.com/736x/e5/ad/84/e5ad840325f74553b626455a60f1da23.jpg'),
+    ('Mehendi Ceremony', 'Vintage Umbrella Garden', 55000, 'https://i.pinimg.com/1200x/bb/85/cf/bb85cf9451733e922fffb4fa264b71ad.jpg'),
+    ('Mehendi Ceremony', 'Moroccan Oasis Mehndi', 85000, 'https://i.pinimg.com/1200x/38/86/05/3886052ee5c6e3aa83557a63bfbdc3b6.jpg'),
+    ('Mehendi Ceremony', 'Imperial Floral Henna', 135000, 'https://i.pinimg.com/736x/83/41/d4/8341d4334c60b4dc4dcbb269f454b2ee.jpg'),
+    ('Sangeet Night', 'Vibrant Dance & Beats Stage', 25000, 'https://i.pinimg.com/1200x/81/19/0c/81190c1293e65882d68c4beff29e2aed.jpg'),
+    ('Sangeet Night', 'Neon Party Vibe', 75000, 'https://i.pinimg.com/736x/d4/72/e9/d472e9a9a805b745f8fc5e87277060f0.jpg'),
+    ('Sangeet Night', 'Bollywood Disco Gala', 85000, 'https://i.pinimg.com/1200x/12/ea/1c/12ea1cdd9c8ddc1eb4685223168b28f4.jpg'),
+    ('Sangeet Night', 'Elegant Jazz Lounge', 15000, 'https://i.pinimg.com/1200x/29/ab/bc/29abbc365d601a9d13f01f22ab05e778.jpg'),
+    ('Sangeet Night', 'Grand LED Concert Stage', 275000, 'https://i.pinimg.com/1200x/fe/86/89/fe86890fcacacf34427bb5e164448b98.jpg'),
+    ('Sangeet Night', 'Ultra-Luxury Starry Night', 310000, 'https://i.pinimg.com/736x/36/26/71/36267198c23ec3e6b4d8e4ada3a6c5df.jpg'),
+    ('Grand Wedding', 'Modern Glass Mandap', 65000, 'https://i.pinimg.com/736x/8a/52/7f/8a527fb4c519297753e97ee30169b580.jpg'),
+    ('Grand Wedding', 'Temple Theme Mandap', 75000, 'https://i.pinimg.com/736x/d2/45/3d/d2453da4c2f91b535a3eda56c1f8b3c0.jpg'),
+    ('Grand Wedding', 'Sacred Fire Lounge', 35000, 'https://i.pinimg.com/736x/79/5e/51/795e518eb39ce4accaaadb874e022f64.jpg'),
+    ('Grand Wedding', 'White & Gold Royal Mandap', 40000, 'https://i.pinimg.com/736x/89/77/a4/8977a4fac5bd0b875107f1918c1c1674.jpg'),
+    ('Grand Wedding', 'Exotic Rose Garden Wedding', 110000, 'https://i.pinimg.com/736x/e8/f9/75/e8f975bab61e39ad2dbcdac822ac50b6.jpg'),
+    ('Grand Wedding', 'Royal Rajwadi Mandap', 150000, 'https://i.pinimg.com/736x/17/24/72/172472c99e09785f6d0fda251c2606ab.jpg'),
+    ('Grand Wedding', 'Palace Heritage Wedding', 170000, 'https://i.pinimg.com/736x/3b/dd/fd/3bddfdb1d64bd9b414ba8e607d0e37e0.jpg'),
+    ('Gala Reception', 'Modern Mirror Stage', 60000, 'https://i.pinimg.com/736x/7f/75/0c/7f750cecbcacb48126cf0ab65cda76fb.jpg'),
+    ('Gala Reception', 'Elegant Chandelier Hall', 100000, 'https://i.pinimg.com/736x/b5/46/69/b54669413c6a34c8dd5742454ef92839.jpg'),
+    ('Gala Reception', 'Enchanted Forest Vibe', 125000, 'https://i.pinimg.com/736x/f0/b2/09/f0b2091cc0c680e320ca5d429c338b02.jpg'),
+    ('Gala Reception', 'Minimal Luxe White', 180000, 'https://i.pinimg.com/1200x/e2/71/14/e27114ebeb2d2ec24a4467a0c30177f8.jpg'),
+    ('Gala Reception', 'Grand Crystal Ball Stage', 275000, 'https://i.pinimg.com/1200x/e8/8f/67/e88f67b8e3ad5a40a44497b2cffb4f53.jpg'),
+    ('Gala Reception', 'Diamond Royal Splendor', 550000, 'https://i.pinimg.com/1200x/58/cd/9f/58cd9ff81773f66073213cf9568a825a.jpg'),
+]
+
+
+def seed_styles(apps, schema_editor):
+    # Decoration names are not unique, so leave any style an admin already added alone
+    Decoration = apps.get_model('main', 'Decoration')
+    existing = set(Decoration.objects.values_list('name', flat=True))
+    Decoration.objects.bulk_create([
+        Decoration(name=name, price=price, image=image, description=kind)
+        for kind, name, price, image in STYLES if name not in existing
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0038_user_tokens_valid_after'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_styles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0039_seed_decoration_styles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='decoration_ids',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
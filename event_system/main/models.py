@@ -1,5 +1,47 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
+
+from .dates import parse_event_date
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def alive(self):
+        return self.filter(is_deleted=False)
+
+    def deleted(self):
+        return self.filter(is_deleted=True)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    # `objects` only sees live rows; tombstones are reached explicitly through
+    # deleted() (the recycle bin) or with_deleted() (restore, reports). It is
+    # not the default manager: models name `all_objects` in Meta, so dumpdata,
+    # reverse relations and the admin still see every row.
+    def get_queryset(self):
+        return super().get_queryset().alive()
+
+    def with_deleted(self):
+        return super().get_queryset()
+
+    def deleted(self):
+        return self.with_deleted().deleted()
+
+
+class LiveRowsIndex(models.Index):
+    # Index over live (is_deleted=False) rows only, so list queries never walk
+    # tombstones. Databases without partial indexes (MySQL) get the same columns
+    # led by is_deleted instead. The condition is applied only when the SQL is
+    # built, so the model check does not warn (models.W037) on MySQL, where the
+    # fallback is intended.
+    LIVE = models.Q(is_deleted=False)
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.features.supports_partial_indexes:
+            index = models.Index(fields=self.fields, name=self.name, condition=self.LIVE)
+        else:
+            index = models.Index(fields=['is_deleted', *self.fields], name=self.name)
+        return index.create_sql(model, schema_editor, using, **kwargs)
 
 class User(AbstractUser):
     ROLE_CHOICES = (
@@ -8,10 +50,34 @@ class User(AbstractUser):
     )
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='USER')
     email = models.EmailField(unique=True)
+    # Tokens issued at or before this moment are refused (main.auth.revoke_tokens)
+    tokens_valid_after = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Fields copied into access token claims (main.auth)
+    TOKEN_CLAIM_FIELDS = ('username', 'email', 'role', 'is_staff', 'is_superuser', 'is_active')
 
     def __str__(self):
         return self.username
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claims = instance.token_claims()
+        return instance
+
+    def token_claims(self):
+        return {field: self.__dict__.get(field) for field in self.TOKEN_CLAIM_FIELDS}
+
+    @property
+    def claims_changed(self):
+        # True when a save changed anything that signed tokens carry
+        loaded = getattr(self, '_loaded_claims', None)
+        return loaded is not None and loaded != self.token_claims()
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_claims = self.token_claims()
+
 class Decoration(models.Model):
     name = models.CharField(max_length=100)
     price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -21,7 +87,74 @@ class Decoration(models.Model):
     def __str__(self):
         return self.name
 
-class Booking(models.Model):
+class CateringPackage(models.Model):
+    # Priced per plate; Booking.catering_package stores the name
+    name = models.CharField(max_length=150, unique=True)
+    price_per_plate = models.DecimalField(max_digits=10, decimal_places=2)
+    description = models.TextField(blank=True, default='')
+    is_active = models.BooleanField(default=True)
+
+    def __str__(self):
+        return f"{self.name} (₹{self.price_per_plate}/plate)"
+
+class PerformerPackage(models.Model):
+    # Flat fee per event; Booking.performer_name stores the name
+    name = models.CharField(max_length=150, unique=True)
+    price = models.DecimalField(max_digits=12, decimal_places=2)
+    description = models.TextField(blank=True, default='')
+    is_active = models.BooleanField(default=True)
+
+    def __str__(self):
+        return self.name
+
+class RevenueRollupMixin:
+    # Keeps DailyRevenue in step with save()/delete(). Subclasses name their
+    # product line; the amount and date columns are listed in reports.ROLLUP_LINES.
+    rollup_line = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._rollup_state = instance.rollup_contribution()
+        return instance
+
+    def rollup_contribution(self):
+        from .reports import rollup_contribution
+        return rollup_contribution(self)
+
+    def _loaded_rollup_state(self):
+        state = getattr(self, '_rollup_state', None)
+        if state is not None or self._state.adding:
+            return state
+        # Loaded with deferred columns: read what the row held before this save
+        old = type(self)._base_manager.filter(pk=self.pk).first()
+        return old._rollup_state if old else None
+
+    def _saved_rollup_state(self):
+        state = self.rollup_contribution()
+        if state is None and self.get_deferred_fields():
+            # Saved with deferred columns: read back what the row now holds
+            stored = type(self)._base_manager.filter(pk=self.pk).first()
+            state = stored._rollup_state if stored else None
+        return state
+
+    def save(self, *args, **kwargs):
+        from .reports import apply_rollup_delta
+        with transaction.atomic():
+            old = self._loaded_rollup_state()
+            super().save(*args, **kwargs)
+            self._rollup_state = self._saved_rollup_state()
+            apply_rollup_delta(old, self._rollup_state)
+
+    def delete(self, *args, **kwargs):
+        from .reports import apply_rollup_delta
+        with transaction.atomic():
+            old = self._loaded_rollup_state()
+            result = super().delete(*args, **kwargs)
+            apply_rollup_delta(old, None)
+        return result
+
+class Booking(RevenueRollupMixin, models.Model):
     STATUS_CHOICES = (
         ('Pending', 'Pending'),
         ('Approved', 'Approved'),
@@ -42,6 +175,8 @@ class Booking(models.Model):
     selected_decoration = models.ForeignKey(Decoration, on_delete=models.SET_NULL, null=True, blank=True)
     decoration_name = models.CharField(max_length=150, blank=True, null=True) # Snapshot name
     decoration_price = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    # Every decoration the quote priced, in decoration_name order; the first is selected_decoration
+    decoration_ids = models.JSONField(default=list, blank=True, editable=False)
 
     performer_name = models.CharField(max_length=150, blank=True, null=True)
     performer_price = models.DecimalField(max_digits=12, decimal_places=2, default=0)
@@ -68,14 +203,43 @@ class Booking(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
     is_deleted = models.BooleanField(default=False)
 
+    rollup_line = 'weddings'
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['user', 'id'], name='booking_live_user_idx'),
+            LiveRowsIndex(fields=['id'], name='booking_live_idx'),
+            models.Index(fields=['status', 'booking_date'], name='booking_status_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.event_type} ({self.status})"
 
-class ConcertBooking(models.Model):
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as loaded, so post_save handlers can tell real transitions from edits
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    @property
+    def previous_status(self):
+        return getattr(self, '_loaded_status', None)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_status = self.status
+
+class ConcertBooking(RevenueRollupMixin, models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     concert_title = models.CharField(max_length=200)
     artist_name = models.CharField(max_length=200)
     event_date = models.CharField(max_length=100)
+    event_on = models.DateField(null=True, blank=True, editable=False) # Parsed from event_date on save
     ticket_type = models.CharField(max_length=100)
     quantity = models.IntegerField()
     total_price = models.DecimalField(max_digits=12, decimal_places=2)
@@ -85,11 +249,29 @@ class ConcertBooking(models.Model):
     is_deleted = models.BooleanField(default=False)
     refund_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     cancellation_fee = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    concert = models.ForeignKey('Concert', on_delete=models.SET_NULL, null=True, blank=True, related_name='bookings')
+
+    rollup_line = 'concerts'
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['user', 'id'], name='concertbooking_live_user_idx'),
+            LiveRowsIndex(fields=['id'], name='concertbooking_live_idx'),
+            LiveRowsIndex(fields=['event_on'], name='concertbooking_live_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.concert_title} ({self.quantity} x {self.ticket_type})"
 
-class FestivalBooking(models.Model):
+    def save(self, *args, **kwargs):
+        self.event_on = parse_event_date(self.event_date)
+        super().save(*args, **kwargs)
+
+class FestivalBooking(RevenueRollupMixin, models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     festival_name = models.CharField(max_length=200)
     pass_type = models.CharField(max_length=100)
@@ -100,16 +282,43 @@ class FestivalBooking(models.Model):
     is_deleted = models.BooleanField(default=False)
     refund_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     cancellation_fee = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    festival = models.ForeignKey('Festival', on_delete=models.SET_NULL, null=True, blank=True, related_name='bookings')
+
+    rollup_line = 'festivals'
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['user', 'id'], name='festivalbooking_live_user_idx'),
+            LiveRowsIndex(fields=['id'], name='festivalbooking_live_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.festival_name} ({self.quantity} x {self.pass_type})"
 
+def accepts_bookings(event):
+    # Closed by the scheduler, or past the deadline before the next sweep has run
+    if event.bookings_closed:
+        return False
+    return event.booking_deadline is None or event.booking_deadline >= timezone.localdate()
+
+def reopen_if_extended(event):
+    # Moving the deadline into the future lifts the scheduler's close
+    loaded = getattr(event, '_loaded_deadline', None)
+    if (event.bookings_closed and event.booking_deadline != loaded
+            and event.booking_deadline is not None and event.booking_deadline >= timezone.localdate()):
+        event.bookings_closed = False
+
 class Concert(models.Model):
     title = models.CharField(max_length=200)
     artist = models.CharField(max_length=200)
     artistBio = models.TextField()
     popularTracks = models.JSONField(default=list, blank=True)
     date = models.CharField(max_length=100) # String to match frontend for now
+    starts_on = models.DateField(null=True, blank=True, editable=False) # Parsed from `date` on save
     time = models.CharField(max_length=50)
     venue = models.CharField(max_length=200)
     city = models.CharField(max_length=100)
@@ -125,21 +334,55 @@ class Concert(models.Model):
     sponsors = models.JSONField(default=list, blank=True)
     is_deleted = models.BooleanField(default=False)
     booking_deadline = models.DateField(null=True, blank=True)
+    bookings_closed = models.BooleanField(default=False) # Flipped by the scheduler once booking_deadline passes
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['id'], name='concert_live_idx'),
+            LiveRowsIndex(fields=['title'], name='concert_live_title_idx'),
+            LiveRowsIndex(fields=['city', 'starts_on'], name='concert_live_city_date_idx'),
+            LiveRowsIndex(fields=['genre', 'starts_on'], name='concert_live_genre_date_idx'),
+            LiveRowsIndex(fields=['starts_on'], name='concert_live_date_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_deadline = instance.__dict__.get('booking_deadline')
+        return instance
+
+    @property
+    def accepts_bookings(self):
+        return accepts_bookings(self)
+
+    def save(self, *args, **kwargs):
+        self.starts_on = parse_event_date(self.date)
+        reopen_if_extended(self)
+        super().save(*args, **kwargs)
+        self._loaded_deadline = self.booking_deadline
+
 class Festival(models.Model):
     name = models.CharField(max_length=200)
     city = models.CharField(max_length=100)
     venue = models.CharField(max_length=200)
     startDate = models.CharField(max_length=100)
     endDate = models.CharField(max_length=100)
+    # Parsed from startDate/endDate on save
+    starts_on = models.DateField(null=True, blank=True, editable=False)
+    ends_on = models.DateField(null=True, blank=True, editable=False)
     theme = models.CharField(max_length=200)
     image = models.TextField()
     color = models.CharField(max_length=100, default='rgba(0,0,0,0.9)')
     booking_deadline = models.DateField(null=True, blank=True)
+    bookings_closed = models.BooleanField(default=False) # Flipped by the scheduler once booking_deadline passes
     secondary = models.CharField(max_length=50, default='#FFD700')
     highlights = models.JSONField(default=list, blank=True)
     about = models.TextField()
@@ -151,9 +394,63 @@ class Festival(models.Model):
     is_deleted = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['id'], name='festival_live_idx'),
+            LiveRowsIndex(fields=['name'], name='festival_live_name_idx'),
+            LiveRowsIndex(fields=['city', 'starts_on'], name='festival_live_city_date_idx'),
+            LiveRowsIndex(fields=['starts_on'], name='festival_live_date_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_deadline = instance.__dict__.get('booking_deadline')
+        return instance
+
+    @property
+    def accepts_bookings(self):
+        return accepts_bookings(self)
+
+    def save(self, *args, **kwargs):
+        self.starts_on = parse_event_date(self.startDate)
+        self.ends_on = parse_event_date(self.endDate) or self.starts_on
+        reopen_if_extended(self)
+        super().save(*args, **kwargs)
+        self._loaded_deadline = self.booking_deadline
+
+class TicketInventory(models.Model):
+    # Per-tier seat ledger derived from Concert.tickets / Festival.passes.
+    # capacity is None when the tier has no 'total' limit.
+    concert = models.ForeignKey(Concert, on_delete=models.CASCADE, null=True, blank=True, related_name='inventory')
+    festival = models.ForeignKey(Festival, on_delete=models.CASCADE, null=True, blank=True, related_name='inventory')
+    tier = models.CharField(max_length=100)
+    capacity = models.IntegerField(null=True, blank=True)
+    sold = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['concert', 'tier'], name='unique_concert_tier'),
+            models.UniqueConstraint(fields=['festival', 'tier'], name='unique_festival_tier'),
+        ]
+
+    def __str__(self):
+        event = self.concert or self.festival
+        return f"{event} - {self.tier} ({self.sold}/{self.capacity if self.capacity is not None else '∞'})"
+
+    @property
+    def remaining(self):
+        if self.capacity is None:
+            return None
+        return max(0, self.capacity - self.sold)
+
 class Tournament(models.Model):
     name = models.CharField(max_length=200)
     sport = models.CharField(max_length=100)
@@ -162,13 +459,47 @@ class Tournament(models.Model):
     registration_deadline = models.DateField(null=True, blank=True)
     image = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=50, default='Registration Open') 
+    # Sum of live registration fees, maintained incrementally by SportsRegistration.save()
+    prize_pool = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    # Live registrations not yet eliminated, maintained by SportsRegistration.save()
+    remaining_participants = models.IntegerField(default=0)
     is_deleted = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['id'], name='tournament_live_idx'),
+            LiveRowsIndex(fields=['status', 'registration_deadline'], name='tournament_live_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.sport})"
 
-class SportsRegistration(models.Model):
+    @property
+    def accepts_registrations(self):
+        # Closed by the scheduler, or past the deadline before the next sweep has run
+        if self.status != 'Registration Open':
+            return False
+        return self.registration_deadline is None or self.registration_deadline >= timezone.localdate()
+
+    def recalculate_prize_pool(self):
+        # Full recount, for repairs after bulk updates that bypass save()
+        total = self.sportsregistration_set.alive().aggregate(models.Sum('price'))['price__sum'] or 0
+        Tournament.objects.with_deleted().filter(pk=self.pk).update(prize_pool=total)
+        self.prize_pool = total
+        return total
+
+    def recalculate_remaining(self):
+        remaining = self.sportsregistration_set.alive().exclude(status='Eliminated').count()
+        Tournament.objects.with_deleted().filter(pk=self.pk).update(remaining_participants=remaining)
+        self.remaining_participants = remaining
+        return remaining
+
+class SportsRegistration(RevenueRollupMixin, models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE)
     registration_type = models.CharField(max_length=50) # Team, Individual
@@ -183,9 +514,90 @@ class SportsRegistration(models.Model):
     status = models.CharField(max_length=50, default='Confirmed')
     is_deleted = models.BooleanField(default=False)
 
+    rollup_line = 'sports'
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['user', 'id'], name='sportsreg_live_user_idx'),
+            LiveRowsIndex(fields=['id'], name='sportsreg_live_idx'),
+            LiveRowsIndex(fields=['tournament', 'status'], name='sportsreg_live_tournament_idx'),
+            LiveRowsIndex(fields=['status', 'id'], name='sportsreg_live_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.tournament.name} ({self.registration_type})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_pool_state()
+        return instance
+
+    def _remember_pool_state(self, load_deferred=False):
+        # What this row currently contributes to its tournament's prize pool
+        # and to its count of remaining participants. With load_deferred, columns
+        # left out of the query are read now instead of skipping the row.
+        deferred = set() if load_deferred else self.get_deferred_fields()
+        self._loaded_status = self.__dict__.get('status')
+        if self.is_deleted or 'price' in deferred:
+            self._pool_contribution = None
+        else:
+            self._pool_contribution = (self.tournament_id, self.price)
+        if self.is_deleted or 'status' in deferred or self.status == 'Eliminated':
+            self._remaining_in = None
+        else:
+            self._remaining_in = self.tournament_id
+
+    @property
+    def previous_status(self):
+        return getattr(self, '_loaded_status', None)
+
+    def _apply_pool_delta(self, old, new):
+        if old == new:
+            return
+        if old:
+            Tournament.objects.with_deleted().filter(pk=old[0]).update(prize_pool=models.F('prize_pool') - old[1])
+        if new:
+            Tournament.objects.with_deleted().filter(pk=new[0]).update(prize_pool=models.F('prize_pool') + new[1])
+        from .caching import invalidate_catalog
+        invalidate_catalog('tournament')
+
+    def _apply_remaining_delta(self, old, new):
+        if old == new:
+            return
+        if old:
+            Tournament.objects.with_deleted().filter(pk=old).update(remaining_participants=models.F('remaining_participants') - 1)
+        if new:
+            Tournament.objects.with_deleted().filter(pk=new).update(remaining_participants=models.F('remaining_participants') + 1)
+
+    def _loaded_pool_state(self):
+        if not self._state.adding and {'price', 'status', 'is_deleted', 'tournament_id'} & self.get_deferred_fields():
+            # Loaded with deferred columns: read what the row held before this save
+            old = type(self)._base_manager.filter(pk=self.pk).first()
+            if old:
+                return old._pool_contribution, old._remaining_in
+        return getattr(self, '_pool_contribution', None), getattr(self, '_remaining_in', None)
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            old, old_remaining = self._loaded_pool_state()
+            super().save(*args, **kwargs)
+            self._remember_pool_state(load_deferred=True)
+            self._apply_pool_delta(old, self._pool_contribution)
+            self._apply_remaining_delta(old_remaining, self._remaining_in)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            old, old_remaining = self._loaded_pool_state()
+            result = super().delete(*args, **kwargs)
+            self._apply_pool_delta(old, None)
+            self._apply_remaining_delta(old_remaining, None)
+        return result
+
 # --- New Model for Job Applications ---
 class JobApplication(models.Model):
     full_name = models.CharField(max_length=200)
@@ -198,9 +610,33 @@ class JobApplication(models.Model):
     is_deleted = models.BooleanField(default=False)
     applied_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['applied_at'], name='jobapplication_live_idx'),
+            LiveRowsIndex(fields=['position'], name='jobapplication_live_pos_idx'),
+        ]
+
     def __str__(self):
         return f"{self.full_name} - {self.position}"
 
+class StaffNotification(models.Model):
+    # One row per (booking, staff member) that has been told about the work
+    booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='staff_notifications')
+    application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, related_name='notifications')
+    notified_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['booking', 'application'], name='unique_staff_notification'),
+        ]
+
+    def __str__(self):
+        return f"Booking #{self.booking_id} -> {self.application_id}"
+
 class Fixture(models.Model):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name='fixtures')
     round_number = models.CharField(max_length=50, default='1')
@@ -208,13 +644,33 @@ class Fixture(models.Model):
     player2 = models.ForeignKey(SportsRegistration, on_delete=models.SET_NULL, related_name='fixtures_as_p2', null=True, blank=True)
     winner = models.ForeignKey(SportsRegistration, on_delete=models.SET_NULL, related_name='won_fixtures', null=True, blank=True)
     match_date = models.DateTimeField(null=True, blank=True)
-    status = models.CharField(max_length=50, default='Scheduled') # Scheduled, Completed
+    status = models.CharField(max_length=50, default='Scheduled') # Scheduled, Completed, Bye
+    # Generated brackets (main/brackets.py): match index within the round, and
+    # the fixture/slot (1 or 2) the winner moves on to
+    bracket_position = models.PositiveIntegerField(null=True, blank=True)
+    next_fixture = models.ForeignKey('self', on_delete=models.SET_NULL, related_name='feeder_fixtures', null=True, blank=True)
+    next_slot = models.PositiveSmallIntegerField(null=True, blank=True)
 
     def __str__(self):
         p1 = self.player1.team_name if self.player1 and self.player1.team_name else (self.player1.player_name if self.player1 else "TBD")
         p2 = self.player2.team_name if self.player2 and self.player2.team_name else (self.player2.player_name if self.player2 else "TBD")
         return f"{self.tournament.name} - R{self.round_number}: {p1} vs {p2}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Winner as loaded, so results are only applied when the winner changes
+        instance._loaded_winner_id = instance.__dict__.get('winner_id')
+        return instance
+
+    @property
+    def previous_winner_id(self):
+        return getattr(self, '_loaded_winner_id', None)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_winner_id = self.winner_id
+
 class Blog(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
@@ -226,5 +682,121 @@ class Blog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        default_manager_name = 'all_objects'
+        indexes = [
+            LiveRowsIndex(fields=['is_published', 'created_at'], name='blog_live_published_idx'),
+            LiveRowsIndex(fields=['created_at'], name='blog_live_idx'),
+        ]
+
     def __str__(self):
         return self.title
+
+# --- Background Jobs ---
+class JobLock(models.Model):
+    # One row per lock name. Whoever holds an unexpired lease is the leader
+    # and is the only process allowed to run the periodic jobs.
+    name = models.CharField(max_length=100, unique=True)
+    owner = models.CharField(max_length=200, blank=True, default='')
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_heartbeat = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.owner or 'free'})"
+
+# --- Email Outbox ---
+class OutboundEmail(models.Model):
+    STATUS_CHOICES = (
+        ('Pending', 'Pending'),
+        ('Sending', 'Sending'),
+        ('Sent', 'Sent'),
+        ('Failed', 'Failed'),
+    )
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254, blank=True, default='')
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+# --- Reporting ---
+class DailyRevenue(models.Model):
+    # Revenue rollup per (day, product line, status), kept up to date by
+    # RevenueRollupMixin and rebuilt by `manage.py rebuild_revenue_rollups`
+    day = models.DateField()
+    product_line = models.CharField(max_length=20)
+    status = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    refunds = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    cancellation_fees = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'product_line', 'status'], name='unique_daily_revenue_bucket'),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.product_line}/{self.status}: {self.count} ({self.revenue})"
+
+# --- Search ---
+class SearchPosting(models.Model):
+    # Inverted index of the public catalog (see main/search.py): one row per
+    # (term, document) with the term's field-weighted frequency in it
+    term = models.CharField(max_length=64)
+    doc_type = models.CharField(max_length=20)
+    doc_id = models.IntegerField()
+    weight = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'doc_type', 'doc_id'], name='unique_search_posting'),
+        ]
+        indexes = [models.Index(fields=['doc_type', 'doc_id'], name='search_posting_doc_idx')]
+
+    def __str__(self):
+        return f"{self.term} -> {self.doc_type}#{self.doc_id} ({self.weight})"
+
+# --- Availability ---
+class ResourceReservation(models.Model):
+    # One row per (resource, day) held by an approved wedding, kept in step by
+    # main/availability.py. resource is 'decoration:<id>' or 'performer:<name>'.
+    resource = models.CharField(max_length=160)
+    day = models.DateField()
+    booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='reservations')
+    label = models.CharField(max_length=150, blank=True, default='')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['resource', 'day'], name='unique_resource_day'),
+        ]
+        indexes = [models.Index(fields=['day', 'resource'], name='reservation_day_idx')]
+
+    def __str__(self):
+        return f"{self.resource} on {self.day} (booking #{self.booking_id})"
+
+# Type keys the admin endpoints (restore, export) use for soft-deletable tables
+ADMIN_ITEM_TYPES = {
+    'wedding': Booking,
+    'concert': ConcertBooking,
+    'festival': FestivalBooking,
+    'tournament': Tournament,
+    'sports-registration': SportsRegistration,
+    'job': JobApplication,
+    'blog': Blog,
+    'concert-master': Concert,
+    'festival-master': Festival,
+}
@@ -0,0 +1,33 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    # Cursor (keyset) pagination keyed on each view's own order_by, so page N
+    # costs the same as page 1. Cursors are opaque base64 tokens from DRF.
+    #
+    # Pagination is opt-in: a request without ?cursor= or ?page_size= still
+    # gets the plain list the frontend has always received.
+    page_size = getattr(settings, 'API_PAGE_SIZE', 25)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 200)
+    ordering = '-id'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        # Reuse the ordering the view already applied ('-id', '-applied_at', ...)
+        ordering = tuple(queryset.query.order_by)
+        if ordering:
+            # Keep a unique tie breaker so rows sharing a timestamp page stably
+            if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+                ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+            return ordering
+        return super().get_ordering(request, queryset, view)
@@ -0,0 +1,171 @@
+import threading
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.conf import settings
+
+from .caching import catalog_version
+from .models import Decoration, CateringPackage, PerformerPackage
+
+# --- WEDDING QUOTES ---
+# Prices a wedding configuration on the server, using the same arithmetic the
+# invoice page applies: catering per plate times guests, plus decorations and
+# the performer, plus GST, with half the total due up front. Each process
+# keeps the price list in memory. The list is tied to the catalog versions in
+# main/caching.py, so any write to a decoration or package drops it everywhere,
+# and it is rebuilt after PRICE_CATALOG_TTL seconds in case a bump was missed.
+
+PRICE_CATALOGS = ('decoration', 'cateringpackage', 'performerpackage')
+GST_RATE = Decimal('0.18')
+ADVANCE_SHARE = Decimal('0.5')
+MAX_BATCH_QUOTES = 100
+# The booking fields a quote is worked out from
+PRICING_INPUTS = ('guests', 'catering_package', 'selected_decoration', 'decorations', 'performer_name')
+CENT = Decimal('0.01')
+
+
+class QuoteError(Exception):
+    pass
+
+
+def _name_key(name):
+    return ' '.join(str(name or '').lower().split())
+
+
+def _money(value):
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def build_price_catalog():
+    decorations = {pk: (name, price) for pk, name, price in Decoration.objects.values_list('pk', 'name', 'price')}
+    return {
+        'decorations': decorations,
+        'decoration_names': {_name_key(name): pk for pk, (name, _) in decorations.items()},
+        'catering': {_name_key(name): (name, price) for name, price in
+                     CateringPackage.objects.filter(is_active=True).values_list('name', 'price_per_plate')},
+        'performers': {_name_key(name): (name, price) for name, price in
+                       PerformerPackage.objects.filter(is_active=True).values_list('name', 'price')},
+    }
+
+
+_price_catalog = {'version': None, 'catalog': None, 'expires': 0.0}
+_price_catalog_lock = threading.Lock()
+
+
+def _price_catalog_is_current(version):
+    return _price_catalog['version'] == version and time.monotonic() < _price_catalog['expires']
+
+
+def price_catalog():
+    # This process's copy, rebuilt when any of the catalogs it reads has changed
+    version = tuple(catalog_version(name) for name in PRICE_CATALOGS)
+    if not _price_catalog_is_current(version):
+        with _price_catalog_lock:
+            if not _price_catalog_is_current(version):
+                _price_catalog['catalog'] = build_price_catalog()
+                _price_catalog['version'] = version
+                _price_catalog['expires'] = time.monotonic() + getattr(settings, 'PRICE_CATALOG_TTL', 300)
+    return _price_catalog['catalog']
+
+
+def _decoration_ids(configuration, catalog):
+    # selected_decoration (as on Booking) plus an optional list of ids or names
+    wanted = [configuration.get('selected_decoration')] + list(configuration.get('decorations') or [])
+    ids = []
+    for item in wanted:
+        if item in (None, ''):
+            continue
+        if isinstance(item, Decoration):
+            item = item.pk
+        pk = item if isinstance(item, int) else catalog['decoration_names'].get(_name_key(item))
+        if pk is None and str(item).isdigit():
+            pk = int(item)
+        if pk not in catalog['decorations']:
+            raise QuoteError(f"Unknown decoration: {item}")
+        if pk not in ids:
+            ids.append(pk)
+    return ids
+
+
+def quote(configuration, catalog=None, decoration=None):
+    # configuration: {guests, catering_package, selected_decoration, decorations, performer_name}.
+    # decoration: a (name, price) already on a booking, kept as is instead of
+    # looking the decorations up again (used when an edit does not touch them).
+    catalog = catalog or price_catalog()
+    try:
+        guests = int(configuration.get('guests') or 0)
+    except (TypeError, ValueError):
+        raise QuoteError("guests must be a whole number.")
+    if guests < 0:
+        raise QuoteError("guests cannot be negative.")
+
+    catering_name, per_plate = '', Decimal('0')
+    if configuration.get('catering_package'):
+        entry = catalog['catering'].get(_name_key(configuration['catering_package']))
+        if entry is None:
+            raise QuoteError(f"Unknown catering package: {configuration['catering_package']}")
+        catering_name, per_plate = entry
+
+    if decoration is None:
+        decoration_ids = _decoration_ids(configuration, catalog)
+        decoration_name = ', '.join(catalog['decorations'][pk][0] for pk in decoration_ids)
+        decoration_price = sum((catalog['decorations'][pk][1] for pk in decoration_ids), Decimal('0'))
+        selected = decoration_ids[0] if decoration_ids else None
+    else:
+        decoration_name, decoration_price = decoration[0] or '', Decimal(decoration[1] or 0)
+        selected = configuration.get('selected_decoration')
+        selected = selected.pk if isinstance(selected, Decoration) else selected
+        decoration_ids = list(configuration.get('decoration_ids') or ([selected] if selected else []))
+
+    performer_name, performer_price = '', Decimal('0')
+    if configuration.get('performer_name'):
+        entry = catalog['performers'].get(_name_key(configuration['performer_name']))
+        if entry is None:
+            raise QuoteError(f"Unknown performer: {configuration['performer_name']}")
+        performer_name, performer_price = entry
+
+    catering_total = per_plate * guests
+    subtotal = _money(catering_total + decoration_price + performer_price)
+    gst = _money(subtotal * GST_RATE)
+    total = subtotal + gst
+    advance = _money(total * ADVANCE_SHARE)
+    return {
+        'guests': guests,
+        'catering_package': catering_name,
+        'catering_price': _money(per_plate),
+        'catering_total': _money(catering_total),
+        'selected_decoration': selected,
+        'decoration_ids': decoration_ids,
+        'decoration_name': decoration_name,
+        'decoration_price': _money(decoration_price),
+        'performer_name': performer_name,
+        'performer_price': _money(performer_price),
+        'subtotal': subtotal,
+        'gst': gst,
+        'total_cost': total,
+        'advance_amount': advance,
+        'balance_amount': total - advance,
+    }
+
+
+def quote_many(configurations):
+    # One catalog lookup for the whole batch; a bad entry gets its own error
+    catalog = price_catalog()
+    results = []
+    for configuration in configurations:
+        if not isinstance(configuration, dict):
+            results.append({'error': "Each configuration must be an object."})
+            continue
+        try:
+            results.append(quote(configuration, catalog))
+        except QuoteError as e:
+            results.append({'error': str(e)})
+    return results
+
+
+def booking_totals(quoted):
+    # The Booking columns a quote fills in. The decorations go in too, so the
+    # availability checks see every set the wedding was priced for.
+    fields = ('catering_package', 'catering_price', 'decoration_ids', 'decoration_name', 'decoration_price',
+              'performer_name', 'performer_price', 'total_cost', 'advance_amount', 'balance_amount')
+    return {'selected_decoration_id': quoted['selected_decoration'], **{field: quoted[field] for field in fields}}
@@ -0,0 +1,273 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Booking, ConcertBooking, FestivalBooking, SportsRegistration, JobApplication, Blog, Concert, Festival, Tournament, DailyRevenue
+
+# --- ADMIN DASHBOARD SUMMARY ---
+# Every product line is reduced to one GROUP BY status query, so the dashboard
+# overview costs a few small queries instead of downloading every row.
+
+ZERO = Decimal('0')
+
+# name -> (model, amount field or None, has refund/cancellation columns)
+PRODUCT_LINES = {
+    'weddings': (Booking, 'total_cost', True),
+    'concerts': (ConcertBooking, 'total_price', True),
+    'festivals': (FestivalBooking, 'total_price', True),
+    'sports': (SportsRegistration, 'price', False),
+    'jobs': (JobApplication, None, False),
+}
+
+
+def _money(value):
+    return str((value or ZERO).quantize(Decimal('0.01')))
+
+
+def summarize_line(model, amount_field=None, with_refunds=False):
+    live = Q(is_deleted=False)
+    aggregates = {
+        'count': Count('pk', filter=live),
+        'deleted': Count('pk', filter=Q(is_deleted=True)),
+    }
+    if amount_field:
+        aggregates['revenue'] = Sum(amount_field, filter=live)
+    if with_refunds:
+        aggregates['refunds'] = Sum('refund_amount', filter=live)
+        aggregates['cancellation_fees'] = Sum('cancellation_fee', filter=live)
+    if model in (ConcertBooking, FestivalBooking):
+        aggregates['tickets'] = Sum('quantity', filter=live)
+
+    rows = model.objects.with_deleted().order_by().values('status').annotate(**aggregates)
+
+    money_keys = [key for key in ('revenue', 'refunds', 'cancellation_fees') if key in aggregates]
+    totals = {'count': 0, 'deleted': 0, **{key: ZERO for key in money_keys}}
+    if 'tickets' in aggregates:
+        totals['tickets'] = 0
+    by_status = {}
+    for row in rows:
+        status = row.pop('status')
+        totals['deleted'] += row.pop('deleted')
+        if not row['count']:
+            continue
+        for key, value in row.items():
+            totals[key] += value or 0
+        by_status[status] = {key: _money(value) if key in money_keys else (value or 0) for key, value in row.items()}
+
+    if 'revenue' in totals:
+        totals['net_revenue'] = totals['revenue'] - totals.get('refunds', ZERO)
+        money_keys.append('net_revenue')
+    for key in money_keys:
+        totals[key] = _money(totals[key])
+    return {**totals, 'by_status': by_status}
+
+
+def admin_summary():
+    summary = {name: summarize_line(*line) for name, line in PRODUCT_LINES.items()}
+    summary['sports']['winnings'] = _money(
+        SportsRegistration.objects.alive().aggregate(total=Sum('winning_amount'))['total']
+    )
+    summary['tournaments'] = summarize_line(Tournament)
+    summary['blogs'] = Blog.objects.with_deleted().aggregate(
+        count=Count('pk', filter=Q(is_deleted=False)),
+        published=Count('pk', filter=Q(is_deleted=False, is_published=True)),
+        drafts=Count('pk', filter=Q(is_deleted=False, is_published=False)),
+        deleted=Count('pk', filter=Q(is_deleted=True)),
+    )
+    for name, model in (('concert_catalog', Concert), ('festival_catalog', Festival)):
+        summary[name] = model.objects.with_deleted().aggregate(
+            count=Count('pk', filter=Q(is_deleted=False)),
+            deleted=Count('pk', filter=Q(is_deleted=True)),
+        )
+    summary['revenue'] = _money(sum(Decimal(summary[name].get('revenue', '0')) for name in PRODUCT_LINES))
+    return summary
+
+
+# --- DAILY REVENUE ROLLUPS ---
+# DailyRevenue holds one row per (day, product line, status). Saves move a
+# booking's contribution between buckets with F() deltas, so date range reports
+# read O(days) rows instead of scanning every booking.
+
+# line -> (model name, amount field, date field, has refund/cancellation columns)
+ROLLUP_LINES = {
+    'weddings': ('Booking', 'total_cost', 'booking_date', True),
+    'concerts': ('ConcertBooking', 'total_price', 'booking_date', True),
+    'festivals': ('FestivalBooking', 'total_price', 'booking_date', True),
+    'sports': ('SportsRegistration', 'price', 'registration_date', False),
+}
+
+
+def _decimal(value):
+    return value if isinstance(value, Decimal) else Decimal(str(value or 0))
+
+
+def rollup_contribution(instance):
+    # ((day, line, status), (count, revenue, refunds, fees)) for one row, or None
+    _, amount_field, date_field, with_refunds = ROLLUP_LINES[instance.rollup_line]
+    needed = {'is_deleted', 'status', amount_field, date_field}
+    if with_refunds:
+        needed |= {'refund_amount', 'cancellation_fee'}
+    if needed & instance.get_deferred_fields():
+        return None
+
+    created = getattr(instance, date_field)
+    if instance.is_deleted or created is None:
+        return None
+    refunds = _decimal(instance.refund_amount) if with_refunds else ZERO
+    fees = _decimal(instance.cancellation_fee) if with_refunds else ZERO
+    key = (timezone.localdate(created), instance.rollup_line, instance.status)
+    return key, (1, _decimal(getattr(instance, amount_field)), refunds, fees)
+
+
+def _bump_rollup(key, values, sign):
+    day, line, status = key
+    count, revenue, refunds, fees = values
+    row, _ = DailyRevenue.objects.get_or_create(day=day, product_line=line, status=status)
+    DailyRevenue.objects.filter(pk=row.pk).update(
+        count=F('count') + sign * count,
+        revenue=F('revenue') + sign * revenue,
+        refunds=F('refunds') + sign * refunds,
+        cancellation_fees=F('cancellation_fees') + sign * fees,
+    )
+
+
+def apply_rollup_delta(old, new):
+    if old == new:
+        return
+    if old:
+        _bump_rollup(*old, -1)
+    if new:
+        _bump_rollup(*new, 1)
+
+
+def rollup_groups(queryset, line):
+    # Aggregated contributions of a queryset, grouped the same way as the rollup
+    _, amount_field, date_field, with_refunds = ROLLUP_LINES[line]
+    rows = queryset.filter(is_deleted=False, **{f'{date_field}__isnull': False}).order_by().values(
+        'status', day=TruncDate(date_field)
+    ).annotate(
+        count=Count('pk'),
+        revenue=Sum(amount_field),
+        refunds=Sum('refund_amount') if with_refunds else Value(ZERO),
+        fees=Sum('cancellation_fee') if with_refunds else Value(ZERO),
+    )
+    return [
+        ((row['day'], line, row['status']),
+         (row['count'], _decimal(row['revenue']), _decimal(row['refunds']), _decimal(row['fees'])))
+        for row in rows
+    ]
+
+
+def move_rollup_status(queryset, line, status):
+    # For bulk .update(status=...) calls, which bypass save(): call before
+    # updating, in the same transaction. The rows are locked first so a
+    # concurrent save cannot move one of them between this read and the update.
+    locked = list(queryset.select_for_update().values_list('pk', flat=True))
+    for key, values in rollup_groups(queryset.model._base_manager.filter(pk__in=locked), line):
+        if key[2] != status:
+            apply_rollup_delta((key, values), ((key[0], line, status), values))
+
+
+def rebuild_rollups(batch_size=1000):
+    # Recomputes every bucket from the source tables, one primary key range at a
+    # time, then swaps the table contents in a single transaction
+    buckets = {}
+    for line, (model_name, *_rest) in ROLLUP_LINES.items():
+        model = globals()[model_name]
+        last_pk = 0
+        while True:
+            pks = list(model.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            last_pk = pks[-1]
+            for key, values in rollup_groups(model.objects.filter(pk__gte=pks[0], pk__lte=last_pk), line):
+                totals = buckets.get(key, (0, ZERO, ZERO, ZERO))
+                buckets[key] = tuple(a + b for a, b in zip(totals, values))
+
+    with transaction.atomic():
+        DailyRevenue.objects.all().delete()
+        DailyRevenue.objects.bulk_create([
+            DailyRevenue(day=day, product_line=line, status=status, count=count,
+                         revenue=revenue, refunds=refunds, cancellation_fees=fees)
+            for (day, line, status), (count, revenue, refunds, fees) in sorted(buckets.items())
+        ], batch_size=batch_size)
+    return len(buckets)
+
+
+def revenue_by_day(start, end, lines=None):
+    # {'days': [{day, line: {count, revenue, refunds, cancellation_fees}}], 'totals': {...}}
+    rows = DailyRevenue.objects.filter(day__gte=start, day__lte=end).exclude(count=0)
+    if lines:
+        rows = rows.filter(product_line__in=lines)
+    rows = rows.order_by('day').values('day', 'product_line').annotate(
+        bookings=Sum('count'), gross=Sum('revenue'), refunded=Sum('refunds'), fees=Sum('cancellation_fees')
+    )
+
+    days, totals = {}, {}
+    for row in rows:
+        values = {'count': row['bookings'], 'revenue': row['gross'], 'refunds': row['refunded'],
+                  'cancellation_fees': row['fees']}
+        days.setdefault(row['day'], {})[row['product_line']] = values
+        line_total = totals.setdefault(row['product_line'], {'count': 0, 'revenue': ZERO, 'refunds': ZERO,
+                                                             'cancellation_fees': ZERO})
+        for key, value in values.items():
+            line_total[key] += value or 0
+
+    def money(values):
+        return {key: value if key == 'count' else _money(value) for key, value in values.items()}
+
+    return {
+        'days': [{'day': day.isoformat(), **{line: money(v) for line, v in by_line.items()}} for day, by_line in days.items()],
+        'totals': {line: money(v) for line, v in totals.items()},
+    }
+
+
+# --- HALL OF FAME ---
+# The public winners list is a snapshot kept in the shared cache. It is rebuilt
+# when a winner row, a tournament or a username changes, so reads never touch
+# the database. The timeout bounds how long a missed rebuild can serve stale rows.
+
+HALL_OF_FAME_KEY = 'hall-of-fame:snapshot'
+
+
+def hall_of_fame_timeout():
+    return getattr(settings, 'HALL_OF_FAME_TIMEOUT', 3600)
+
+
+def build_hall_of_fame():
+    rows = (
+        SportsRegistration.objects.alive().filter(status='Winner', tournament__is_deleted=False)
+        .order_by('-id')
+        .values('id', 'tournament_id', 'tournament__name', 'tournament__sport', 'team_name', 'player_name',
+                'user__username', 'price', 'winning_amount')
+    )
+    return [
+        {
+            'id': row['id'],
+            'tournament_id': row['tournament_id'],
+            'tournament': row['tournament__name'],
+            'sport': row['tournament__sport'],
+            'winner': row['team_name'] or row['player_name'] or row['user__username'],
+            'prize': _money((row['price'] or ZERO) + (row['winning_amount'] or ZERO)),
+        }
+        for row in rows
+    ]
+
+
+def refresh_hall_of_fame():
+    snapshot = build_hall_of_fame()
+    cache.set(HALL_OF_FAME_KEY, snapshot, hall_of_fame_timeout())
+    return snapshot
+
+
+def hall_of_fame():
+    snapshot = cache.get(HALL_OF_FAME_KEY)
+    if snapshot is None:
+        # Cold or evicted cache
+        snapshot = refresh_hall_of_fame()
+    return snapshot
@@ -0,0 +1,151 @@
+import math
+import re
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+from django.db.models.functions import Substr
+
+from .models import Concert, Festival, Blog, Tournament, SearchPosting
+
+# --- CATALOG SEARCH ---
+# A portable inverted index: SearchPosting holds one row per (term, document)
+# with a field-weighted term frequency. Saves reindex their document, and a
+# query reads only the postings of its own terms. Ranking is tf-idf style:
+# documents that have every query term are scored by their weights, and rarer
+# terms count for more.
+
+# type -> (model name, {field: weight}, title field, snippet field or None)
+SEARCH_DOCUMENTS = {
+    'concert': ('Concert', {'title': 5, 'artist': 4, 'genre': 2, 'city': 2, 'description': 1}, 'title', 'description'),
+    'festival': ('Festival', {'name': 5, 'theme': 3, 'about': 1}, 'name', 'about'),
+    'blog': ('Blog', {'title': 5, 'content': 1}, 'title', 'content'),
+    'tournament': ('Tournament', {'name': 5, 'sport': 3}, 'name', None),
+}
+MAX_TERM_LENGTH = 64
+# Repeats of a term within one field stop adding weight after this many
+MAX_FIELD_HITS = 10
+STOPWORDS = frozenset(
+    'a an and are as at be by for from in is it of on or that the this to was with will'.split()
+)
+SNIPPET_LENGTH = 200
+
+_TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in _TOKEN.findall((text or '').lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def is_searchable(instance):
+    if getattr(instance, 'is_deleted', False):
+        return False
+    return getattr(instance, 'is_published', True)
+
+
+def term_weights(instance, fields):
+    weights = Counter()
+    for field, field_weight in fields.items():
+        for term, hits in Counter(tokenize(getattr(instance, field))).items():
+            weights[term] += field_weight * min(hits, MAX_FIELD_HITS)
+    return weights
+
+
+def _postings(instance, doc_type):
+    if not is_searchable(instance):
+        return []
+    _, fields, _, _ = SEARCH_DOCUMENTS[doc_type]
+    return [
+        SearchPosting(term=term, doc_type=doc_type, doc_id=instance.pk, weight=weight)
+        for term, weight in term_weights(instance, fields).items()
+    ]
+
+
+def index_document(instance):
+    doc_type = instance._meta.model_name
+    with transaction.atomic():
+        SearchPosting.objects.filter(doc_type=doc_type, doc_id=instance.pk).delete()
+        SearchPosting.objects.bulk_create(_postings(instance, doc_type))
+
+
+def remove_document(instance):
+    SearchPosting.objects.filter(doc_type=instance._meta.model_name, doc_id=instance.pk).delete()
+
+
+def rebuild_search_index(batch_size=500):
+    # Reindexes every document one primary key range at a time
+    total = 0
+    with transaction.atomic():
+        SearchPosting.objects.all().delete()
+        for doc_type, (model_name, fields, _, _) in SEARCH_DOCUMENTS.items():
+            model = globals()[model_name]
+            last_pk = 0
+            while True:
+                batch = list(model._base_manager.filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+                postings = [p for instance in batch for p in _postings(instance, doc_type)]
+                SearchPosting.objects.bulk_create(postings, batch_size=1000)
+                total += sum(1 for instance in batch if is_searchable(instance))
+    return total
+
+
+def search(query, types=None, offset=0, limit=20):
+    # Returns (total matches, [{type, id, title, snippet, score}, ...])
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return 0, []
+
+    postings = SearchPosting.objects.filter(term__in=terms)
+    if types:
+        postings = postings.filter(doc_type__in=types)
+
+    # Document frequency per term, from the same index
+    frequencies = dict(postings.order_by().values_list('term').annotate(df=Count('pk')))
+    if len(frequencies) < len(terms):
+        return 0, []
+    idf = Case(*[When(term=term, then=Value(1 / math.log(2 + df))) for term, df in frequencies.items()],
+               default=Value(0.0), output_field=FloatField())
+
+    matches = (
+        postings.values('doc_type', 'doc_id')
+        .annotate(hits=Count('term'), score=Sum(F('weight') * idf, output_field=FloatField()))
+        .filter(hits=len(terms))
+    )
+    total = matches.count()
+    page = list(matches.order_by('-score', 'doc_type', 'doc_id')[offset:offset + limit])
+    return total, _hydrate(page)
+
+
+def _hydrate(page):
+    # One query per document type on the page
+    ids_by_type = {}
+    for row in page:
+        ids_by_type.setdefault(row['doc_type'], []).append(row['doc_id'])
+
+    documents = {}
+    for doc_type, ids in ids_by_type.items():
+        model_name, _, title_field, snippet_field = SEARCH_DOCUMENTS[doc_type]
+        rows = globals()[model_name].objects.filter(pk__in=ids)
+        if snippet_field:
+            rows = rows.annotate(snippet=Substr(snippet_field, 1, SNIPPET_LENGTH)).values('pk', title_field, 'snippet')
+        else:
+            rows = rows.values('pk', title_field)
+        for row in rows:
+            documents[(doc_type, row['pk'])] = (row[title_field], row.get('snippet', ''))
+
+    results = []
+    for row in page:
+        key = (row['doc_type'], row['doc_id'])
+        if key not in documents:
+            # Deleted since it was indexed
+            continue
+        title, snippet = documents[key]
+        results.append({'type': row['doc_type'], 'id': row['doc_id'], 'title': title, 'snippet': snippet,
+                        'score': round(row['score'], 4)})
+    return results
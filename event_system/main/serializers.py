@@ -1,6 +1,100 @@
+from django.conf import settings
+from django.db.models.functions import Substr
 from rest_framework import serializers
+from .inventory import sold_by_tier
+from .auth import is_admin
+from .images import srcset_for
+from .media import InvalidMedia, extract_inline_image, is_data_url
 from .models import User, Decoration, Booking, ConcertBooking, FestivalBooking, Tournament, SportsRegistration, JobApplication, Fixture, Blog, Concert, Festival
 
+# --- EAGER LOADING ---
+# Every serializer declares the relations it reads. Views apply the plan through
+# EagerLoadingViewMixin, so a list of N rows costs the same number of queries as 1.
+class EagerLoadingMixin:
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    only_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        if cls.only_fields:
+            queryset = queryset.only(*cls.only_fields)
+        return queryset
+
+# --- SPARSE FIELDSETS ---
+# ?fields=id,title keeps only those fields, ?exclude=description drops fields.
+# Works on every serializer below; views also narrow the SQL with only().
+def _split_param(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+class SparseFieldsetMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+        keep = _split_param(request.query_params.get('fields'))
+        drop = _split_param(request.query_params.get('exclude'))
+        if keep:
+            for name in set(self.fields) - set(keep):
+                self.fields.pop(name)
+        for name in drop:
+            self.fields.pop(name, None)
+
+    def sparse_only_fields(self, model):
+        # Model columns the remaining fields read, or None when that cannot be
+        # known (method fields / whole-object sources need the full row).
+        concrete = {f.name for f in model._meta.concrete_fields}
+        needed = {model._meta.pk.name}
+        for field in self.fields.values():
+            if isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+                return None
+            root = field.source.split('.')[0]
+            if root not in concrete:
+                return None
+            needed.add(root)
+        for path in getattr(self, 'select_related_fields', ()):
+            needed.add(path.split('__')[0])
+        return sorted(needed)
+
+# --- INLINE IMAGES ---
+# Base64 data URLs pasted into image fields are moved into the content-addressed
+# media store on write; the column only keeps the resulting /media/ URL.
+# Only admins may add files to the store.
+class InlineMediaMixin:
+    media_fields = ()
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        request = self.context.get('request')
+        for name in self.media_fields:
+            if is_data_url(attrs.get(name)) and not (request and is_admin(request.user)):
+                raise serializers.ValidationError({name: "Only admins can upload images."})
+            if attrs.get(name):
+                try:
+                    attrs[name] = extract_inline_image(attrs[name])
+                except InvalidMedia as e:
+                    raise serializers.ValidationError({name: str(e)})
+        return attrs
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Stored references are site-relative; the frontend runs on another origin
+        request = self.context.get('request')
+        if request is not None:
+            for name in self.media_fields:
+                value = data.get(name)
+                if isinstance(value, str) and value.startswith(settings.MEDIA_URL):
+                    srcset = srcset_for(value, request.build_absolute_uri)
+                    if srcset:
+                        data[f"{name}_srcset"] = srcset
+                    data[name] = request.build_absolute_uri(value)
+        return data
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -16,45 +110,80 @@ class UserSerializer(serializers.ModelSerializer):
         )
         return user
 
-class DecorationSerializer(serializers.ModelSerializer):
+class DecorationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Decoration
         fields = '__all__'
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
     decoration_details = DecorationSerializer(source='selected_decoration', read_only=True)
     user_email = serializers.EmailField(source='user.email', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
+
+    # Names or ids of the styles picked on the decoration page, priced by the server
+    decorations = serializers.ListField(child=serializers.CharField(), write_only=True, required=False)
+
+    select_related_fields = ('user', 'selected_decoration')
     
     class Meta:
         model = Booking
         fields = '__all__'
-        read_only_fields = ['user', 'status']
+        # Prices and totals are filled in from the quote engine (main/quotes.py)
+        read_only_fields = ['user', 'status', 'catering_price', 'decoration_name', 'decoration_price',
+                            'performer_price', 'total_cost', 'advance_amount', 'balance_amount']
+
+    def create(self, validated_data):
+        validated_data.pop('decorations', None)
+        return super().create(validated_data)
 
-class ConcertBookingSerializer(serializers.ModelSerializer):
+    def update(self, instance, validated_data):
+        validated_data.pop('decorations', None)
+        return super().update(instance, validated_data)
+
+class ConcertBookingSerializer(SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
+
+    select_related_fields = ('user',)
     
     class Meta:
         model = ConcertBooking
         fields = '__all__'
         read_only_fields = ['user']
+        # The default manager includes soft-deleted rows; only live concerts can be booked
+        extra_kwargs = {'concert': {'queryset': Concert.objects.all()}}
 
-class FestivalBookingSerializer(serializers.ModelSerializer):
+    def validate_quantity(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Quantity must be at least 1.")
+        return value
+
+class FestivalBookingSerializer(SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
+
+    select_related_fields = ('user',)
     
     class Meta:
         model = FestivalBooking
         fields = '__all__'
         read_only_fields = ['user']
+        extra_kwargs = {'festival': {'queryset': Festival.objects.all()}}
+
+    def validate_quantity(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Quantity must be at least 1.")
+        return value
+
+class TournamentSerializer(InlineMediaMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    media_fields = ('image',)
 
-class TournamentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tournament
         fields = '__all__'
+        read_only_fields = ['prize_pool']
 
-class SportsRegistrationSerializer(serializers.ModelSerializer):
+class SportsRegistrationSerializer(SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
     tournament_name = serializers.CharField(source='tournament.name', read_only=True)
@@ -62,31 +191,38 @@ class SportsRegistrationSerializer(serializers.ModelSerializer):
 
     estimated_prize = serializers.SerializerMethodField()
 
+    select_related_fields = ('user', 'tournament')
+
     class Meta:
         model = SportsRegistration
         fields = '__all__'
         read_only_fields = ['user']
+        extra_kwargs = {'tournament': {'queryset': Tournament.objects.all()}}
 
     def get_estimated_prize(self, obj):
         # Logic: 60% of total registration fees for this tournament
-        # We need to sum up all registrations for obj.tournament
-        from django.db.models import Sum
-        total_pool = SportsRegistration.objects.filter(tournament=obj.tournament).aggregate(Sum('price'))['price__sum'] or 0
-        return float(total_pool) * 0.60
+        # prize_pool is kept up to date on the tournament row, so no per-row aggregate
+        return float(obj.tournament.prize_pool or 0) * 0.60
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = JobApplication
         fields = '__all__'
 
-class FixtureSerializer(serializers.ModelSerializer):
+class FixtureSerializer(SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
     player1_name = serializers.SerializerMethodField()
     player2_name = serializers.SerializerMethodField()
     winner_name = serializers.SerializerMethodField()
 
+    select_related_fields = ('player1__user', 'player2__user', 'winner__user')
+
     class Meta:
         model = Fixture
         fields = '__all__'
+        extra_kwargs = {
+            'tournament': {'queryset': Tournament.objects.all()},
+            **{name: {'queryset': SportsRegistration.objects.all()} for name in ('player1', 'player2', 'winner')},
+        }
 
     def get_player1_name(self, obj):
         if not obj.player1: return "TBD"
@@ -100,17 +236,72 @@ class FixtureSerializer(serializers.ModelSerializer):
         if not obj.winner: return None
         return obj.winner.team_name or obj.winner.player_name or obj.winner.user.username
 
-class BlogSerializer(serializers.ModelSerializer):
+class BlogSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Blog
         fields = '__all__'
 
-class ConcertSerializer(serializers.ModelSerializer):
+def _with_live_sold_counts(tiers, sold):
+    # Overlays the ticket ledger's sold counters on the tier JSON the frontend reads
+    if not sold or not isinstance(tiers, list):
+        return tiers
+    return [
+        {**tier, 'sold': sold.get(str(tier.get('type') or '').strip(), tier.get('sold', 0))} if isinstance(tier, dict) else tier
+        for tier in tiers
+    ]
+
+class ConcertSerializer(InlineMediaMixin, SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ('inventory',)
+    media_fields = ('bannerImage', 'thumbnail')
+
     class Meta:
         model = Concert
         fields = '__all__'
 
-class FestivalSerializer(serializers.ModelSerializer):
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if 'tickets' in data:
+            data['tickets'] = _with_live_sold_counts(data['tickets'], sold_by_tier(instance))
+        return data
+
+class FestivalSerializer(InlineMediaMixin, SparseFieldsetMixin, EagerLoadingMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ('inventory',)
+    media_fields = ('image',)
+
     class Meta:
         model = Festival
         fields = '__all__'
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if 'passes' in data:
+            data['passes'] = _with_live_sold_counts(data['passes'], sold_by_tier(instance))
+        return data
+
+
+# --- COMPACT CATALOG CARDS (?view=compact) ---
+# Only the columns a listing card shows; the long text and schedule/FAQ blobs stay
+# in the database until the detail endpoint is requested.
+class ConcertListSerializer(ConcertSerializer):
+    summary = serializers.CharField(read_only=True)
+
+    only_fields = ('id', 'title', 'artist', 'date', 'starts_on', 'time', 'venue', 'city', 'genre', 'thumbnail',
+                   'tickets', 'booking_deadline', 'bookings_closed')
+
+    class Meta:
+        model = Concert
+        fields = ('id', 'title', 'artist', 'date', 'starts_on', 'time', 'venue', 'city', 'genre', 'thumbnail',
+                  'summary', 'tickets', 'booking_deadline', 'bookings_closed')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return super().setup_eager_loading(queryset).annotate(summary=Substr('description', 1, 200))
+
+class FestivalListSerializer(FestivalSerializer):
+    only_fields = ('id', 'name', 'city', 'venue', 'startDate', 'endDate', 'starts_on', 'ends_on', 'theme', 'image',
+                   'color', 'secondary', 'highlights', 'passes', 'booking_deadline', 'bookings_closed')
+
+    class Meta:
+        model = Festival
+        fields = ('id', 'name', 'city', 'venue', 'startDate', 'endDate', 'starts_on', 'ends_on', 'theme', 'image',
+                  'color', 'secondary', 'highlights', 'passes', 'booking_deadline', 'bookings_closed')
@@ -0,0 +1,182 @@
+from datetime import timedelta
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from event_system import settings as production_settings
+from . import auth
+from .auth import BloomFilter, blacklist_filter, reset_blacklist_filter
+from .jobs import prune_expired_tokens
+from .models import User
+
+# The production default cache, under its own key prefix so a test run never
+# touches the keys a running server uses
+PRODUCTION_CACHES = dict(production_settings.CACHES,
+                         default=dict(production_settings.CACHES['default'], KEY_PREFIX='tests'))
+
+
+def production_cache_is_up():
+    try:
+        import redis
+    except ImportError:
+        return False
+    try:
+        return redis.Redis.from_url(PRODUCTION_CACHES['default']['LOCATION'], socket_connect_timeout=0.5).ping()
+    except redis.RedisError:
+        return False
+
+
+class ClaimsTokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post('/api/login/', {'username': 'guest', 'password': 'pass12345'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_access_token_carries_role_and_flags(self):
+        claims = AccessToken(self.login()['access'])
+        self.assertEqual((claims['role'], claims['is_staff'], claims['is_superuser']), ('USER', False, False))
+        self.assertEqual(claims['username'], 'guest')
+
+    def test_authenticated_read_runs_no_queries(self):
+        # Neither the user row nor the revocation cutoff is read from the database
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/profile/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['role'], 'USER')
+        self.assertEqual(queries.captured_queries, [])
+
+    def test_production_cache_is_not_the_database(self):
+        # Reading the revocation cutoff from a DatabaseCache is a query per request
+        self.assertNotIn('DatabaseCache', production_settings.CACHES['default']['BACKEND'])
+
+    def test_admin_endpoint_uses_role_claim(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
+        self.assertEqual(self.client.get('/api/admin/summary/').status_code, 403)
+
+    def test_role_change_revokes_issued_tokens(self):
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get('/api/profile/').status_code, 200)
+
+        user = User.objects.get(pk=self.user.pk)
+        user.role = 'ADMIN'
+        user.save()
+
+        self.assertEqual(self.client.get('/api/profile/').status_code, 401)
+        self.client.credentials()
+        refresh = self.client.post('/api/token/refresh/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(refresh.status_code, 401)
+
+    def test_revocation_survives_a_cold_cache(self):
+        tokens = self.login()
+        user = User.objects.get(pk=self.user.pk)
+        user.is_staff = True
+        user.save()
+        user.save()
+
+        # Another process, or an evicted key: the cutoff is read back from the user row
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get('/api/profile/').status_code, 401)
+
+    def test_unrelated_save_keeps_tokens(self):
+        tokens = self.login()
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = 'Guest'
+        user.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get('/api/profile/').status_code, 200)
+
+
+@skipUnless(production_cache_is_up(), "needs the production Redis cache")
+@override_settings(CACHES=PRODUCTION_CACHES)
+class ProductionCacheTests(TestCase):
+    def test_authenticated_read_runs_no_queries(self):
+        User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        client = APIClient()
+        access = client.post('/api/login/', {'username': 'guest', 'password': 'pass12345'}, format='json').json()['access']
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/api/profile/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries.captured_queries, [])
+
+
+class BlacklistFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_blacklist_filter()
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client = APIClient()
+
+    def refresh(self, token):
+        return self.client.post('/api/token/refresh/', {'refresh': str(token)}, format='json')
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"jti-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 50)
+
+    def test_unrevoked_refresh_skips_blacklist_table(self):
+        token = RefreshToken.for_user(self.user)
+        blacklist_filter()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.refresh(token).status_code, 200)
+        self.assertFalse([q for q in queries.captured_queries if 'token_blacklist_blacklistedtoken' in q['sql']])
+
+    def test_blacklisted_token_is_refused_with_a_warm_filter(self):
+        token = RefreshToken.for_user(self.user)
+        blacklist_filter()
+        stale = dict(auth._blacklist_filter, filter=BloomFilter(1024))
+        with self.captureOnCommitCallbacks(execute=True):
+            token.blacklist()
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+        # A process whose filter predates the blacklisting picks the jti up from
+        # the recent list, without rereading the blacklist table
+        auth._blacklist_filter.update(stale)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIn(token['jti'], blacklist_filter())
+        self.assertEqual(queries.captured_queries, [])
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+        # One that finds the list evicted rebuilds from the table
+        auth._blacklist_filter.update(stale)
+        cache.clear()
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_caught_up_refresh_reads_one_cache_key(self):
+        blacklist_filter()
+        with patch.object(auth.cache, 'get', wraps=auth.cache.get) as get, \
+                patch.object(auth.cache, 'add', wraps=auth.cache.add) as add:
+            blacklist_filter()
+        self.assertEqual(get.call_count, 1)
+        self.assertFalse(add.called)
+
+    def test_prune_expired_tokens_removes_outstanding_and_blacklisted_rows(self):
+        live = RefreshToken.for_user(self.user)
+        expired = RefreshToken.for_user(self.user)
+        expired.blacklist()
+        OutstandingToken.objects.filter(jti=expired['jti']).update(expires_at=timezone.now() - timedelta(days=1))
+
+        self.assertEqual(prune_expired_tokens(batch_size=1), 1)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [live['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
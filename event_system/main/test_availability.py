@@ -0,0 +1,90 @@
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .availability import rebuild_reservations
+from .models import User, Booking, Decoration, ResourceReservation
+
+
+class AvailabilityTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.decoration = Decoration.objects.create(name='Royal Mandap', price=50000, image='', description='')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def wedding(self, day=date(2026, 12, 5), performer='DJ Raj', days=1, **fields):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=day, guests=100, budget=500,
+                                      selected_decoration=self.decoration, decoration_name='Royal Mandap',
+                                      performer_name=performer, wedding_details={'schedule': {'numberOfDays': days}},
+                                      **fields)
+
+    def set_status(self, booking, value):
+        return self.client.patch(f'/api/admin/bookings/{booking.pk}/status/', {'status': value}, format='json')
+
+    def test_approval_reserves_every_event_day(self):
+        booking = self.wedding(days=2)
+        self.assertEqual(self.set_status(booking, 'Approved').status_code, 200)
+        self.assertEqual(
+            sorted(ResourceReservation.objects.values_list('resource', 'day')),
+            [(f'decoration:{self.decoration.pk}', date(2026, 12, 5)), (f'decoration:{self.decoration.pk}', date(2026, 12, 6)),
+             ('performer:dj raj', date(2026, 12, 5)), ('performer:dj raj', date(2026, 12, 6))],
+        )
+
+    def test_conflicting_approval_is_refused(self):
+        self.assertEqual(self.set_status(self.wedding(), 'Approved').status_code, 200)
+        # Same performer, spelled differently, and the decoration overlaps on day two
+        clash = self.wedding(day=date(2026, 12, 4), performer='  dj  RAJ', days=2)
+        response = self.set_status(clash, 'Approved')
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('2026-12-05', response.json()['error'])
+        clash.refresh_from_db()
+        self.assertEqual(clash.status, 'Pending')
+        self.assertFalse(ResourceReservation.objects.filter(booking=clash).exists())
+
+    def test_cancel_and_soft_delete_release_the_slot(self):
+        first = self.wedding(status='Approved')
+        second = self.wedding(status='Pending')
+        self.assertEqual(self.set_status(second, 'Approved').status_code, 409)
+
+        first.status = 'Cancelled'
+        first.save()
+        self.assertEqual(self.set_status(second, 'Approved').status_code, 200)
+
+        second.refresh_from_db()
+        second.is_deleted = True
+        second.save()
+        self.assertFalse(ResourceReservation.objects.exists())
+
+    def test_moving_an_approved_wedding_onto_a_taken_day(self):
+        self.wedding(status='Approved')
+        other = self.wedding(day=date(2026, 12, 20), status='Approved')
+        response = self.client.patch(f'/api/bookings/{other.pk}/', {'event_date': '2026-12-05'}, format='json')
+        self.assertEqual(response.status_code, 409)
+        other.refresh_from_db()
+        self.assertEqual(other.event_date, date(2026, 12, 20))
+
+    def test_calendar_filters_by_range_and_resource(self):
+        self.wedding(status='Approved', days=2)
+        self.wedding(day=date(2027, 1, 10), performer='', status='Approved')
+
+        data = self.client.get('/api/availability/', {'from': '2026-12-01', 'to': '2026-12-31',
+                                                      'resource': 'performer:DJ Raj'}).json()
+        self.assertEqual([day['date'] for day in data['booked']], ['2026-12-05', '2026-12-06'])
+        self.assertEqual(data['booked'][0]['resources'], [{'resource': 'performer:dj raj', 'label': 'DJ Raj'}])
+
+        data = self.client.get('/api/availability/', {'from': '2026-12-01', 'to': '2027-01-31',
+                                                      'resource': 'decoration'}).json()
+        self.assertEqual([day['date'] for day in data['booked']], ['2026-12-05', '2026-12-06', '2027-01-10'])
+        self.assertEqual(self.client.get('/api/availability/', {'from': '2026-12-31', 'to': '2026-12-01'}).status_code, 400)
+
+    def test_rebuild_keeps_the_earlier_of_two_double_bookings(self):
+        first = self.wedding(status='Approved')
+        Booking.objects.filter(pk=self.wedding().pk).update(status='Approved')
+        ResourceReservation.objects.all().delete()
+
+        slots, clashes = rebuild_reservations()
+        self.assertEqual((slots, len(clashes)), (2, 2))
+        self.assertEqual(set(ResourceReservation.objects.values_list('booking_id', flat=True)), {first.pk})
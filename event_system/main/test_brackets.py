@@ -0,0 +1,78 @@
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .brackets import seed_order
+from .models import User, Tournament, SportsRegistration, Fixture
+
+
+class BracketTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.tournament = Tournament.objects.create(name='Cup', sport='Chess', date=date.today())
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def register(self, count, status='Confirmed'):
+        return [
+            SportsRegistration.objects.create(user=self.admin, tournament=self.tournament, registration_type='Individual',
+                                              player_name=f'P{i}', price=100, status=status)
+            for i in range(count)
+        ]
+
+    def generate(self):
+        return self.client.post(f'/api/tournaments/{self.tournament.pk}/generate-bracket/')
+
+    def test_seed_order_keeps_top_seeds_apart(self):
+        self.assertEqual(seed_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_full_bracket_is_linked_round_to_round(self):
+        players = self.register(8)
+        response = self.generate()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([f['round_number'] for f in response.json()], ['1'] * 4 + ['2'] * 2 + ['3'])
+
+        first_round = Fixture.objects.filter(tournament=self.tournament, round_number='1').order_by('bracket_position')
+        self.assertEqual((first_round[0].player1, first_round[0].player2), (players[0], players[7]))
+        final = Fixture.objects.get(tournament=self.tournament, round_number='3')
+        self.assertIsNone(final.next_fixture)
+        for fixture in Fixture.objects.filter(tournament=self.tournament).exclude(pk=final.pk):
+            parent = fixture.next_fixture
+            self.assertEqual(int(parent.round_number), int(fixture.round_number) + 1)
+            self.assertEqual(parent.bracket_position, fixture.bracket_position // 2)
+            self.assertEqual(fixture.next_slot, fixture.bracket_position % 2 + 1)
+
+    def test_byes_advance_top_seeds(self):
+        players = self.register(5)
+        self.register(1, status='Eliminated')
+        self.assertEqual(self.generate().status_code, 201)
+
+        byes = Fixture.objects.filter(tournament=self.tournament, status='Bye')
+        self.assertEqual(sorted(f.winner_id for f in byes), [p.pk for p in players[:3]])
+        second_round = Fixture.objects.filter(tournament=self.tournament, round_number='2').order_by('bracket_position')
+        self.assertEqual(second_round[0].player1, players[0])
+        self.assertIsNone(second_round[0].player2)
+        self.assertEqual((second_round[1].player1, second_round[1].player2), (players[1], players[2]))
+
+    def test_bracket_is_only_generated_once(self):
+        self.register(4)
+        self.assertEqual(self.generate().status_code, 201)
+        self.assertEqual(self.generate().status_code, 400)
+        self.assertEqual(Fixture.objects.filter(tournament=self.tournament).count(), 3)
+
+    def test_match_date_is_validated(self):
+        self.register(2)
+        url = f'/api/tournaments/{self.tournament.pk}/generate-bracket/'
+        self.assertEqual(self.client.post(url, {'match_date': 'tomorrow'}, format='json').status_code, 400)
+        self.assertEqual(self.client.post(url, {'match_date': '2026-02-30T10:00'}, format='json').status_code, 400)
+        self.assertFalse(Fixture.objects.filter(tournament=self.tournament).exists())
+
+        self.assertEqual(self.client.post(url, {'match_date': '2026-12-01T10:00'}, format='json').status_code, 201)
+        self.assertEqual(Fixture.objects.get(tournament=self.tournament).match_date.hour, 10)
+
+    def test_needs_two_entrants_and_an_admin(self):
+        self.register(1)
+        self.assertEqual(self.generate().status_code, 400)
+        self.client.force_authenticate(User.objects.create_user(username='u', email='u@example.com', password='pass12345'))
+        self.assertEqual(self.generate().status_code, 403)
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Blog
+
+
+class CatalogCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.blog = Blog.objects.create(title='Mehendi ideas', content='...')
+
+    def test_hot_reads_skip_the_database(self):
+        first = self.client.get('/api/blogs/')
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+
+        with CaptureQueriesContext(connection) as ctx:
+            again = self.client.get('/api/blogs/')
+            not_modified = self.client.get('/api/blogs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_soft_delete_invalidates(self):
+        etag = self.client.get('/api/blogs/')['ETag']
+        self.blog.is_deleted = True
+        self.blog.save()
+
+        resp = self.client.get('/api/blogs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), [])
+        self.assertNotEqual(resp['ETag'], etag)
+
+    def test_weak_etag_and_per_host_entries(self):
+        etag = self.client.get('/api/blogs/', HTTP_HOST='a.example.com')['ETag']
+        resp = self.client.get('/api/blogs/', HTTP_HOST='a.example.com', HTTP_IF_NONE_MATCH=f'W/{etag}')
+        self.assertEqual(resp.status_code, 304)
+
+        # Another host renders its own copy instead of reusing a.example.com's
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/blogs/', HTTP_HOST='b.example.com')
+        self.assertGreater(len(ctx.captured_queries), 0)
@@ -0,0 +1,97 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .dates import parse_event_date
+from .models import User, Concert, Festival, ConcertBooking
+from .test_indexes import plan_problems
+
+
+def make_concert(title, when, city='Mumbai', genre='Rock'):
+    return Concert.objects.create(title=title, artist='A', artistBio='', date=when, time='8 PM', venue='V',
+                                  city=city, genre=genre, bannerImage='', thumbnail='', description='')
+
+
+class EventDateTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_parses_the_formats_admins_type(self):
+        self.assertEqual(parse_event_date('2026-12-20'), date(2026, 12, 20))
+        self.assertEqual(parse_event_date('Dec 20, 2026'), date(2026, 12, 20))
+        self.assertEqual(parse_event_date('Saturday, 20th December 2026'), date(2026, 12, 20))
+        self.assertEqual(parse_event_date('20/12/2026'), date(2026, 12, 20))
+        self.assertIsNone(parse_event_date('Coming soon'))
+
+    def test_typed_columns_follow_the_strings(self):
+        concert = make_concert('Live', 'March 5, 2027')
+        self.assertEqual(Concert.objects.get(pk=concert.pk).starts_on, date(2027, 3, 5))
+        festival = Festival.objects.create(name='F', city='Goa', venue='V', startDate='2027-01-10', endDate='TBA',
+                                           theme='T', image='', about='')
+        self.assertEqual((festival.starts_on, festival.ends_on), (date(2027, 1, 10), date(2027, 1, 10)))
+        user = User.objects.create_user(username='u', email='u@example.com', password='pass12345')
+        booking = ConcertBooking.objects.create(user=user, concert_title='Live', artist_name='A', event_date='March 5, 2027',
+                                                ticket_type='General', quantity=1, total_price=10)
+        self.assertEqual(booking.event_on, date(2027, 3, 5))
+
+    def test_city_genre_and_date_range_filters(self):
+        early = make_concert('Early', '2027-01-05')
+        late = make_concert('Late', '2027-02-20')
+        make_concert('Elsewhere', '2027-01-06', city='Delhi')
+        make_concert('Jazz', '2027-01-07', genre='Jazz')
+
+        data = self.client.get('/api/concerts/', {'city': 'Mumbai', 'genre': 'Rock', 'sort': 'date'}).json()
+        self.assertEqual([c['id'] for c in data], [early.pk, late.pk])
+        data = self.client.get('/api/concerts/', {'city': 'Mumbai', 'from': '2027-02-01', 'to': '2027-02-28'}).json()
+        self.assertEqual([c['id'] for c in data], [late.pk])
+        self.assertEqual(self.client.get('/api/concerts/', {'from': 'soon'}).status_code, 400)
+
+    def test_date_order_pages_past_undated_events(self):
+        dated = [make_concert(f'C{day}', f'2027-01-{day:02d}') for day in range(1, 6)]
+        make_concert('Soon', 'Coming soon')
+
+        seen, params = [], {'sort': 'date', 'page_size': 2}
+        url = '/api/concerts/'
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            seen += [c['id'] for c in page['results']]
+            url, params = page['next'], None
+        self.assertEqual(seen, [c.pk for c in dated])
+
+    def test_facets_ignore_their_own_filter(self):
+        make_concert('A', '2027-01-05')
+        make_concert('B', '2027-01-06', city='Delhi')
+        make_concert('C', '2027-01-07', genre='Jazz')
+
+        data = self.client.get('/api/concerts/', {'city': 'Mumbai', 'facets': '1', 'view': 'compact'}).json()
+        self.assertEqual(len(data['results']), 2)
+        self.assertEqual(data['facets'], {'city': {'Mumbai': 2, 'Delhi': 1}, 'genre': {'Rock': 1, 'Jazz': 1}})
+
+        paged = self.client.get('/api/concerts/', {'facets': '1', 'page_size': 1}).json()
+        self.assertEqual(len(paged['results']), 1)
+        self.assertIn('next', paged)
+        self.assertEqual(paged['facets']['genre'], {'Rock': 2, 'Jazz': 1})
+
+    def test_filtered_date_listing_uses_an_index(self):
+        make_concert('A', '2027-01-05')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/concerts/', {'city': 'Mumbai', 'from': '2027-01-01', 'sort': 'date', 'view': 'compact'})
+        select = next(q['sql'] for q in queries.captured_queries if 'FROM "main_concert"' in q['sql'])
+        self.assertEqual(plan_problems(select), [])
+
+    def test_booking_date_range_uses_an_index(self):
+        admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        bookings = [ConcertBooking.objects.create(user=admin, concert_title='Live', artist_name='A', event_date=when,
+                                                  ticket_type='General', quantity=1, total_price=10)
+                    for when in ('2027-01-05', '2027-02-20', 'TBA')]
+        self.client.force_authenticate(admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/concert-bookings/', {'from': '2027-02-01', 'to': '2027-02-28', 'sort': 'date'})
+        self.assertEqual([b['id'] for b in response.json()], [bookings[1].pk])
+        select = next(q['sql'] for q in queries.captured_queries if 'FROM "main_concertbooking"' in q['sql'])
+        self.assertEqual(plan_problems(select), [])
@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import exports
+from .models import User, Booking, JobApplication
+
+
+class AdminExportTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def wedding(self, status='Pending', **extra):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10,
+                                      budget=100, total_cost=100, status=status, **extra)
+
+    def download(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_export_streams_header_and_live_rows(self):
+        kept = self.wedding()
+        self.wedding(is_deleted=True)
+        rows = list(csv.reader(io.StringIO(self.download('/api/admin/export/wedding/'))))
+        self.assertEqual(rows[0], exports.export_columns(Booking))
+        self.assertEqual([row[0] for row in rows[1:]], [str(kept.pk)])
+
+    def test_ndjson_export_filters_by_status_and_date(self):
+        approved = self.wedding(status='Approved')
+        self.wedding(status='Pending')
+        old = self.wedding(status='Approved')
+        Booking.objects.filter(pk=old.pk).update(booking_date=timezone.now() - timedelta(days=40))
+
+        since = (timezone.localdate() - timedelta(days=7)).isoformat()
+        body = self.download(f'/api/admin/export/wedding/?output=ndjson&status=Approved&from={since}')
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r['id'] for r in records], [approved.pk])
+        self.assertEqual(records[0]['wedding_details'], {})
+
+    def test_pages_through_large_tables_in_bounded_queries(self):
+        JobApplication.objects.bulk_create([
+            JobApplication(full_name=f'A{i}', email=f'a{i}@example.com', phone='1', position='Stylist') for i in range(25)
+        ])
+        queryset = exports.export_queryset('job')
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(exports.iter_rows(queryset, exports.export_columns(JobApplication), page_size=10))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(all('LIMIT 10' in q['sql'] for q in queries.captured_queries))
+
+    def test_rejects_bad_requests(self):
+        self.assertEqual(self.client.get('/api/admin/export/unknown/').status_code, 400)
+        self.assertEqual(self.client.get('/api/admin/export/blog/?status=Draft').status_code, 400)
+        self.assertEqual(self.client.get('/api/admin/export/wedding/?output=xml').status_code, 400)
+        self.assertEqual(self.client.get('/api/admin/export/wedding/?from=yesterday').status_code, 400)
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get('/api/admin/export/wedding/').status_code, 403)
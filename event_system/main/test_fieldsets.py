@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Blog, Concert
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        Concert.objects.create(
+            title='Arijit Live', artist='Arijit', artistBio='bio ' * 500, date='2026-12-01', time='7 PM',
+            venue='Arena', city='Mumbai', genre='Pop', bannerImage='data:image/png;base64,' + 'A' * 5000,
+            thumbnail='thumb.jpg', description='long ' * 500, tickets=[{'type': 'General', 'price': 999, 'total': 10}],
+        )
+        Blog.objects.create(title='Haldi', content='x' * 1000)
+
+    def select_sql(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        return resp.json(), ctx.captured_queries[0]['sql']
+
+    def test_compact_concert_list(self):
+        data, sql = self.select_sql('/api/concerts/?view=compact')
+        card = data[0]
+        self.assertNotIn('artistBio', card)
+        self.assertNotIn('bannerImage', card)
+        self.assertEqual(len(card['summary']), 200)
+        self.assertEqual(card['tickets'][0]['price'], 999)
+        self.assertNotIn('"artistBio"', sql)
+        self.assertNotIn('"bannerImage"', sql)
+
+    def test_fields_and_exclude(self):
+        data, sql = self.select_sql('/api/blogs/?fields=id,title')
+        self.assertEqual(set(data[0]), {'id', 'title'})
+        self.assertNotIn('"content"', sql)
+
+        data, _ = self.select_sql('/api/blogs/?exclude=content')
+        self.assertNotIn('content', data[0])
+        self.assertIn('title', data[0])
@@ -0,0 +1,65 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .brackets import generate_bracket
+from .models import User, Tournament, SportsRegistration, Fixture
+from .reports import HALL_OF_FAME_KEY
+
+
+class HallOfFameTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='p1', email='p1@example.com', password='pass12345')
+        self.tournament = Tournament.objects.create(name='Cup', sport='Chess', date=date.today())
+        self.client = APIClient()
+
+    def register(self, name, **extra):
+        return SportsRegistration.objects.create(user=self.user, tournament=self.tournament, registration_type='Team',
+                                                 team_name=name, price=500, **extra)
+
+    def test_completed_tournament_lands_in_the_snapshot(self):
+        alpha, beta = self.register('Alpha'), self.register('Beta')
+        final = generate_bracket(self.tournament)[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            final.winner = beta
+            final.save()
+
+        with self.assertNumQueries(0):
+            data = self.client.get('/api/hall-of-fame/').json()
+        self.assertEqual(data, [{'id': beta.pk, 'tournament_id': self.tournament.pk, 'tournament': 'Cup',
+                                 'sport': 'Chess', 'winner': 'Beta', 'prize': '500.00'}])
+
+    def test_winner_edits_rebuild_the_snapshot(self):
+        winner = self.register('Alpha', status='Winner')
+        self.assertEqual(self.client.get('/api/hall-of-fame/').json()[0]['prize'], '500.00')
+
+        winner = SportsRegistration.objects.get(pk=winner.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            winner.winning_amount = 300
+            winner.save()
+        self.assertEqual(self.client.get('/api/hall-of-fame/').json()[0]['prize'], '800.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            winner.is_deleted = True
+            winner.save()
+        self.assertEqual(self.client.get('/api/hall-of-fame/').json(), [])
+
+    def test_unrelated_registration_saves_leave_the_snapshot_alone(self):
+        self.client.get('/api/hall-of-fame/')
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.register('Gamma')
+        self.assertFalse(any(getattr(c, '__name__', '') == 'refresh_hall_of_fame' for c in callbacks))
+        self.assertEqual(cache.get(HALL_OF_FAME_KEY), [])
+
+    def test_username_change_rebuilds_the_snapshot(self):
+        self.register('', status='Winner')
+        self.assertEqual(self.client.get('/api/hall-of-fame/').json()[0]['winner'], 'p1')
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.username = 'champion'
+            user.save()
+        self.assertEqual(self.client.get('/api/hall-of-fame/').json()[0]['winner'], 'champion')
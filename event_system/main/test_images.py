@@ -0,0 +1,62 @@
+import io
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+
+from .caching import catalog_version
+from .images import build_variants, load_manifest, srcset_for
+
+
+def make_png(path, size=(800, 400)):
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new('RGBA', size, (200, 50, 50, 128)).save(buf, 'PNG')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(buf.getvalue())
+
+
+class ImageVariantTests(SimpleTestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.source = self.root / 'cas'
+        self.output = self.root / 'variants'
+        self.manifest = self.output / 'manifest.json'
+        make_png(self.source / 'ab' / 'banner.png')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_variants_are_built_once_and_never_upscaled(self):
+        self.assertEqual(build_variants(self.source, self.output, self.manifest, widths=[320, 640, 1600], workers=1), (1, 0, 0))
+        entry = load_manifest(self.manifest)['images']['ab/banner.png']
+        self.assertEqual(sorted({v['width'] for v in entry['variants']}), [320, 640, 800])
+        self.assertEqual({v['format'] for v in entry['variants']}, {'webp', 'jpeg'})
+        for variant in entry['variants']:
+            self.assertTrue((self.output / variant['path']).exists())
+
+        # Unchanged input is skipped on the next run
+        self.assertEqual(build_variants(self.source, self.output, self.manifest, widths=[320, 640, 1600], workers=1), (0, 1, 0))
+
+        # Removed sources drop out of the manifest
+        (self.source / 'ab' / 'banner.png').unlink()
+        build_variants(self.source, self.output, self.manifest, widths=[320, 640, 1600], workers=1)
+        self.assertEqual(load_manifest(self.manifest)['images'], {})
+
+    def test_srcset_lookup(self):
+        build_variants(self.source, self.output, self.manifest, widths=[320], workers=1)
+        with override_settings(IMAGE_VARIANTS_MANIFEST=self.manifest, IMAGE_VARIANTS_URL='/media/variants/'):
+            srcset = srcset_for('/media/cas/ab/banner.png')
+            self.assertIsNone(srcset_for('/media/cas/ab/missing.png'))
+            self.assertIsNone(srcset_for('https://example.com/banner.png'))
+        self.assertRegex(srcset['webp'], r'^/media/variants/\w\w/\w+-320w\.webp 320w$')
+        self.assertIn('-320w.jpeg 320w', srcset['jpeg'])
+
+    def test_failed_renders_are_reported_and_drop_cached_pages(self):
+        (self.source / 'ab' / 'broken.png').write_bytes(b'not a png')
+        version = catalog_version('concert')
+        self.assertEqual(build_variants(self.source, self.output, self.manifest, widths=[320], workers=1), (1, 0, 1))
+        self.assertNotIn('ab/broken.png', load_manifest(self.manifest)['images'])
+        self.assertNotEqual(catalog_version('concert'), version)
@@ -0,0 +1,103 @@
+import re
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import User, Booking, ConcertBooking, FestivalBooking, Concert, Festival, Tournament, SportsRegistration, JobApplication, Blog
+
+# Tables that are read whole by design (small, unfiltered catalogs)
+ALLOWED_SCANS = {'main_decoration'}
+
+SQLITE_SCAN = re.compile(r'^SCAN (\w+)(?!.*USING (COVERING )?INDEX)')
+
+
+def plan_problems(sql, params=()):
+    # Full table scans and unindexed sorts in the query plan of one SELECT
+    problems = []
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            for row in cursor.fetchall():
+                detail = row[-1]
+                scan = SQLITE_SCAN.match(detail)
+                if scan and scan.group(1) not in ALLOWED_SCANS:
+                    problems.append(detail)
+                elif 'USE TEMP B-TREE FOR ORDER BY' in detail:
+                    problems.append(detail)
+        elif connection.vendor == 'mysql':
+            cursor.execute('EXPLAIN ' + sql, params)
+            columns = [c[0] for c in cursor.description]
+            for row in cursor.fetchall():
+                row = dict(zip(columns, row))
+                if row.get('type') == 'ALL' and row.get('table') not in ALLOWED_SCANS:
+                    problems.append(f"full scan of {row.get('table')}")
+                elif 'Using filesort' in (row.get('Extra') or ''):
+                    problems.append(f"filesort on {row.get('table')}")
+    return problems
+
+
+class ListQueryPlanTests(TestCase):
+    # Every live-row list endpoint must be served from an index. A failure here
+    # means a queryset changed shape and needs a matching index in models.Meta.
+    # (Admin trash listings of deleted rows are rare and left out on purpose.)
+    ENDPOINTS = [
+        ('user', '/api/bookings/'),
+        ('admin', '/api/bookings/'),
+        ('user', '/api/concert-bookings/'),
+        ('admin', '/api/concert-bookings/'),
+        ('user', '/api/festival-bookings/'),
+        ('admin', '/api/festival-bookings/'),
+        ('user', '/api/sports-registrations/'),
+        ('admin', '/api/sports-registrations/'),
+        (None, '/api/sports-registrations/'),
+        ('admin', '/api/careers/applications/'),
+        (None, '/api/blogs/'),
+        ('admin', '/api/blogs/'),
+        (None, '/api/concerts/'),
+        (None, '/api/festivals/'),
+        (None, '/api/tournaments/'),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        cls.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        concert = Concert.objects.create(title='Live', artist='A', artistBio='', date='2026-12-01', time='8 PM', venue='V',
+                                         city='C', genre='Rock', bannerImage='', thumbnail='', description='',
+                                         tickets=[{'type': 'General', 'price': 100, 'total': 10}])
+        festival = Festival.objects.create(name='Fest', city='C', venue='V', startDate='2026-12-01', endDate='2026-12-02',
+                                           theme='T', image='', about='', passes=[{'type': 'Day', 'price': 50}])
+        tournament = Tournament.objects.create(name='Cup', sport='Chess', date=date.today())
+        Booking.objects.create(user=cls.user, event_type='Wedding', event_date=date.today(), guests=10, budget=100)
+        ConcertBooking.objects.create(user=cls.user, concert=concert, concert_title='Live', artist_name='A',
+                                      event_date='Today', ticket_type='General', quantity=1, total_price=100)
+        FestivalBooking.objects.create(user=cls.user, festival=festival, festival_name='Fest', pass_type='Day',
+                                       quantity=1, total_price=50)
+        SportsRegistration.objects.create(user=cls.user, tournament=tournament, registration_type='Individual', price=10)
+        JobApplication.objects.create(full_name='A', email='a@example.com', phone='1', position='Stylist')
+        Blog.objects.create(title='Hello', content='World')
+
+    def test_list_endpoints_use_indexes(self):
+        users = {'user': self.user, 'admin': self.admin, None: None}
+        for who, url in self.ENDPOINTS:
+            client = APIClient()
+            client.force_authenticate(users[who])
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(client.get(url).status_code, 200, url)
+            for query in ctx.captured_queries:
+                sql = query['sql']
+                if not sql.startswith('SELECT'):
+                    continue
+                with self.subTest(who=who, url=url, sql=sql):
+                    self.assertEqual(plan_problems(sql), [])
+
+    def test_harness_flags_unindexed_queries(self):
+        if connection.vendor not in ('sqlite', 'mysql'):
+            self.skipTest('No query plan parser for this database')
+        sql, params = Booking.objects.filter(guests=10).order_by('event_type').query.sql_with_params()
+        self.assertTrue(plan_problems(sql, params))
+        sql, params = Booking.objects.filter(user=self.user, is_deleted=False).order_by('-id').query.sql_with_params()
+        self.assertEqual(plan_problems(sql, params), [])
@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+
+from django.db import OperationalError, connections
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from .inventory import SoldOut, reserve
+from .models import User, Concert, ConcertBooking, Festival, TicketInventory
+
+
+def make_concert(total=10, **kwargs):
+    return Concert.objects.create(
+        title=kwargs.pop('title', 'Arijit Live'), artist='Arijit', artistBio='-', date='2026-12-01', time='7 PM',
+        venue='Arena', city='Mumbai', genre='Pop', bannerImage='-', thumbnail='-', description='-',
+        tickets=[{'type': 'General', 'price': 999, 'total': total, 'sold': 0}], **kwargs
+    )
+
+
+class TicketInventoryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='fan', email='fan@example.com', password='pass12345')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.concert = make_concert(total=3)
+
+    def book(self, quantity):
+        return self.client.post('/api/concert-bookings/create/', {
+            'concert_title': self.concert.title, 'artist_name': 'Arijit', 'event_date': self.concert.date,
+            'ticket_type': 'General', 'quantity': quantity, 'total_price': 999 * quantity,
+        }, format='json')
+
+    def ledger(self):
+        return TicketInventory.objects.get(concert=self.concert, tier='General')
+
+    def test_ledger_follows_json_tiers(self):
+        self.assertEqual(self.ledger().capacity, 3)
+        self.concert.tickets = [{'type': 'General', 'price': 999, 'total': 5}, {'type': 'VIP', 'price': 4999, 'total': 1}]
+        self.concert.save()
+        self.assertEqual(self.ledger().capacity, 5)
+        self.assertTrue(TicketInventory.objects.filter(concert=self.concert, tier='VIP').exists())
+
+    def test_cannot_oversell_and_cancel_releases(self):
+        self.assertEqual(self.book(2).status_code, 201)
+        resp = self.book(2)
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn('error', resp.json())
+        self.assertEqual(self.ledger().sold, 2)
+
+        booking = ConcertBooking.objects.get()
+        self.client.patch(f'/api/concert-bookings/{booking.pk}/cancel/')
+        self.client.patch(f'/api/concert-bookings/{booking.pk}/cancel/')
+        self.assertEqual(self.ledger().sold, 0)
+
+    def test_unknown_concert_is_refused(self):
+        resp = self.client.post('/api/concert-bookings/create/', {
+            'concert_title': 'Not On Sale', 'artist_name': 'X', 'event_date': '2026-12-01',
+            'ticket_type': 'General', 'quantity': 50, 'total_price': 1,
+        }, format='json')
+        self.assertEqual(resp.status_code, 400)
+        self.assertFalse(ConcertBooking.objects.exists())
+
+    def test_soft_delete_releases_and_restore_retakes(self):
+        self.assertEqual(self.book(2).status_code, 201)
+        booking = ConcertBooking.objects.get()
+        self.client.delete(f'/api/concert-bookings/{booking.pk}/')
+        self.assertEqual(self.ledger().sold, 0)
+
+        admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.client.force_authenticate(admin)
+        resp = self.client.post(f'/api/admin/restore/{booking.pk}/', {'type': 'concert'}, format='json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.ledger().sold, 2)
+
+    def test_list_reports_live_sold_counts(self):
+        self.book(1)
+        concert = self.client.get('/api/concerts/').json()[0]
+        self.assertEqual(concert['tickets'][0]['sold'], 1)
+
+    def test_festival_passes_unlimited_without_total(self):
+        festival = Festival.objects.create(name='Sunburn', city='Goa', venue='Beach', startDate='1', endDate='2',
+                                           theme='EDM', image='-', about='-', passes=[{'type': 'Daily Pass', 'price': 500}])
+        for _ in range(3):
+            reserve(festival, 'Daily Pass', 100)
+        self.assertEqual(TicketInventory.objects.get(festival=festival).sold, 300)
+
+
+class TicketInventoryStressTests(TransactionTestCase):
+    # Hammers one tier from many threads; exactly `capacity` seats may be sold.
+    # Scale it up locally with INVENTORY_STRESS_WORKERS=500.
+
+    def test_concurrent_checkouts_never_oversell(self):
+        workers = int(os.environ.get('INVENTORY_STRESS_WORKERS', 60))
+        capacity = workers // 3
+        concert = make_concert(total=capacity)
+        results = []
+        start = threading.Barrier(workers)
+
+        def checkout():
+            start.wait()
+            try:
+                for _ in range(50):
+                    try:
+                        reserve(concert, 'General', 1)
+                        results.append('ok')
+                        return
+                    except OperationalError:
+                        # SQLite reports lock contention instead of waiting; just try again
+                        time.sleep(0.005)
+                    except SoldOut:
+                        results.append('sold_out')
+                        return
+                results.append('gave_up')
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=checkout) for _ in range(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ledger = TicketInventory.objects.get(concert=concert)
+        self.assertEqual(ledger.sold, results.count('ok'))
+        self.assertLessEqual(ledger.sold, capacity)
+        self.assertEqual(results.count('ok'), capacity)
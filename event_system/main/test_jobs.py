@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .jobs import Scheduler, acquire_lock, reject_stale_bookings, close_tournament_registrations, close_concert_bookings
+from .models import User, Booking, Tournament, Concert
+from .test_inventory import make_concert
+
+
+class SchedulerJobTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+
+    def make_booking(self, **kwargs):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(),
+                                      guests=100, budget=1000, **kwargs)
+
+    def test_reject_stale_bookings_in_chunks(self):
+        old = [self.make_booking() for _ in range(5)]
+        fresh = self.make_booking()
+        Booking.objects.filter(pk__in=[b.pk for b in old]).update(booking_date=timezone.now() - timedelta(days=3))
+
+        self.assertEqual(reject_stale_bookings(batch_size=2), 5)
+        self.assertEqual(Booking.objects.filter(status='Rejected').count(), 5)
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, 'Pending')
+
+    def test_booking_list_does_not_write(self):
+        booking = self.make_booking()
+        Booking.objects.filter(pk=booking.pk).update(booking_date=timezone.now() - timedelta(days=3))
+        client = APIClient()
+        client.force_authenticate(self.user)
+        client.get('/api/bookings/')
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, 'Pending')
+
+    def test_close_tournament_registrations(self):
+        t = Tournament.objects.create(name='Cup', sport='Chess', date=date.today(),
+                                      registration_deadline=date.today() - timedelta(days=1))
+        self.assertEqual(close_tournament_registrations(), 1)
+        t.refresh_from_db()
+        self.assertEqual(t.status, 'Registration Closed')
+
+    def test_only_one_leader(self):
+        self.assertTrue(acquire_lock('scheduler', 'a', 60))
+        self.assertFalse(acquire_lock('scheduler', 'b', 60))
+        self.assertEqual(Scheduler(owner='b').tick(force=True), {})
+        self.assertTrue(acquire_lock('scheduler', 'a', 60))
+
+    def test_closed_or_past_deadline_concerts_refuse_bookings(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        concert = make_concert(booking_deadline=date.today() - timedelta(days=1))
+
+        def book():
+            return client.post('/api/concert-bookings/create/', {
+                'concert_title': concert.title, 'artist_name': 'Arijit', 'event_date': concert.date,
+                'ticket_type': 'General', 'quantity': 1, 'total_price': 999,
+            }, format='json')
+
+        # Refused before the sweep has run, and after it has
+        self.assertEqual(book().status_code, 400)
+        self.assertEqual(close_concert_bookings(), 1)
+        self.assertEqual(book().status_code, 400)
+
+        # Extending the deadline reopens bookings
+        concert = Concert.objects.get(pk=concert.pk)
+        concert.booking_deadline = date.today() + timedelta(days=7)
+        concert.save()
+        self.assertFalse(Concert.objects.get(pk=concert.pk).bookings_closed)
+        self.assertEqual(book().status_code, 201)
+
+    def test_closed_or_past_deadline_tournaments_refuse_registrations(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        tournament = Tournament.objects.create(name='Cup', sport='Chess', category='Solo', date=date.today(),
+                                               registration_deadline=date.today() - timedelta(days=1))
+
+        def register():
+            return client.post('/api/sports-registrations/', {
+                'tournament': tournament.pk, 'registration_type': 'Individual', 'player_name': 'Anand', 'price': 500,
+            }, format='json')
+
+        # Refused before the sweep has run, and after it has
+        self.assertEqual(register().status_code, 400)
+        self.assertEqual(close_tournament_registrations(), 1)
+        Tournament.objects.filter(pk=tournament.pk).update(registration_deadline=None)
+        self.assertEqual(register().status_code, 400)
+
+        Tournament.objects.filter(pk=tournament.pk).update(status='Registration Open')
+        self.assertEqual(register().status_code, 201)
@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .mail import drain_outbox, queue_mail
+from .models import OutboundEmail
+
+
+class OutboxTests(TestCase):
+    def test_inquiry_queues_instead_of_sending(self):
+        resp = APIClient().post('/api/custom-inquiry/', {
+            'name': 'Asha', 'email': 'asha@example.com', 'message': 'Beach wedding please',
+        }, format='json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertTrue(OutboundEmail.objects.filter(recipients=['asha@example.com'], status='Pending').exists())
+
+        sent, failed = drain_outbox()
+        self.assertEqual((sent, failed), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ['asha@example.com'])
+        self.assertEqual(OutboundEmail.objects.get(recipients=['asha@example.com']).status, 'Sent')
+
+    def test_failed_send_is_retried_with_backoff(self):
+        queue_mail('Hi', 'Body', 'admin@example.com', ['x@example.com'])
+        with patch('django.core.mail.EmailMessage.send', side_effect=OSError('smtp down')):
+            self.assertEqual(drain_outbox(), (0, 1))
+        row = OutboundEmail.objects.get()
+        self.assertEqual((row.status, row.attempts), ('Pending', 1))
+        self.assertGreater(row.next_attempt_at, timezone.now())
+
+        # Not due yet, so nothing is sent
+        self.assertEqual(drain_outbox(), (0, 0))
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(drain_outbox(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_caller_connection_is_left_open(self):
+        queue_mail('Hi', 'Body', 'admin@example.com', ['x@example.com'])
+        connection = mail.get_connection()
+        with patch.object(connection, 'close') as close:
+            self.assertEqual(drain_outbox(connection=connection), (1, 0))
+        close.assert_not_called()
@@ -0,0 +1,65 @@
+import base64
+import shutil
+import tempfile
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from .models import User, Tournament
+
+PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=='
+)
+DATA_URL = 'data:image/png;base64,' + base64.b64encode(PNG).decode()
+
+
+class MediaStoreTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.override = override_settings(MEDIA_ROOT=self.media_root)
+        self.override.enable()
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def tearDown(self):
+        self.override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_inline_image_is_stored_once_by_hash(self):
+        payload = {'name': 'Cup', 'sport': 'Chess', 'date': '2026-12-01', 'image': DATA_URL}
+        first = self.client.post('/api/tournaments/', payload, format='json').json()
+        second = self.client.post('/api/tournaments/', payload, format='json').json()
+
+        self.assertEqual(first['image'], second['image'])
+        self.assertTrue(first['image'].startswith('http://testserver/media/cas/'))
+        stored = Tournament.objects.get(pk=first['id']).image
+        self.assertTrue(stored.startswith('/media/cas/'))
+        self.assertLess(len(stored), 120)
+
+        resp = self.client.get(stored)
+        self.assertEqual(b''.join(resp.streaming_content), PNG)
+        self.assertIn('immutable', resp['Cache-Control'])
+
+    def test_upload_endpoint_rejects_non_images(self):
+        resp = self.client.post('/api/admin/media/', {'data_url': 'data:text/plain;base64,aGVsbG8='}, format='json')
+        self.assertEqual(resp.status_code, 400)
+
+    def test_type_comes_from_the_bytes(self):
+        svg = base64.b64encode(b'<svg xmlns="http://www.w3.org/2000/svg"><script>alert(1)</script></svg>').decode()
+        for label in ('image/svg+xml', 'image/png'):
+            resp = self.client.post('/api/admin/media/', {'data_url': f'data:{label};base64,{svg}'}, format='json')
+            self.assertEqual(resp.status_code, 400)
+
+        # A PNG labelled as JPEG is still stored as a PNG
+        resp = self.client.post('/api/admin/media/', {'data_url': 'data:image/jpeg;base64,' + DATA_URL.split(',')[1]}, format='json')
+        self.assertTrue(resp.json()['url'].endswith('.png'))
+        served = self.client.get(resp.json()['url'])
+        self.assertEqual(served['X-Content-Type-Options'], 'nosniff')
+
+    def test_only_admins_store_inline_images(self):
+        anonymous = APIClient()
+        payload = {'name': 'Cup', 'sport': 'Chess', 'date': '2026-12-01', 'image': DATA_URL}
+        resp = anonymous.post('/api/tournaments/', payload, format='json')
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn('image', resp.json())
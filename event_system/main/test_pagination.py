@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import User, JobApplication
+from .pagination import KeysetPagination
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        JobApplication.objects.bulk_create([
+            JobApplication(full_name=f"Applicant {i}", email=f"a{i}@example.com", phone='1', position='Event Coordinator')
+            for i in range(7)
+        ])
+
+    def test_unpaginated_by_default(self):
+        resp = self.client.get('/api/careers/applications/')
+        self.assertIsInstance(resp.json(), list)
+        self.assertEqual(len(resp.json()), 7)
+
+    def test_cursor_walks_every_row_once(self):
+        seen = []
+        url = '/api/careers/applications/?page_size=3'
+        while url:
+            data = self.client.get(url).json()
+            seen += [row['id'] for row in data['results']]
+            url = data['next']
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(len(set(seen)), 7)
+
+    def test_page_size_ceiling(self):
+        with patch.object(KeysetPagination, 'max_page_size', 5):
+            data = self.client.get('/api/careers/applications/?page_size=100000').json()
+        self.assertEqual(len(data['results']), 5)
+        self.assertIsNotNone(data['next'])
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import User, Tournament, SportsRegistration
+
+
+class PrizePoolTests(TestCase):
+    def setUp(self):
+        self.tournament = Tournament.objects.create(name='Cup', sport='Chess', date=date.today())
+        self.user = User.objects.create_user(username='p1', email='p1@example.com', password='pass12345', role='ADMIN')
+
+    def register(self, price):
+        return SportsRegistration.objects.create(user=self.user, tournament=self.tournament,
+                                                 registration_type='Individual', price=price)
+
+    def pool(self):
+        self.tournament.refresh_from_db()
+        return self.tournament.prize_pool
+
+    def test_pool_follows_create_soft_delete_and_restore(self):
+        first = self.register(500)
+        self.register(300)
+        self.assertEqual(self.pool(), Decimal('800'))
+
+        reg = SportsRegistration.objects.get(pk=first.pk)
+        reg.is_deleted = True
+        reg.save()
+        self.assertEqual(self.pool(), Decimal('300'))
+
+        reg = SportsRegistration.objects.with_deleted().get(pk=first.pk)
+        reg.is_deleted = False
+        reg.save()
+        self.assertEqual(self.pool(), Decimal('800'))
+
+        reg.status = 'Eliminated'
+        reg.save()
+        self.assertEqual(self.pool(), Decimal('800'))
+        self.assertEqual(self.tournament.recalculate_prize_pool(), Decimal('800'))
+
+    def test_serializer_does_no_per_row_queries(self):
+        for _ in range(3):
+            self.register(100)
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as small:
+            client.get('/api/sports-registrations/')
+        for _ in range(5):
+            self.register(100)
+        with CaptureQueriesContext(connection) as large:
+            resp = client.get('/api/sports-registrations/')
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(resp.json()[0]['estimated_prize'], 480.0)
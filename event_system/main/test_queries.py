@@ -0,0 +1,41 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import User, Decoration, Booking, ConcertBooking, FestivalBooking
+
+
+class ListQueryCountTests(TestCase):
+    # List endpoints must issue a constant number of queries regardless of row count
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.decoration = Decoration.objects.create(name='Royal', price=1000, image='https://example.com/a.png', description='x')
+
+    def add_rows(self, n):
+        for _ in range(n):
+            i = User.objects.count()
+            user = User.objects.create_user(username=f"user{i}", email=f"user{i}@example.com", password='pass12345')
+            Booking.objects.create(user=user, event_type='Wedding', event_date=date.today(), guests=10, budget=100,
+                                   selected_decoration=self.decoration)
+            ConcertBooking.objects.create(user=user, concert_title='Live', artist_name='A', event_date='Today',
+                                          ticket_type='General', quantity=1, total_price=100)
+            FestivalBooking.objects.create(user=user, festival_name='Fest', pass_type='Day', quantity=1, total_price=100)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_constant_queries(self):
+        for url in ['/api/bookings/', '/api/concert-bookings/', '/api/festival-bookings/']:
+            self.add_rows(2)
+            small = self.count_queries(url)
+            self.add_rows(5)
+            self.assertEqual(self.count_queries(url), small, url)
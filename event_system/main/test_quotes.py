@@ -0,0 +1,148 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import User, Booking, Decoration, CateringPackage, PerformerPackage, ResourceReservation
+from .quotes import price_catalog, quote
+
+
+class QuoteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.mandap = Decoration.objects.create(name='Royal Mandap', price=40000, image='', description='')
+        self.lights = Decoration.objects.create(name='Fairy Lights', price=5000, image='', description='')
+        self.client = APIClient()
+
+    def test_quote_matches_invoice_arithmetic(self):
+        # Seeded by the migration: Royal Indian Feast 1200/plate, Live DJ 15000
+        quoted = quote({'guests': 100, 'catering_package': 'royal indian feast', 'selected_decoration': self.mandap.pk,
+                        'decorations': ['Fairy Lights'], 'performer_name': 'Live  DJ'})
+        self.assertEqual(quoted['catering_package'], 'Royal Indian Feast')
+        self.assertEqual(quoted['catering_total'], Decimal('120000.00'))
+        self.assertEqual(quoted['decoration_name'], 'Royal Mandap, Fairy Lights')
+        self.assertEqual(quoted['subtotal'], Decimal('180000.00'))
+        self.assertEqual(quoted['gst'], Decimal('32400.00'))
+        self.assertEqual((quoted['total_cost'], quoted['advance_amount'], quoted['balance_amount']),
+                         (Decimal('212400.00'), Decimal('106200.00'), Decimal('106200.00')))
+
+    def test_batch_quotes_share_one_catalog_read(self):
+        price_catalog()
+        configurations = [{'guests': n, 'catering_package': 'Basic High Tea'} for n in range(1, 51)]
+        configurations.append({'guests': 10, 'performer_name': 'Nobody'})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/quotes/', {'configurations': configurations}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 0)
+        quotes = response.json()['quotes']
+        self.assertEqual(quotes[49]['total_cost'], 8850.0)
+        self.assertEqual(quotes[50], {'error': 'Unknown performer: Nobody'})
+
+    def test_price_change_invalidates_the_catalog(self):
+        self.assertEqual(quote({'guests': 10, 'catering_package': 'Basic High Tea'})['catering_total'], Decimal('1500.00'))
+        package = CateringPackage.objects.get(name='Basic High Tea')
+        package.price_per_plate = 200
+        package.save()
+        self.assertEqual(quote({'guests': 10, 'catering_package': 'Basic High Tea'})['catering_total'], Decimal('2000.00'))
+
+        performer = PerformerPackage.objects.get(name='Live DJ')
+        performer.is_active = False
+        performer.save()
+        response = self.client.post('/api/quotes/', {'guests': 10, 'performer_name': 'Live DJ'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_created_booking_stores_server_totals(self):
+        user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client.force_authenticate(user)
+        response = self.client.post('/api/bookings/', {
+            'event_type': 'Wedding', 'event_date': '2026-12-05', 'guests': 10, 'budget': 500,
+            'selected_decoration': self.lights.pk, 'catering_package': 'Basic High Tea',
+            'total_cost': 1, 'advance_amount': 1, 'decoration_price': 0,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        booking = Booking.objects.get(pk=response.json()['id'])
+        self.assertEqual((booking.catering_price, booking.decoration_price, booking.decoration_name),
+                         (Decimal('150.00'), Decimal('5000.00'), 'Fairy Lights'))
+        self.assertEqual((booking.total_cost, booking.advance_amount), (Decimal('7670.00'), Decimal('3835.00')))
+
+        response = self.client.post('/api/bookings/', {
+            'event_type': 'Wedding', 'event_date': '2026-12-05', 'guests': 10, 'budget': 500,
+            'catering_package': 'Mystery Menu',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_decoration_page_styles_are_priced_from_the_catalog(self):
+        # Style names from the decoration page are seeded as Decoration rows
+        user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client.force_authenticate(user)
+        response = self.client.post('/api/bookings/', {
+            'event_type': 'Wedding', 'event_date': '2026-12-05', 'guests': 10, 'budget': 500,
+            'decorations': ['Sunny Marigold Oasis', 'Neon Party Vibe'], 'decoration_name': 'Free', 'decoration_price': 1,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        booking = Booking.objects.get(pk=response.json()['id'])
+        self.assertEqual((booking.decoration_name, booking.decoration_price),
+                         ('Sunny Marigold Oasis, Neon Party Vibe', Decimal('90000.00')))
+        self.assertEqual(booking.total_cost, Decimal('106200.00'))
+
+    def test_updates_cannot_set_totals(self):
+        user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client.force_authenticate(user)
+        booking_id = self.client.post('/api/bookings/', {
+            'event_type': 'Wedding', 'event_date': '2026-12-05', 'guests': 10, 'budget': 500,
+            'selected_decoration': self.lights.pk, 'catering_package': 'Basic High Tea',
+        }, format='json').json()['id']
+
+        response = self.client.patch(f'/api/bookings/{booking_id}/', {
+            'payment_status': 'Advance Paid', 'total_cost': 1, 'advance_amount': 1, 'balance_amount': 0,
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        booking = Booking.objects.get(pk=booking_id)
+        self.assertEqual((booking.total_cost, booking.balance_amount), (Decimal('7670.00'), Decimal('3835.00')))
+
+        # More guests re-quotes the booking; the decoration keeps its booked price
+        Decoration.objects.filter(pk=self.lights.pk).update(price=9000)
+        response = self.client.patch(f'/api/bookings/{booking_id}/', {'guests': 20}, format='json')
+        self.assertEqual(response.status_code, 200)
+        booking = Booking.objects.get(pk=booking_id)
+        self.assertEqual((booking.decoration_price, booking.total_cost), (Decimal('5000.00'), Decimal('9440.00')))
+
+    def test_local_catalog_expires(self):
+        # A price written without a version bump is picked up once the local copy expires
+        with patch('main.quotes.time') as clock:
+            clock.monotonic.return_value = 1000.0
+            price_catalog()
+            Decoration.objects.filter(pk=self.lights.pk).update(price=6000)
+            self.assertEqual(quote({'decorations': ['Fairy Lights']})['decoration_price'], Decimal('5000.00'))
+            clock.monotonic.return_value = 1000.0 + 301
+            self.assertEqual(quote({'decorations': ['Fairy Lights']})['decoration_price'], Decimal('6000.00'))
+
+    def test_every_priced_decoration_is_reserved_on_approval(self):
+        user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.client.force_authenticate(user)
+
+        def book(decorations):
+            response = self.client.post('/api/bookings/', {
+                'event_type': 'Wedding', 'event_date': '2026-12-05', 'guests': 10, 'budget': 500,
+                'decorations': decorations,
+            }, format='json')
+            self.assertEqual(response.status_code, 201)
+            return response.json()['id']
+
+        first = book(['Royal Mandap', 'Fairy Lights'])
+        second = book(['Fairy Lights'])
+        self.assertEqual(Booking.objects.get(pk=first).selected_decoration_id, self.mandap.pk)
+
+        self.client.force_authenticate(admin)
+        approve = lambda pk: self.client.patch(f'/api/admin/bookings/{pk}/status/', {'status': 'Approved'}, format='json')
+        self.assertEqual(approve(first).status_code, 200)
+        self.assertEqual(set(ResourceReservation.objects.values_list('resource', flat=True)),
+                         {f'decoration:{self.mandap.pk}', f'decoration:{self.lights.pk}'})
+        response = approve(second)
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('Fairy Lights', response.json()['error'])
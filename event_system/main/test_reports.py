@@ -0,0 +1,68 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import User, Booking, ConcertBooking, JobApplication
+
+
+class AdminSummaryTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client = APIClient()
+
+    def wedding(self, total, status='Pending', **extra):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10,
+                                      budget=total, total_cost=total, status=status, **extra)
+
+    def test_summary_groups_by_status_and_sums_money(self):
+        self.wedding(1000)
+        self.wedding(2500, status='Approved')
+        self.wedding(400, status='Cancelled', refund_amount=300, cancellation_fee=100)
+        self.wedding(9999, is_deleted=True)
+        ConcertBooking.objects.create(user=self.user, concert_title='Live', artist_name='A', event_date='Today',
+                                      ticket_type='General', quantity=3, total_price=300)
+        JobApplication.objects.create(full_name='A', email='a@example.com', phone='1', position='Stylist')
+
+        self.client.force_authenticate(self.admin)
+        data = self.client.get('/api/admin/summary/').json()
+
+        weddings = data['weddings']
+        self.assertEqual((weddings['count'], weddings['deleted']), (3, 1))
+        self.assertEqual(weddings['revenue'], '3900.00')
+        self.assertEqual(weddings['refunds'], '300.00')
+        self.assertEqual(weddings['cancellation_fees'], '100.00')
+        self.assertEqual(weddings['net_revenue'], '3600.00')
+        self.assertEqual(weddings['by_status']['Approved'], {'count': 1, 'revenue': '2500.00', 'refunds': '0.00',
+                                                             'cancellation_fees': '0.00'})
+        self.assertEqual(data['concerts']['tickets'], 3)
+        self.assertEqual(data['jobs']['by_status'], {'Applied': {'count': 1}})
+        self.assertEqual(data['revenue'], '4200.00')
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.client.force_authenticate(self.admin)
+        self.wedding(1000)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get('/api/admin/summary/')
+
+        for status in ('Pending', 'Approved', 'Rejected', 'Cancelled'):
+            for total in range(5):
+                self.wedding(total, status=status)
+        ConcertBooking.objects.bulk_create([
+            ConcertBooking(user=self.user, concert_title='Live', artist_name='A', event_date='Today',
+                           ticket_type='General', quantity=1, total_price=100)
+            for _ in range(20)
+        ])
+        JobApplication.objects.bulk_create([
+            JobApplication(full_name=f"A{i}", email=f"a{i}@example.com", phone='1', position='Stylist') for i in range(20)
+        ])
+        with CaptureQueriesContext(connection) as many:
+            self.client.get('/api/admin/summary/')
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+    def test_summary_is_admin_only(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get('/api/admin/summary/').status_code, 403)
@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .jobs import reject_stale_bookings
+from .models import User, Booking, ConcertBooking, DailyRevenue
+from .reports import rebuild_rollups
+
+
+def snapshot():
+    return sorted(
+        DailyRevenue.objects.exclude(count=0).values_list('day', 'product_line', 'status', 'count', 'revenue',
+                                                          'refunds', 'cancellation_fees')
+    )
+
+
+class RevenueRollupTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.client = APIClient()
+
+    def wedding(self, total=1000, **extra):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10,
+                                      budget=total, total_cost=total, **extra)
+
+    def assertMatchesRebuild(self):
+        incremental = snapshot()
+        rebuild_rollups(batch_size=2)
+        self.assertEqual(incremental, snapshot())
+
+    def test_create_cancel_delete_and_restore_are_incremental(self):
+        self.wedding(1000)
+        removed = self.wedding(2000)
+        concert = ConcertBooking.objects.create(user=self.user, concert_title='Live', artist_name='A', event_date='Today',
+                                                ticket_type='General', quantity=2, total_price=500)
+        today = timezone.localdate()
+        self.assertEqual(DailyRevenue.objects.get(day=today, product_line='weddings', status='Pending').revenue, Decimal('3000'))
+
+        self.client.force_authenticate(self.user)
+        self.client.patch(f'/api/concert-bookings/{concert.pk}/cancel/')
+        cancelled = DailyRevenue.objects.get(day=today, product_line='concerts', status='Cancelled')
+        self.assertEqual((cancelled.count, cancelled.refunds, cancelled.cancellation_fees), (1, Decimal('301'), Decimal('199')))
+        self.assertEqual(DailyRevenue.objects.get(day=today, product_line='concerts', status='Confirmed').count, 0)
+
+        removed = Booking.objects.get(pk=removed.pk)
+        removed.is_deleted = True
+        removed.save()
+        self.assertEqual(DailyRevenue.objects.get(day=today, product_line='weddings', status='Pending').count, 1)
+        removed.is_deleted = False
+        removed.save()
+        self.assertMatchesRebuild()
+
+    def test_saving_a_deferred_load_keeps_its_bucket(self):
+        booking = Booking.objects.only('pk', 'status').get(pk=self.wedding(700).pk)
+        booking.status = 'Approved'
+        booking.save()
+        self.assertEqual(DailyRevenue.objects.get(product_line='weddings', status='Approved').revenue, Decimal('700'))
+        self.assertMatchesRebuild()
+
+    def test_bulk_reject_job_moves_buckets(self):
+        stale = [self.wedding(100 * i) for i in range(1, 4)]
+        Booking.objects.filter(pk__in=[b.pk for b in stale]).update(booking_date=timezone.now() - timedelta(days=3))
+        self.wedding(50)
+        rebuild_rollups()
+
+        self.assertEqual(reject_stale_bookings(batch_size=2), 3)
+        rejected = DailyRevenue.objects.get(product_line='weddings', status='Rejected')
+        self.assertEqual((rejected.count, rejected.revenue), (3, Decimal('600')))
+        self.assertMatchesRebuild()
+
+    def test_revenue_endpoint_reads_rollups(self):
+        self.wedding(1000)
+        self.wedding(500, status='Approved')
+        today = timezone.localdate().isoformat()
+
+        self.client.force_authenticate(self.admin)
+        with self.assertNumQueries(1):
+            data = self.client.get(f'/api/admin/revenue/?from={today}&to={today}&line=weddings').json()
+        self.assertEqual(data['days'], [{'day': today, 'weddings': {'count': 2, 'revenue': '1500.00', 'refunds': '0.00',
+                                                                     'cancellation_fees': '0.00'}}])
+        self.assertEqual(data['totals']['weddings']['revenue'], '1500.00')
+        self.assertEqual(self.client.get('/api/admin/revenue/?line=parking').status_code, 400)
+        self.assertEqual(self.client.get('/api/admin/revenue/?from=yesterday').status_code, 400)
@@ -0,0 +1,87 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Concert, Festival, Blog, Tournament, SearchPosting
+from .search import rebuild_search_index, tokenize
+
+
+def make_concert(title, artist='Band', city='Mumbai', genre='Rock', description=''):
+    return Concert.objects.create(title=title, artist=artist, artistBio='', date='2026-12-01', time='8 PM', venue='V',
+                                  city=city, genre=genre, bannerImage='', thumbnail='', description=description)
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def search(self, query, **params):
+        response = self.client.get('/api/search/', {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_tokenize_drops_stopwords_and_case(self):
+        self.assertEqual(tokenize('The Rock of Mumbai, LIVE!'), ['rock', 'mumbai', 'live'])
+
+    def test_ranks_title_matches_above_body_matches(self):
+        body = make_concert('Evening Show', description='A jazz night with guests')
+        title = make_concert('Jazz Nights', genre='Jazz')
+        Festival.objects.create(name='Harvest', city='Pune', venue='V', startDate='x', endDate='y', theme='Folk',
+                                image='', about='Folk and jazz stages')
+
+        data = self.search('jazz')
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(data['results'][0], {'type': 'concert', 'id': title.pk, 'title': 'Jazz Nights', 'snippet': '',
+                                              'score': data['results'][0]['score']})
+        self.assertIn(('concert', body.pk), [(r['type'], r['id']) for r in data['results']])
+
+    def test_every_term_must_match_and_types_filter(self):
+        make_concert('Rock Fest', city='Mumbai')
+        make_concert('Rock Fest', city='Delhi')
+        Tournament.objects.create(name='Mumbai Rock Cup', sport='Chess', date=date.today())
+
+        self.assertEqual(self.search('rock mumbai')['count'], 2)
+        data = self.search('rock mumbai', type='tournament')
+        self.assertEqual([r['type'] for r in data['results']], ['tournament'])
+        self.assertEqual(self.search('rock nowhere')['count'], 0)
+
+    def test_index_follows_publish_and_soft_delete(self):
+        blog = Blog.objects.create(title='Wedding trends', content='Pastel decor')
+        self.assertEqual(self.search('pastel')['count'], 1)
+        blog.is_published = False
+        blog.save()
+        self.assertEqual(self.search('pastel')['count'], 0)
+
+        concert = make_concert('Gone Tour')
+        concert.is_deleted = True
+        concert.save()
+        self.assertEqual(self.search('gone')['count'], 0)
+        self.assertFalse(SearchPosting.objects.filter(doc_type='concert', doc_id=concert.pk).exists())
+
+    def test_pagination_and_rebuild(self):
+        for i in range(5):
+            make_concert(f'Symphony {i}')
+        first = self.search('symphony', page_size=2)
+        second = self.search('symphony', page_size=2, page=2)
+        self.assertEqual(first['count'], 5)
+        self.assertEqual(len(first['results']), 2)
+        self.assertFalse({r['id'] for r in first['results']} & {r['id'] for r in second['results']})
+
+        SearchPosting.objects.all().delete()
+        self.assertEqual(rebuild_search_index(batch_size=2), 5)
+        self.assertEqual(self.search('symphony')['count'], 5)
+
+    def test_postings_are_read_through_the_term_index(self):
+        make_concert('Indexed')
+        sql, params = SearchPosting.objects.filter(term__in=['indexed', 'band']).values('doc_type', 'doc_id').query.sql_with_params()
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                plan = ' '.join(row[-1] for row in cursor.fetchall())
+            self.assertNotIn('SCAN main_searchposting', plan)
+
+    def test_requires_a_query(self):
+        self.assertEqual(self.client.get('/api/search/').status_code, 400)
+        self.assertEqual(self.client.get('/api/search/', {'q': 'x', 'type': 'wedding'}).status_code, 400)
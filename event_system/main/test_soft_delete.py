@@ -0,0 +1,61 @@
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import User, Booking, Concert, SportsRegistration, Tournament
+
+
+class SoftDeleteManagerTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='boss', email='boss@example.com', password='pass12345', role='ADMIN')
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        self.live = self.booking()
+        self.gone = self.booking(is_deleted=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def booking(self, **extra):
+        return Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(),
+                                      guests=10, budget=100, **extra)
+
+    def test_manager_semantics(self):
+        self.assertEqual(list(Booking.objects.all()), [self.live])
+        self.assertEqual(list(Booking.objects.alive()), [self.live])
+        self.assertEqual(list(Booking.objects.deleted()), [self.gone])
+        self.assertEqual(Booking.objects.with_deleted().count(), 2)
+        # The default manager (dumpdata, related managers) keeps every row
+        self.assertEqual(Booking._default_manager.count(), 2)
+        self.assertEqual(self.user.booking_set.count(), 2)
+        self.assertEqual(list(self.user.booking_set.alive()), [self.live])
+
+    def test_deleted_rows_cannot_be_referenced(self):
+        tournament = Tournament.objects.create(name='Cup', sport='Chess', date='2026-12-01', is_deleted=True)
+        self.client.force_authenticate(self.user)
+        resp = self.client.post('/api/sports-registrations/', {
+            'tournament': tournament.pk, 'registration_type': 'Individual', 'player_name': 'P', 'price': 100,
+        }, format='json')
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn('tournament', resp.json())
+
+    def test_soft_delete_with_deferred_price_updates_the_pool(self):
+        tournament = Tournament.objects.create(name='Cup', sport='Chess', date='2026-12-01')
+        registration = SportsRegistration.objects.create(user=self.user, tournament=tournament, registration_type='Individual',
+                                                         player_name='P', price=250)
+        registration = SportsRegistration.objects.only('pk', 'is_deleted').get(pk=registration.pk)
+        registration.is_deleted = True
+        registration.save()
+        tournament.refresh_from_db()
+        self.assertEqual((tournament.prize_pool, tournament.remaining_participants), (0, 0))
+
+    def test_detail_views_hide_tombstones_even_for_admins(self):
+        self.assertEqual(self.client.get(f'/api/bookings/{self.gone.pk}/').status_code, 404)
+        concert = Concert.objects.create(title='Live', artist='A', artistBio='', date='2026-12-01', time='8 PM', venue='V',
+                                         city='C', genre='Rock', bannerImage='', thumbnail='', description='',
+                                         is_deleted=True)
+        self.assertEqual(APIClient().get(f'/api/concerts/{concert.pk}/').status_code, 404)
+
+    def test_restore_reaches_deleted_rows(self):
+        resp = self.client.post(f'/api/admin/restore/{self.gone.pk}/', {'type': 'wedding'}, format='json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(Booking.objects.count(), 2)
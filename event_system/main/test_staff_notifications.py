@@ -0,0 +1,60 @@
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .models import User, Booking, JobApplication, OutboundEmail, StaffNotification
+from .views import notify_staff_on_new_booking
+
+
+class StaffNotificationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='pass12345')
+        JobApplication.objects.bulk_create([
+            JobApplication(full_name=f"Coordinator {i}", email=f"c{i}@example.com", phone='1', position='Event Coordinator')
+            for i in range(3)
+        ])
+        OutboundEmail.objects.all().delete()
+
+    def work_emails(self):
+        return OutboundEmail.objects.filter(subject__startswith='New Work Opportunity').count()
+
+    def test_notifies_each_staff_member_once(self):
+        booking = Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10, budget=100)
+        self.assertEqual(self.work_emails(), 3)
+
+        booking = Booking.objects.get(pk=booking.pk)
+        booking.status = 'Approved'
+        booking.save()
+        booking.guests = 20
+        booking.save()
+        self.assertEqual(self.work_emails(), 3)
+        self.assertEqual(StaffNotification.objects.filter(booking=booking).count(), 3)
+
+    def test_new_staff_hear_about_approval(self):
+        booking = Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10, budget=100)
+        JobApplication.objects.create(full_name='Late Joiner', email='late@example.com', phone='1', position='Event Coordinator')
+        OutboundEmail.objects.all().delete()
+
+        booking = Booking.objects.get(pk=booking.pk)
+        booking.status = 'Approved'
+        booking.save()
+        self.assertEqual(list(OutboundEmail.objects.values_list('recipients', flat=True)), [['late@example.com']])
+
+    def test_racing_save_skips_staff_already_claimed(self):
+        booking = Booking.objects.create(user=self.user, event_type='Wedding', event_date=date.today(), guests=10, budget=100)
+        late = JobApplication.objects.bulk_create([
+            JobApplication(full_name=f"Late {i}", email=f"late{i}@example.com", phone='1', position='Event Coordinator')
+            for i in range(3)
+        ])
+        # A concurrent save got to the first newcomer before this one took the lock
+        StaffNotification.objects.create(booking=booking, application=late[0])
+        OutboundEmail.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            notify_staff_on_new_booking(Booking, booking, created=True)
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "main_staffnotification"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(sorted(r[0] for r in OutboundEmail.objects.values_list('recipients', flat=True)),
+                         ['late1@example.com', 'late2@example.com'])
+        self.assertEqual(StaffNotification.objects.filter(booking=booking).count(), 6)
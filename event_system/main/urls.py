@@ -11,7 +11,9 @@ from .views import (RegisterView, DecorationListCreateView,
                     TournamentDetailView, SportsRegistrationListCreateView, SportsRegistrationDetailView,
     JobApplicationCreateView, JobApplicationListView, JobApplicationDetailView,
     FixtureListCreateView, FixtureDetailView, BlogListCreateView, BlogDetailView, CustomInquiryView, AdminRestoreItemView,
-    ConcertListCreateView, ConcertDetailView, FestivalListCreateView, FestivalDetailView) # Added Concert/Festival views
+    ConcertListCreateView, ConcertDetailView, FestivalListCreateView, FestivalDetailView, # Added Concert/Festival views
+    MediaUploadView, AdminSummaryView, AdminRevenueView, AdminExportView, TournamentBracketView,
+    HallOfFameView, SearchView, AvailabilityView, QuoteView)
 
 urlpatterns = [
     # Auth
@@ -33,6 +35,7 @@ urlpatterns = [
     path('bookings/', BookingListCreateView.as_view(), name='booking-list'),
     path('bookings/<int:pk>/', BookingDetailView.as_view(), name='booking-detail'),
     path('bookings/<int:pk>/cancel/', BookingCancelView.as_view(), name='booking-cancel'),
+    path('quotes/', QuoteView.as_view(), name='quotes'),
     
     # Concerts
     path('concert-bookings/', ConcertBookingListView.as_view(), name='concert-booking-list'),
@@ -49,8 +52,12 @@ urlpatterns = [
     # Sports
     path('tournaments/', TournamentListCreateView.as_view(), name='tournament-list'),
     path('tournaments/<int:pk>/', TournamentDetailView.as_view(), name='tournament-detail'),
+    path('tournaments/<int:pk>/generate-bracket/', TournamentBracketView.as_view(), name='tournament-generate-bracket'),
     path('sports-registrations/', SportsRegistrationListCreateView.as_view(), name='sports-registration-list'),
     path('sports-registrations/<int:pk>/', SportsRegistrationDetailView.as_view(), name='sports-registration-detail'),
+    path('hall-of-fame/', HallOfFameView.as_view(), name='hall-of-fame'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('availability/', AvailabilityView.as_view(), name='availability'),
     path('fixtures/', FixtureListCreateView.as_view(), name='fixture-list'),
     path('fixtures/<int:pk>/', FixtureDetailView.as_view(), name='fixture-detail'),
 
@@ -62,6 +69,10 @@ urlpatterns = [
     # Admin
     path('admin/bookings/<int:pk>/status/', AdminBookingStatusUpdateView.as_view(), name='admin-booking-status'),
     path('admin/restore/<int:pk>/', AdminRestoreItemView.as_view(), name='admin-restore-item'),
+    path('admin/media/', MediaUploadView.as_view(), name='admin-media-upload'),
+    path('admin/summary/', AdminSummaryView.as_view(), name='admin-summary'),
+    path('admin/revenue/', AdminRevenueView.as_view(), name='admin-revenue'),
+    path('admin/export/<str:item_type>/', AdminExportView.as_view(), name='admin-export'),
 
     # Blogs
     path('blogs/', BlogListCreateView.as_view(), name='blog-list'),
@@ -1,32 +1,127 @@
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils import timezone
-from datetime import timedelta
-from django.core.mail import send_mail
+from django.utils.dateparse import parse_datetime
+from datetime import date, timedelta
+from pathlib import Path
+from django.views.static import serve as static_serve
+from .mail import queue_mail, queue_mass_mail
+from .inventory import InventoryError, release_booking, reserve, reserve_booking, sync_inventory
+from .auth import IsAdminRole, is_admin as is_admin_user, note_blacklisted, revoke_tokens
+from .caching import CatalogCacheMixin, invalidate_catalog
+from .exports import ExportError, export_queryset, export_response
+from .brackets import BracketError, generate_bracket, record_result
+from .availability import MAX_CALENDAR_DAYS, ResourceConflict, calendar, find_conflicts, sync_reservations
+from .quotes import MAX_BATCH_QUOTES, PRICING_INPUTS, QuoteError, booking_totals, quote, quote_many
+from .search import SEARCH_DOCUMENTS, index_document, remove_document, search
+from .reports import ROLLUP_LINES, admin_summary, hall_of_fame, refresh_hall_of_fame, revenue_by_day
+from .media import CAS_DIR, InvalidMedia, is_data_url, media_root, store_bytes, store_data_url
 from django.conf import settings
-from .models import User, Decoration, Booking, ConcertBooking, FestivalBooking, Tournament, SportsRegistration, JobApplication, Fixture, Blog, Concert, Festival
+from django.db import IntegrityError, transaction
+from django.db.models import Count
+from .models import User, Decoration, CateringPackage, PerformerPackage, Booking, ConcertBooking, FestivalBooking, Tournament, SportsRegistration, JobApplication, Fixture, Blog, Concert, Festival, StaffNotification, ADMIN_ITEM_TYPES
 from .serializers import (
     UserSerializer, DecorationSerializer, BookingSerializer, 
     ConcertBookingSerializer, FestivalBookingSerializer, 
     TournamentSerializer, SportsRegistrationSerializer, JobApplicationSerializer, FixtureSerializer, BlogSerializer,
-    ConcertSerializer, FestivalSerializer
+    ConcertSerializer, FestivalSerializer, ConcertListSerializer, FestivalListSerializer
 )
 
-class ConcertListCreateView(generics.ListCreateAPIView):
+class EagerLoadingViewMixin:
+    # Applies the serializer's declared eager-loading plan to list and detail lookups,
+    # narrowed to the requested columns when the client asked for ?fields=/?exclude=
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            queryset = serializer_class.setup_eager_loading(queryset)
+
+        params = self.request.query_params
+        if self.request.method == 'GET' and ('fields' in params or 'exclude' in params):
+            serializer = self.get_serializer()
+            if hasattr(serializer, 'sparse_only_fields'):
+                only = serializer.sparse_only_fields(queryset.model)
+                if only:
+                    queryset = queryset.only(*only)
+        return queryset
+
+class CompactListMixin:
+    # ?view=compact swaps in the lightweight card serializer for list GETs
+    list_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.list_serializer_class and self.request.method == 'GET' and self.request.query_params.get('view') == 'compact':
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+class EventFilterMixin:
+    # ?city=&genre= exact matches, ?from=/?to= (YYYY-MM-DD) on the typed date
+    # column, ?sort=date for date order. ?facets=1 wraps the list as
+    # {"results": [...], "facets": {"city": {"Mumbai": 3}, ...}}; each facet is
+    # counted with every filter except its own, so the other options stay visible.
+    date_field = 'starts_on'
+    filter_fields = ()
+
+    def event_filters(self):
+        params = self.request.query_params
+        filters = {field: params[field] for field in self.filter_fields if params.get(field)}
+        if params.get('from'):
+            filters[f'{self.date_field}__gte'] = date.fromisoformat(params['from'])
+        if params.get('to'):
+            filters[f'{self.date_field}__lte'] = date.fromisoformat(params['to'])
+        return filters
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method != 'GET':
+            return queryset
+        queryset = queryset.filter(**self.event_filters())
+        if self.request.query_params.get('sort') == 'date':
+            # Undated events ("Coming soon") have no place in date order, and a
+            # NULL sort key cannot be encoded in a keyset cursor
+            queryset = queryset.filter(**{f'{self.date_field}__isnull': False}).order_by(self.date_field, 'id')
+        return queryset
+
+    def facet_counts(self):
+        filters = self.event_filters()
+        facets = {}
+        for field in self.filter_fields:
+            others = {key: value for key, value in filters.items() if key != field}
+            rows = self.get_queryset().filter(**others).order_by().values_list(field).annotate(n=Count('pk'))
+            facets[field] = dict(sorted(rows, key=lambda row: (-row[1], row[0])))
+        return facets
+
+    def list(self, request, *args, **kwargs):
+        try:
+            self.event_filters()
+        except ValueError:
+            return Response({"error": "Dates must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        response = super().list(request, *args, **kwargs)
+        if request.query_params.get('facets') == '1':
+            data = response.data if isinstance(response.data, dict) else {'results': response.data}
+            response.data = {**data, 'facets': self.facet_counts()}
+        return response
+
+class ConcertListCreateView(CatalogCacheMixin, EventFilterMixin, CompactListMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    catalog = 'concert'
     queryset = Concert.objects.all()
     serializer_class = ConcertSerializer
+    list_serializer_class = ConcertListSerializer
     permission_classes = [permissions.AllowAny]
+    filter_fields = ('city', 'genre')
 
     def get_queryset(self):
-        return Concert.objects.filter(is_deleted=False).order_by('-id')
+        return Concert.objects.alive().order_by('-id')
 
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.save()
 
-class ConcertDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Concert.objects.all()
+class ConcertDetailView(CatalogCacheMixin, EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    catalog = 'concert'
+    queryset = Concert.objects.alive()
     serializer_class = ConcertSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -34,20 +129,24 @@ class ConcertDetailView(generics.RetrieveUpdateDestroyAPIView):
         instance.is_deleted = True
         instance.save()
 
-class FestivalListCreateView(generics.ListCreateAPIView):
+class FestivalListCreateView(CatalogCacheMixin, EventFilterMixin, CompactListMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    catalog = 'festival'
     queryset = Festival.objects.all()
     serializer_class = FestivalSerializer
+    list_serializer_class = FestivalListSerializer
     permission_classes = [permissions.AllowAny]
+    filter_fields = ('city',)
 
     def get_queryset(self):
-        return Festival.objects.filter(is_deleted=False).order_by('-id')
+        return Festival.objects.alive().order_by('-id')
 
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.save()
 
-class FestivalDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Festival.objects.all()
+class FestivalDetailView(CatalogCacheMixin, EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    catalog = 'festival'
+    queryset = Festival.objects.alive()
     serializer_class = FestivalSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -94,9 +193,9 @@ class CustomInquiryView(APIView):
         
         try:
             # Notify Admin
-            send_mail(admin_subject, admin_message, sender_email, [sender_email], fail_silently=True)
+            queue_mail(admin_subject, admin_message, sender_email, [sender_email])
             # Notify User
-            send_mail(user_subject, user_message, sender_email, [email], fail_silently=True)
+            queue_mail(user_subject, user_message, sender_email, [email])
             
             return Response({"message": "Inquiry sent successfully. Our team will contact you soon!"}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -104,30 +203,58 @@ class CustomInquiryView(APIView):
             return Response({"error": "Failed to send email. Please try again later."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class MediaUploadView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        user = request.user
+        is_admin = is_admin_user(user)
+        if not is_admin:
+            return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get('file')
+        try:
+            if upload:
+                url = store_bytes(upload.read(), upload.content_type, upload.name)
+            elif is_data_url(request.data.get('data_url')):
+                url = store_data_url(request.data['data_url'])
+            else:
+                return Response({"error": "Send a 'file' upload or a 'data_url'."}, status=status.HTTP_400_BAD_REQUEST)
+        except InvalidMedia as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"url": url}, status=status.HTTP_201_CREATED)
+
+def serve_media(request, path, store=CAS_DIR):
+    # Content-addressed files (and their hash-named variants) never change, so
+    # browsers may keep them forever. In production the web server should serve
+    # MEDIA_ROOT with the same headers.
+    response = static_serve(request, path, document_root=media_root() / store)
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response['ETag'] = '"%s"' % Path(path).stem
+    # Never let a browser run a stored file as a page or guess another type
+    response['X-Content-Type-Options'] = 'nosniff'
+    response['Content-Security-Policy'] = "default-src 'none'; sandbox"
+    return response
+
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.AllowAny]
 
-class DecorationListCreateView(generics.ListCreateAPIView):
+class DecorationListCreateView(CatalogCacheMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    catalog = 'decoration'
     queryset = Decoration.objects.all()
     serializer_class = DecorationSerializer
     permission_classes = [permissions.AllowAny]
 
-class BookingListCreateView(generics.ListCreateAPIView):
+class BookingListCreateView(EagerLoadingViewMixin, generics.ListCreateAPIView):
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        # Auto-Reject Pending bookings older than 2 days
-        from django.utils import timezone
-        from datetime import timedelta
-        cutoff = timezone.now() - timedelta(days=2)
-        # Update records that are still Pending and were created more than 2 days ago
-        Booking.objects.filter(status='Pending', booking_date__lt=cutoff).update(status='Rejected')
-
+        # Stale Pending bookings are auto-rejected by the scheduler (main/jobs.py)
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
 
@@ -135,28 +262,52 @@ class BookingListCreateView(generics.ListCreateAPIView):
             if show_deleted:
                 # Recycle bin: Either soft-deleted OR status is 'Cancelled'
                 from django.db.models import Q
-                return Booking.objects.filter(Q(is_deleted=True) | Q(status='Cancelled')).order_by('-id')
+                return Booking.objects.with_deleted().filter(Q(is_deleted=True) | Q(status='Cancelled')).order_by('-id')
             # Main View: Not deleted AND not cancelled
-            return Booking.objects.filter(is_deleted=False).exclude(status='Cancelled').order_by('-id')
+            return Booking.objects.alive().exclude(status='Cancelled').order_by('-id')
             
-        return Booking.objects.filter(user=user, is_deleted=False).order_by('-id')
+        return Booking.objects.alive().filter(user=user).order_by('-id')
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        # Prices and totals come from the server's catalog, not from the client
+        try:
+            quoted = quote(serializer.validated_data)
+        except QuoteError as e:
+            raise ValidationError({"error": str(e)})
+        serializer.save(user=self.request.user, **booking_totals(quoted))
+
+class QuoteView(APIView):
+    # Prices wedding configurations: POST one configuration, or {"configurations": [...]} for a batch
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        data = request.data
+        if 'configurations' in data:
+            configurations = data['configurations']
+            if not isinstance(configurations, list):
+                return Response({"error": "configurations must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+            if len(configurations) > MAX_BATCH_QUOTES:
+                return Response({"error": f"At most {MAX_BATCH_QUOTES} configurations per request."},
+                                status=status.HTTP_400_BAD_REQUEST)
+            return Response({"quotes": quote_many(configurations)})
+        try:
+            return Response(quote(data))
+        except QuoteError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-class BookingDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BookingDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return Booking.objects.all()
-        return Booking.objects.filter(user=user)
+            return Booking.objects.alive()
+        return Booking.objects.alive().filter(user=user)
 
-class AdminBookingStatusUpdateView(generics.UpdateAPIView):
+class AdminBookingStatusUpdateView(EagerLoadingViewMixin, generics.UpdateAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -165,7 +316,7 @@ class AdminBookingStatusUpdateView(generics.UpdateAPIView):
         # Bulletproof Admin Check
         user = request.user
         role_str = (getattr(user, 'role', '') or '').upper()
-        is_admin = role_str == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         
         if not is_admin:
             print(f"!!! ACCESS DENIED !!! User: {user.username}, Role: {role_str}, Staff: {user.is_staff}, Super: {user.is_superuser}")
@@ -176,57 +327,96 @@ class AdminBookingStatusUpdateView(generics.UpdateAPIView):
         
         if new_status in ['Approved', 'Rejected']:
             booking.status = new_status
-            booking.save()
-            
-            # --- EMAIL NOTIFICATION ---
+            # Decoration sets and performers can only be in one place per day
+            conflicts = find_conflicts(booking)
+            if conflicts:
+                return Response({"error": str(ResourceConflict(conflicts))}, status=status.HTTP_409_CONFLICT)
             try:
-                subject = f"Booking Update: {new_status}"
-                message = f"Dear {booking.user.username},\n\nYour booking for {booking.event_type} on {booking.event_date} has been {new_status}.\n\nThank you for choosing us!"
-                recipient_list = [booking.user.email]
-                sender_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'admin@example.com'
-                send_mail(subject, message, sender_email, recipient_list, fail_silently=True)
-            except Exception as e:
-                print(f"Email failed: {e}")
+                with transaction.atomic():
+                    booking.save()
+
+                    # --- EMAIL NOTIFICATION (queued in the same transaction) ---
+                    subject = f"Booking Update: {new_status}"
+                    message = f"Dear {booking.user.username},\n\nYour booking for {booking.event_type} on {booking.event_date} has been {new_status}.\n\nThank you for choosing us!"
+                    recipient_list = [booking.user.email]
+                    sender_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'admin@example.com'
+                    queue_mail(subject, message, sender_email, recipient_list)
+            except ResourceConflict as e:
+                return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
 
             return Response(self.get_serializer(booking).data)
         return Response({"error": "Invalid status"}, status=status.HTTP_400_BAD_REQUEST)
 
+class AdminSummaryView(APIView):
+    # Counts, revenue, refunds and cancellation fees for the admin dashboard
+    permission_classes = [IsAdminRole]
+
+    def get(self, request):
+        return Response(admin_summary())
+
+class AdminRevenueView(APIView):
+    # Daily revenue from the rollup table: ?from=YYYY-MM-DD&to=YYYY-MM-DD&line=weddings,concerts
+    permission_classes = [IsAdminRole]
+
+    def get(self, request):
+        today = timezone.localdate()
+        try:
+            end = date.fromisoformat(request.query_params.get('to') or today.isoformat())
+            start = date.fromisoformat(request.query_params.get('from') or (end - timedelta(days=29)).isoformat())
+        except ValueError:
+            return Response({"error": "Dates must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        lines = [l for l in request.query_params.get('line', '').split(',') if l]
+        unknown = set(lines) - set(ROLLUP_LINES)
+        if unknown:
+            return Response({"error": f"Unknown product line(s): {', '.join(sorted(unknown))}."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"from": start.isoformat(), "to": end.isoformat(), **revenue_by_day(start, end, lines)})
+
+class AdminExportView(APIView):
+    # Streams a table as CSV or NDJSON: ?output=csv|ndjson&from=YYYY-MM-DD&to=YYYY-MM-DD&status=A,B&include_deleted=1
+    permission_classes = [IsAdminRole]
+
+    def get(self, request, item_type):
+        params = request.query_params
+        try:
+            start = date.fromisoformat(params['from']) if params.get('from') else None
+            end = date.fromisoformat(params['to']) if params.get('to') else None
+        except ValueError:
+            return Response({"error": "Dates must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        statuses = [s for s in params.get('status', '').split(',') if s]
+        try:
+            queryset = export_queryset(item_type, start, end, statuses, include_deleted=params.get('include_deleted') == '1')
+            return export_response(queryset, item_type, params.get('output', 'csv'))
+        except ExportError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
 class AdminRestoreItemView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [IsAdminRole]
 
     def post(self, request, pk):
-        user = request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
-        if not is_admin:
-            return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
-
         item_type = request.data.get('type')
-        model_map = {
-            'wedding': Booking,
-            'concert': ConcertBooking,
-            'festival': FestivalBooking,
-            'tournament': Tournament,
-            'sports-registration': SportsRegistration,
-            'job': JobApplication,
-            'blog': Blog,
-            'concert-master': Concert,
-            'festival-master': Festival
-        }
-
-        model = model_map.get(item_type)
+        model = ADMIN_ITEM_TYPES.get(item_type)
         if not model:
             return Response({"error": "Invalid type"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            item = model.objects.get(pk=pk)
-            item.is_deleted = False
-            # Special case for weddings: move back to Pending if it was Cancelled
-            if item_type == 'wedding' and item.status == 'Cancelled':
-                item.status = 'Pending'
-            item.save()
+            item = model.objects.with_deleted().get(pk=pk)
+            with transaction.atomic():
+                if item.is_deleted and item_type in ('concert', 'festival'):
+                    # Soft delete gave the seats back, so restoring takes them again
+                    reserve_booking(item)
+                item.is_deleted = False
+                # Special case for weddings: move back to Pending if it was Cancelled
+                if item_type == 'wedding' and item.status == 'Cancelled':
+                    item.status = 'Pending'
+                item.save()
             return Response({"message": "Item restored successfully"})
         except model.DoesNotExist:
             return Response({"error": "Item not found"}, status=status.HTTP_404_NOT_FOUND)
+        except ResourceConflict as e:
+            # An approved wedding whose slot was taken while it sat in the recycle bin
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        except InventoryError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
 
 class ProfileView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
@@ -239,25 +429,47 @@ class ConcertBookingCreateView(generics.CreateAPIView):
     serializer_class = ConcertBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+    def create(self, request, *args, **kwargs):
+        try:
+            return super().create(request, *args, **kwargs)
+        except InventoryError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-class ConcertBookingListView(generics.ListAPIView):
+    def perform_create(self, serializer):
+        data = serializer.validated_data
+        concert = data.get('concert') or Concert.objects.alive().filter(
+            title=data['concert_title']
+        ).order_by('-id').first()
+
+        # Every booking must draw on a live concert's ledger
+        if concert is None:
+            raise ValidationError({"error": "No live concert matches this booking."})
+        if not concert.accepts_bookings:
+            raise ValidationError({"error": "Bookings for this concert are closed."})
+
+        # Seats are taken and the booking written atomically
+        with transaction.atomic():
+            reserve(concert, data['ticket_type'], data['quantity'])
+            serializer.save(user=self.request.user, concert=concert)
+
+class ConcertBookingListView(EventFilterMixin, EagerLoadingViewMixin, generics.ListAPIView):
     serializer_class = ConcertBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # ?from=/?to=/?sort=date on the show date parsed from event_date
+    date_field = 'event_on'
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
 
         if is_admin:
             if show_deleted:
-                return ConcertBooking.objects.filter(is_deleted=True).order_by('-id')
-            return ConcertBooking.objects.filter(is_deleted=False).order_by('-id')
-        return ConcertBooking.objects.filter(user=user, is_deleted=False).order_by('-id')
+                return ConcertBooking.objects.deleted().order_by('-id')
+            return ConcertBooking.objects.alive().order_by('-id')
+        return ConcertBooking.objects.alive().filter(user=user).order_by('-id')
 
-class ConcertBookingCancelView(generics.UpdateAPIView):
+class ConcertBookingCancelView(EagerLoadingViewMixin, generics.UpdateAPIView):
     queryset = ConcertBooking.objects.all()
     serializer_class = ConcertBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -266,7 +478,7 @@ class ConcertBookingCancelView(generics.UpdateAPIView):
         booking = self.get_object()
         
         # Security check
-        if booking.user != request.user and request.user.role != 'ADMIN':
+        if booking.user_id != request.user.id and not is_admin_user(request.user):
              return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
 
         # Time check: 24h limit (only for users, admins can always cancel)
@@ -275,19 +487,22 @@ class ConcertBookingCancelView(generics.UpdateAPIView):
             if time_diff > timedelta(hours=24):
                 return Response({"error": "Cancellation period (24 hours) has expired."}, status=status.HTTP_400_BAD_REQUEST)
 
-        booking.status = 'Cancelled'
+        with transaction.atomic():
+            # Status, fees and the released seats commit together; only the first cancellation hands them back
+            release_booking(booking, status='Cancelled')
+            booking.status = 'Cancelled'
         
-        # Calculate Penalty (20% penalty + 99 transaction tax)
-        original_price = float(booking.total_price)
-        penalty_rate = 0.20
-        transaction_tax = 99.0
+            # Calculate Penalty (20% penalty + 99 transaction tax)
+            original_price = float(booking.total_price)
+            penalty_rate = 0.20
+            transaction_tax = 99.0
         
-        cancellation_fee = (original_price * penalty_rate) + transaction_tax
-        refund_amount = original_price - cancellation_fee
+            cancellation_fee = (original_price * penalty_rate) + transaction_tax
+            refund_amount = original_price - cancellation_fee
         
-        booking.cancellation_fee = cancellation_fee
-        booking.refund_amount = max(0, refund_amount) # Ensure not negative
-        booking.save()
+            booking.cancellation_fee = cancellation_fee
+            booking.refund_amount = max(0, refund_amount) # Ensure not negative
+            booking.save()
         
         return Response({
             "message": f"Ticket cancelled. Deductions: ₹{cancellation_fee:.2f} (20% Fee + Tax).",
@@ -295,7 +510,7 @@ class ConcertBookingCancelView(generics.UpdateAPIView):
             "status": "Cancelled"
         })
 
-class BookingCancelView(generics.UpdateAPIView):
+class BookingCancelView(EagerLoadingViewMixin, generics.UpdateAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -304,7 +519,7 @@ class BookingCancelView(generics.UpdateAPIView):
         booking = self.get_object()
         
         # Security check
-        if booking.user != request.user and request.user.role != 'ADMIN':
+        if booking.user_id != request.user.id and not is_admin_user(request.user):
              return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
 
         # Time check: 24h limit (only for users, admins can always cancel)
@@ -343,25 +558,42 @@ class FestivalBookingCreateView(generics.CreateAPIView):
     serializer_class = FestivalBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+    def create(self, request, *args, **kwargs):
+        try:
+            return super().create(request, *args, **kwargs)
+        except InventoryError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-class FestivalBookingListView(generics.ListAPIView):
+    def perform_create(self, serializer):
+        data = serializer.validated_data
+        festival = data.get('festival') or Festival.objects.alive().filter(
+            name=data['festival_name']
+        ).order_by('-id').first()
+        if festival is None:
+            raise ValidationError({"error": "No live festival matches this booking."})
+        if not festival.accepts_bookings:
+            raise ValidationError({"error": "Bookings for this festival are closed."})
+
+        with transaction.atomic():
+            reserve(festival, data['pass_type'], data['quantity'])
+            serializer.save(user=self.request.user, festival=festival)
+
+class FestivalBookingListView(EagerLoadingViewMixin, generics.ListAPIView):
     serializer_class = FestivalBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
 
         if is_admin:
             if show_deleted:
-                return FestivalBooking.objects.filter(is_deleted=True).order_by('-id')
-            return FestivalBooking.objects.filter(is_deleted=False).order_by('-id')
-        return FestivalBooking.objects.filter(user=user, is_deleted=False).order_by('-id')
+                return FestivalBooking.objects.deleted().order_by('-id')
+            return FestivalBooking.objects.alive().order_by('-id')
+        return FestivalBooking.objects.alive().filter(user=user).order_by('-id')
 
-class FestivalBookingCancelView(generics.UpdateAPIView):
+class FestivalBookingCancelView(EagerLoadingViewMixin, generics.UpdateAPIView):
     queryset = FestivalBooking.objects.all()
     serializer_class = FestivalBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -369,8 +601,8 @@ class FestivalBookingCancelView(generics.UpdateAPIView):
     def patch(self, request, *args, **kwargs):
         booking = self.get_object()
         
-        is_admin = (getattr(request.user, 'role', '') or '').upper() == 'ADMIN' or request.user.is_staff or request.user.is_superuser
-        if booking.user != request.user and not is_admin:
+        is_admin = is_admin_user(request.user)
+        if booking.user_id != request.user.id and not is_admin:
              return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
 
         if request.user.role == 'USER':
@@ -378,18 +610,21 @@ class FestivalBookingCancelView(generics.UpdateAPIView):
             if time_diff > timedelta(hours=24):
                 return Response({"error": "Cancellation period (24 hours) has expired."}, status=status.HTTP_400_BAD_REQUEST)
 
-        booking.status = 'Cancelled'
+        with transaction.atomic():
+            # Status, fees and the released passes commit together; only the first cancellation hands them back
+            release_booking(booking, status='Cancelled')
+            booking.status = 'Cancelled'
         
-        original_price = float(booking.total_price)
-        penalty_rate = 0.20
-        transaction_tax = 99.0
+            original_price = float(booking.total_price)
+            penalty_rate = 0.20
+            transaction_tax = 99.0
         
-        cancellation_fee = (original_price * penalty_rate) + transaction_tax
-        refund_amount = original_price - cancellation_fee
+            cancellation_fee = (original_price * penalty_rate) + transaction_tax
+            refund_amount = original_price - cancellation_fee
         
-        booking.cancellation_fee = cancellation_fee
-        booking.refund_amount = max(0, refund_amount)
-        booking.save()
+            booking.cancellation_fee = cancellation_fee
+            booking.refund_amount = max(0, refund_amount)
+            booking.save()
         
         return Response({
             "message": f"Festival pass cancelled. Deductions: ₹{cancellation_fee:.2f} (20% Fee + Tax).",
@@ -397,21 +632,22 @@ class FestivalBookingCancelView(generics.UpdateAPIView):
             "status": "Cancelled"
         })
 
-class TournamentListCreateView(generics.ListCreateAPIView):
+class TournamentListCreateView(CatalogCacheMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    catalog = 'tournament'
     serializer_class = TournamentSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
 
         if is_admin and show_deleted:
-            return Tournament.objects.filter(is_deleted=True).order_by('-id')
+            return Tournament.objects.deleted().order_by('-id')
         
-        return Tournament.objects.filter(is_deleted=False).order_by('-id')
+        return Tournament.objects.alive().order_by('-id')
 
-class SportsRegistrationListCreateView(generics.ListCreateAPIView):
+class SportsRegistrationListCreateView(EagerLoadingViewMixin, generics.ListCreateAPIView):
     serializer_class = SportsRegistrationSerializer
 
     def get_permissions(self):
@@ -426,90 +662,172 @@ class SportsRegistrationListCreateView(generics.ListCreateAPIView):
         
         # If not logged in, only show winners
         if user.is_anonymous:
-            return SportsRegistration.objects.filter(status='Winner', is_deleted=False).order_by('-id')
+            return SportsRegistration.objects.alive().filter(status='Winner').order_by('-id')
 
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         
         if is_admin and not personal_only:
             if show_deleted:
-                return SportsRegistration.objects.filter(is_deleted=True).order_by('-id')
-            return SportsRegistration.objects.filter(is_deleted=False).order_by('-id')
-        return SportsRegistration.objects.filter(user=user, is_deleted=False).order_by('-id')
+                return SportsRegistration.objects.deleted().order_by('-id')
+            return SportsRegistration.objects.alive().order_by('-id')
+        return SportsRegistration.objects.alive().filter(user=user).order_by('-id')
 
     def perform_create(self, serializer):
+        if not serializer.validated_data['tournament'].accepts_registrations:
+            raise ValidationError({"error": "Registrations for this tournament are closed."})
         serializer.save(user=self.request.user)
 
-class SportsRegistrationDetailView(generics.RetrieveUpdateDestroyAPIView):
+class SearchView(APIView):
+    # Ranked catalog search: ?q=rock mumbai&type=concert,festival&page=2&page_size=20
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        params = request.query_params
+        query = params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Query parameter 'q' is required."}, status=status.HTTP_400_BAD_REQUEST)
+        types = [t for t in params.get('type', '').split(',') if t]
+        unknown = set(types) - set(SEARCH_DOCUMENTS)
+        if unknown:
+            return Response({"error": f"Unknown type(s): {', '.join(sorted(unknown))}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page = max(int(params.get('page', 1)), 1)
+            page_size = min(max(int(params.get('page_size', getattr(settings, 'API_PAGE_SIZE', 25))), 1),
+                            getattr(settings, 'API_MAX_PAGE_SIZE', 200))
+        except ValueError:
+            return Response({"error": "page and page_size must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+
+        total, results = search(query, types, offset=(page - 1) * page_size, limit=page_size)
+        return Response({"query": query, "count": total, "page": page, "page_size": page_size, "results": results})
+
+class AvailabilityView(APIView):
+    # Booked days per resource: ?from=YYYY-MM-DD&to=YYYY-MM-DD&resource=decoration,performer:DJ Raj
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        params = request.query_params
+        try:
+            start = date.fromisoformat(params.get('from') or timezone.localdate().isoformat())
+            end = date.fromisoformat(params.get('to') or (start + timedelta(days=29)).isoformat())
+        except ValueError:
+            return Response({"error": "Dates must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        if end < start or (end - start).days >= MAX_CALENDAR_DAYS:
+            return Response({"error": f"'to' must be on or after 'from' and at most {MAX_CALENDAR_DAYS} days later."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        resources = [r.strip() for r in params.get('resource', '').split(',') if r.strip()]
+        return Response({"from": start.isoformat(), "to": end.isoformat(), "booked": calendar(start, end, resources)})
+
+class HallOfFameView(APIView):
+    # Public list of tournament champions, served from a cached snapshot
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        return Response(hall_of_fame())
+
+class SportsRegistrationDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = SportsRegistration.objects.all()
     serializer_class = SportsRegistrationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return SportsRegistration.objects.all()
-        return SportsRegistration.objects.filter(user=user, is_deleted=False)
+            return SportsRegistration.objects.alive()
+        return SportsRegistration.objects.alive().filter(user=user)
 
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.save()
 
 # Detail views for DELETE operations
-class BookingDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BookingDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return Booking.objects.all()
-        return Booking.objects.filter(user=user)
+            return Booking.objects.alive()
+        return Booking.objects.alive().filter(user=user)
+
+    def perform_update(self, serializer):
+        # A change to anything that is priced re-quotes the booking from the catalog
+        data = serializer.validated_data
+        if not any(field in data for field in PRICING_INPUTS):
+            return serializer.save()
+        booking = serializer.instance
+        configuration = {field: data.get(field, getattr(booking, field))
+                         for field in ('guests', 'catering_package', 'selected_decoration', 'performer_name')}
+        configuration['decorations'] = data.get('decorations')
+        configuration['decoration_ids'] = booking.decoration_ids
+        # Decorations that were not resent keep the price they were booked at
+        kept = None
+        if 'decorations' not in data and 'selected_decoration' not in data:
+            kept = (booking.decoration_name, booking.decoration_price)
+        try:
+            quoted = quote(configuration, decoration=kept)
+        except QuoteError as e:
+            raise ValidationError({"error": str(e)})
+        serializer.save(**booking_totals(quoted))
+
+    def update(self, request, *args, **kwargs):
+        # Moving an approved wedding onto a day its decoration or performer is taken
+        try:
+            return super().update(request, *args, **kwargs)
+        except ResourceConflict as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
 
-class ConcertBookingDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ConcertBookingDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = ConcertBooking.objects.all()
     serializer_class = ConcertBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return ConcertBooking.objects.all()
-        return ConcertBooking.objects.filter(user=user, is_deleted=False)
+            return ConcertBooking.objects.alive()
+        return ConcertBooking.objects.alive().filter(user=user)
 
     def perform_destroy(self, instance):
-        instance.is_deleted = True
-        instance.save()
+        with transaction.atomic():
+            # A booking still holding seats hands them back as it goes to the recycle bin
+            release_booking(instance, is_deleted=True)
+            instance.is_deleted = True
+            instance.save()
 
-class FestivalBookingDetailView(generics.RetrieveUpdateDestroyAPIView):
+class FestivalBookingDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = FestivalBooking.objects.all()
     serializer_class = FestivalBookingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return FestivalBooking.objects.all()
-        return FestivalBooking.objects.filter(user=user, is_deleted=False)
+            return FestivalBooking.objects.alive()
+        return FestivalBooking.objects.alive().filter(user=user)
 
     def perform_destroy(self, instance):
-        instance.is_deleted = True
-        instance.save()
+        with transaction.atomic():
+            # A booking still holding seats hands them back as it goes to the recycle bin
+            release_booking(instance, is_deleted=True)
+            instance.is_deleted = True
+            instance.save()
 
-class TournamentDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TournamentDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return Tournament.objects.all()
+            return Tournament.objects.alive()
         return Tournament.objects.none()
 
     def perform_destroy(self, instance):
@@ -524,50 +842,81 @@ class JobApplicationCreateView(generics.CreateAPIView):
 
 # --- EMPLOYMENT MANAGEMENT VIEWS ---
 
-class JobApplicationListView(generics.ListAPIView):
+class JobApplicationListView(EagerLoadingViewMixin, generics.ListAPIView):
     queryset = JobApplication.objects.all().order_by('-applied_at')
     serializer_class = JobApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
 
         if is_admin:
             if show_deleted:
-                return JobApplication.objects.filter(is_deleted=True).order_by('-applied_at')
-            return JobApplication.objects.filter(is_deleted=False).order_by('-applied_at')
+                return JobApplication.objects.deleted().order_by('-applied_at')
+            return JobApplication.objects.alive().order_by('-applied_at')
         return JobApplication.objects.none()
 
-class JobApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
+class JobApplicationDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = JobApplication.objects.all()
     serializer_class = JobApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
          user = self.request.user
-         if (getattr(user, 'role', '') or '').upper() == 'ADMIN':
-             return JobApplication.objects.all()
+         if is_admin_user(user):
+             return JobApplication.objects.alive()
          return JobApplication.objects.none()
 
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.save()
 
-class FixtureListCreateView(generics.ListCreateAPIView):
+class TournamentBracketView(APIView):
+    # Seeds the confirmed registrations into a full single-elimination bracket
+    permission_classes = [IsAdminRole]
+
+    def post(self, request, pk):
+        try:
+            tournament = Tournament.objects.alive().get(pk=pk)
+        except Tournament.DoesNotExist:
+            return Response({"error": "Tournament not found"}, status=status.HTTP_404_NOT_FOUND)
+        match_date = request.data.get('match_date') or None
+        if match_date is not None:
+            try:
+                match_date = parse_datetime(str(match_date))
+            except ValueError:
+                match_date = None
+            if match_date is None:
+                return Response({"error": "match_date must be an ISO 8601 date and time, e.g. 2026-12-01T10:00."},
+                                status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(match_date):
+                match_date = timezone.make_aware(match_date)
+        try:
+            fixtures = generate_bracket(tournament, match_date=match_date)
+        except BracketError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        # Round by round, in the order generate_bracket returned them
+        order = {fixture.pk: index for index, fixture in enumerate(fixtures)}
+        loaded = FixtureSerializer.setup_eager_loading(Fixture.objects.filter(pk__in=order))
+        data = FixtureSerializer(sorted(loaded, key=lambda f: order[f.pk]), many=True, context={'request': request}).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+class FixtureListCreateView(EagerLoadingViewMixin, generics.ListCreateAPIView):
     queryset = Fixture.objects.all()
     serializer_class = FixtureSerializer
     permission_classes = [permissions.AllowAny] # Or stricter if needed
 
-class FixtureDetailView(generics.RetrieveUpdateDestroyAPIView):
+class FixtureDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Fixture.objects.all()
     serializer_class = FixtureSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 # --- SIGNALS FOR NOTIFICATIONS ---
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 
 # 1. Notify Applicant when they apply
 @receiver(post_save, sender=JobApplication)
@@ -578,8 +927,8 @@ def notify_job_applicant(sender, instance, created, **kwargs):
             subject = f"Application Received: {instance.position}"
             message = f"Dear {instance.full_name},\n\nWe have received your application for the position of {instance.position}.\nOur team will review your portfolio and get back to you shortly.\n\nBest Regards,\nInfinity Hospitality"
             from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'careers@example.com'
-            send_mail(subject, message, from_email, [instance.email], fail_silently=True)
-            print(f"Sent Career Application Email to {instance.email}")
+            queue_mail(subject, message, from_email, [instance.email])
+            print(f"Queued Career Application Email to {instance.email}")
         except Exception as e:
             print(f"Failed to send career email: {e}")
 
@@ -587,99 +936,155 @@ def notify_job_applicant(sender, instance, created, **kwargs):
 # "when any event occur and in that event if there are they work then they get an email"
 @receiver(post_save, sender=Booking)
 def notify_staff_on_new_booking(sender, instance, created, **kwargs):
-    if created or instance.status == 'Approved': # Logic: Notify when booking is confirmed
-        print(f"Checking for staff notifications for Booking #{instance.id} ({instance.event_type})")
-        
-        roles_needed = []
-        
-        # Determine roles based on booking details
-        if instance.catering_package:
-            roles_needed.append('Catering Supervisor')
+    # Logic: Notify when the booking is created or transitions to Approved, never on plain edits
+    became_approved = instance.status == 'Approved' and instance.previous_status != 'Approved'
+    if not (created or became_approved):
+        return
+
+    print(f"Checking for staff notifications for Booking #{instance.id} ({instance.event_type})")
+    
+    roles_needed = []
+    
+    # Determine roles based on booking details
+    if instance.catering_package:
+        roles_needed.append('Catering Supervisor')
+    
+    if instance.selected_decoration_id or instance.decoration_name:
+        roles_needed.append('Lead Decor Stylist')
         
-        if instance.selected_decoration or instance.decoration_name:
-            roles_needed.append('Lead Decor Stylist')
-            
-        # Generic role for all events
-        roles_needed.append('Event Coordinator')
+    # Generic role for all events
+    roles_needed.append('Event Coordinator')
 
-        if not roles_needed:
-            return
+    with transaction.atomic():
+        # Lock the booking so concurrent saves take turns; the notified list read
+        # under the lock is current, so every staff member is mailed exactly once
+        Booking.all_objects.select_for_update().filter(pk=instance.pk).values_list('pk').first()
+        notified = StaffNotification.objects.select_for_update().filter(booking=instance).values_list('application_id', flat=True)
 
-        # Find Applicants/Staff with these roles
+        # Find Applicants/Staff with these roles who have not been told about this booking yet
         # Note: In a real system, we'd filter by status='Hired'. 
         # Here we just look for anyone who applied to showcase the feature as requested.
-        potential_staff = JobApplication.objects.filter(position__in=roles_needed)
-        
-        for staff in potential_staff:
-            try:
-                subject = f"New Work Opportunity: {instance.event_type}"
-                message = f"Hello {staff.full_name},\n\nA new event has been booked that requires your expertise!\n\nEvent: {instance.event_type}\nDate: {instance.event_date}\nLocation: {instance.address or 'TBD'}\n\nRole Required: {staff.position}\n\nPlease contact the admin team for assignment details.\n\nInfinity Hospitality"
-                from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'work@example.com'
-                send_mail(subject, message, from_email, [staff.email], fail_silently=True)
-                print(f"Sent Work Notification to {staff.position}: {staff.email}")
-            except Exception as e:
-                print(f"Failed to notify staff: {e}")
+        claimed = list(
+            JobApplication.objects.alive().filter(position__in=roles_needed)
+            .exclude(pk__in=list(notified))
+            .only('id', 'full_name', 'email', 'position')
+        )
+        if not claimed:
+            return
+        StaffNotification.objects.bulk_create([StaffNotification(booking=instance, application=staff) for staff in claimed])
+
+        subject = f"New Work Opportunity: {instance.event_type}"
+        from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'work@example.com'
+        messages = [
+            (subject,
+             f"Hello {staff.full_name},\n\nA new event has been booked that requires your expertise!\n\nEvent: {instance.event_type}\nDate: {instance.event_date}\nLocation: {instance.address or 'TBD'}\n\nRole Required: {staff.position}\n\nPlease contact the admin team for assignment details.\n\nInfinity Hospitality",
+             from_email, [staff.email])
+            for staff in claimed
+        ]
+        queue_mass_mail(messages)
+    print(f"Queued {len(messages)} work notification(s) for Booking #{instance.id}")
+
+# 3. Keep the ticket ledger in step with the tiers admins edit
+@receiver(post_save, sender=Concert)
+@receiver(post_save, sender=Festival)
+def sync_ticket_inventory(sender, instance, **kwargs):
+    sync_inventory(instance)
+
+# 4. Drop cached public catalog responses whenever the catalog changes
+@receiver(post_save, sender=Concert)
+@receiver(post_delete, sender=Concert)
+@receiver(post_save, sender=Festival)
+@receiver(post_delete, sender=Festival)
+@receiver(post_save, sender=Decoration)
+@receiver(post_delete, sender=Decoration)
+@receiver(post_save, sender=CateringPackage)
+@receiver(post_delete, sender=CateringPackage)
+@receiver(post_save, sender=PerformerPackage)
+@receiver(post_delete, sender=PerformerPackage)
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+@receiver(post_save, sender=Tournament)
+@receiver(post_delete, sender=Tournament)
+def invalidate_catalog_cache(sender, instance, **kwargs):
+    invalidate_catalog(sender._meta.model_name)
+
+# 5. Role or flag changes invalidate the claims signed into existing tokens
+@receiver(post_save, sender=User)
+def revoke_stale_tokens(sender, instance, created, **kwargs):
+    if not created and instance.claims_changed:
+        print(f"Claims changed for {instance.username}, revoking issued tokens")
+        # Keep the instance in step, so saving it again does not clear the cutoff
+        instance.tokens_valid_after = revoke_tokens(instance.pk)
+
+# 6. Rebuild the hall of fame snapshot when a champion or a tournament changes
+@receiver(post_save, sender=SportsRegistration)
+@receiver(post_delete, sender=SportsRegistration)
+def refresh_winners_on_registration_change(sender, instance, **kwargs):
+    if 'Winner' in (instance.status, instance.previous_status):
+        transaction.on_commit(refresh_hall_of_fame)
+
+@receiver(post_save, sender=Tournament)
+@receiver(post_delete, sender=Tournament)
+def refresh_winners_on_tournament_change(sender, instance, **kwargs):
+    transaction.on_commit(refresh_hall_of_fame)
+
+@receiver(post_save, sender=User)
+def refresh_winners_on_username_change(sender, instance, created, **kwargs):
+    # Winners without a team or player name are listed by username
+    loaded = getattr(instance, '_loaded_claims', None)
+    if not created and loaded is not None and loaded['username'] != instance.username:
+        transaction.on_commit(refresh_hall_of_fame)
+
+# 7. Keep the search index in step with the catalog
+@receiver(post_save, sender=Concert)
+@receiver(post_save, sender=Festival)
+@receiver(post_save, sender=Blog)
+@receiver(post_save, sender=Tournament)
+def reindex_search_document(sender, instance, **kwargs):
+    index_document(instance)
+
+@receiver(post_delete, sender=Concert)
+@receiver(post_delete, sender=Festival)
+@receiver(post_delete, sender=Blog)
+@receiver(post_delete, sender=Tournament)
+def unindex_search_document(sender, instance, **kwargs):
+    remove_document(instance)
+
+# 8. Approved weddings hold their decoration set and performer for the event days.
+# Raises ResourceConflict inside the save's transaction, so a clash undoes the save.
+@receiver(post_save, sender=Booking)
+def sync_booking_reservations(sender, instance, **kwargs):
+    sync_reservations(instance)
+
+@receiver(post_save, sender=BlacklistedToken)
+def track_blacklisted_token(sender, instance, created, **kwargs):
+    if created:
+        note_blacklisted([instance.token.jti])
 
 @receiver(post_save, sender=Fixture)
-def update_loser_status(sender, instance, **kwargs):
-    # Check if we have a winner
-    if instance.winner:
-        print(f"Fixture {instance} has a winner: {instance.winner}")
-        
-        # Determine loser
-        loser = None
-        if instance.player1 and instance.player1 != instance.winner:
-            loser = instance.player1
-        elif instance.player2 and instance.player2 != instance.winner:
-            loser = instance.player2
-            
-        if loser:
-            print(f"Eliminating loser: {loser}")
-            loser.status = 'Eliminated'
-            loser.save()
-
-        # Check if only one participant remains in the tournament (The Winner)
-        remaining_active = SportsRegistration.objects.filter(
-            tournament=instance.tournament,
-            is_deleted=False
-        ).exclude(status='Eliminated').count()
-
-        if remaining_active == 1:
-            print(f"ONLY ONE REMAINING. Closing tournament {instance.tournament}.")
-            
-            # Close Tournament
-            instance.tournament.status = 'Completed'
-            instance.tournament.save()
-            
-            # The remaining one is the winner
-            final_winner = SportsRegistration.objects.filter(
-                tournament=instance.tournament,
-                is_deleted=False
-            ).exclude(status='Eliminated').first()
-
-            if final_winner:
-                final_winner.status = 'Winner'  
-                final_winner.save()
-
-                # --- NOTIFICATIONS ---
-                winner_user = final_winner.user
-                prize_amount = float(final_winner.price or 0) * 1.6
-                
-                try:
-                    subject = f"🏆 CHAMPION DECLARED: {instance.tournament.name}"
-                    message = (
-                        f"Congratulations {winner_user.username}!\n\n"
-                        f"You are the champion of '{instance.tournament.name}'.\n\n"
-                        f"TOTAL PRIZE CREDIT: ₹{prize_amount:,.2f}\n\n"
-                        f"The amount will reflect in your account within 12-24 hours.\n\n"
-                        f"Infinity Sports Management"
-                    )
-                    from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'sports@infinity.com'
-                    send_mail(subject, message, from_email, [winner_user.email], fail_silently=True)
-                except Exception as e:
-                    print(f"Notification Error: {e}")
-
-class BlogListCreateView(generics.ListCreateAPIView):
+def apply_fixture_result(sender, instance, **kwargs):
+    champion = record_result(instance)
+    if champion:
+        # --- NOTIFICATIONS ---
+        winner_user = champion.user
+        prize_amount = float(champion.price or 0) * 1.6
+
+        try:
+            subject = f"🏆 CHAMPION DECLARED: {instance.tournament.name}"
+            message = (
+                f"Congratulations {winner_user.username}!\n\n"
+                f"You are the champion of '{instance.tournament.name}'.\n\n"
+                f"TOTAL PRIZE CREDIT: ₹{prize_amount:,.2f}\n\n"
+                f"The amount will reflect in your account within 12-24 hours.\n\n"
+                f"Infinity Sports Management"
+            )
+            from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'sports@infinity.com'
+            queue_mail(subject, message, from_email, [winner_user.email])
+        except Exception as e:
+            print(f"Notification Error: {e}")
+
+class BlogListCreateView(CatalogCacheMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    catalog = 'blog'
     serializer_class = BlogSerializer
     
     def get_permissions(self):
@@ -689,16 +1094,16 @@ class BlogListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         show_deleted = self.request.query_params.get('deleted', '').lower() == 'true'
 
         if is_admin:
             if show_deleted:
-                return Blog.objects.filter(is_deleted=True).order_by('-created_at')
-            return Blog.objects.filter(is_deleted=False).order_by('-created_at')
-        return Blog.objects.filter(is_published=True, is_deleted=False).order_by('-created_at')
+                return Blog.objects.deleted().order_by('-created_at')
+            return Blog.objects.alive().order_by('-created_at')
+        return Blog.objects.alive().filter(is_published=True).order_by('-created_at')
 
-class BlogDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BlogDetailView(EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Blog.objects.all()
     serializer_class = BlogSerializer
 
@@ -709,10 +1114,10 @@ class BlogDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        is_admin = (getattr(user, 'role', '') or '').upper() == 'ADMIN' or user.is_staff or user.is_superuser
+        is_admin = is_admin_user(user)
         if is_admin:
-            return Blog.objects.all()
-        return Blog.objects.filter(is_published=True, is_deleted=False)
+            return Blog.objects.alive()
+        return Blog.objects.alive().filter(is_published=True)
 
     def perform_destroy(self, instance):
         instance.is_deleted = True
@@ -15,3 +15,15 @@ PASSWORD_HASHERS = [
 
 # Keep debug off for cleaner test output
 DEBUG = False
+
+# Tests run in one process and need no Redis server; the tests that count
+# queries on cached reads also run against the production CACHES when one is up
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'catalog': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'catalog-pages',
+    },
+}
@@ -17,7 +17,8 @@ const ConcertsPage = () => {
 
     const fetchConcerts = async () => {
         try {
-            const res = await api.get('/concerts/');
+            // Cards only need the compact representation; details load on click
+            const res = await api.get('/concerts/', { params: { view: 'compact' } });
             setConcertList(res.data);
         } catch (error) {
             console.error("Failed to load concerts", error);
@@ -26,6 +27,15 @@ const ConcertsPage = () => {
         }
     };
 
+    const openConcert = async (c) => {
+        try {
+            const res = await api.get(`/concerts/${c.id}/`);
+            setSelectedConcert(res.data);
+        } catch (error) {
+            console.error("Failed to load concert details", error);
+        }
+    };
+
     useEffect(() => {
         window.scrollTo(0, 0);
     }, [selectedConcert]);
@@ -74,7 +84,7 @@ const ConcertsPage = () => {
                         {concertList.map(c => (
                             <div
                                 key={c.id}
-                                onClick={() => setSelectedConcert(c)}
+                                onClick={() => openConcert(c)}
                                 style={{
                                     background: '#fff',
                                     borderRadius: '24px',
@@ -87,11 +97,18 @@ const ConcertsPage = () => {
                                 onMouseOver={e => { e.currentTarget.style.transform = 'translateY(-10px)'; e.currentTarget.style.borderColor = '#C4A059'; }}
                                 onMouseOut={e => { e.currentTarget.style.transform = 'translateY(0)'; e.currentTarget.style.borderColor = '#eee'; }}
                             >
-                                <div style={{ height: '300px' }}><img src={c.thumbnail} alt="" style={{ width: '100%', height: '100%', objectFit: 'cover' }} /></div>
+                                <div style={{ height: '300px' }}>
+                                    {/* WebP where supported, the JPEG variants otherwise, the original as a last resort */}
+                                    <picture>
+                                        {c.thumbnail_srcset?.webp && <source type="image/webp" srcSet={c.thumbnail_srcset.webp} sizes="(max-width: 768px) 100vw, 33vw" />}
+                                        {c.thumbnail_srcset?.jpeg && <source type="image/jpeg" srcSet={c.thumbnail_srcset.jpeg} sizes="(max-width: 768px) 100vw, 33vw" />}
+                                        <img src={c.thumbnail} alt="" style={{ width: '100%', height: '100%', objectFit: 'cover' }} />
+                                    </picture>
+                                </div>
                                 <div style={{ padding: '30px' }}>
                                     <div style={{ color: '#C4A059', fontSize: '0.8rem', fontWeight: 'bold' }}>{c.date.toUpperCase()} • {c.venue.toUpperCase()}</div>
                                     <h2 style={{ fontSize: '2rem', fontFamily: 'Playfair Display, serif', margin: '15px 0', color: '#1a1a1a' }}>{c.title}</h2>
-                                    <p style={{ color: '#666', lineHeight: '1.6', marginBottom: '25px', height: '50px', overflow: 'hidden' }}>{c.description}</p>
+                                    <p style={{ color: '#666', lineHeight: '1.6', marginBottom: '25px', height: '50px', overflow: 'hidden' }}>{c.summary}</p>
                                     <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', borderTop: '1px solid #f0f0f0', paddingTop: '20px' }}>
                                         <div>
                                             <span style={{ color: '#888', fontSize: '0.8rem' }}>Starting from</span>
@@ -28,7 +28,8 @@ const FestivalsPage = () => {
 
     const fetchFestivals = async () => {
         try {
-            const res = await API.get('/festivals/');
+            // Cards only need the compact representation; details load on select
+            const res = await API.get('/festivals/', { params: { view: 'compact' } });
             setFestivalList(res.data);
         } catch (error) {
             console.error("Failed to load festivals", error);
@@ -37,10 +38,15 @@ const FestivalsPage = () => {
         }
     };
 
-    const handleFestivalSelect = (fest) => {
-        setSelectedFestival(fest);
-        setView('details');
-        window.scrollTo(0, 0);
+    const handleFestivalSelect = async (fest) => {
+        try {
+            const res = await API.get(`/festivals/${fest.id}/`);
+            setSelectedFestival(res.data);
+            setView('details');
+            window.scrollTo(0, 0);
+        } catch (error) {
+            console.error("Failed to load festival details", error);
+        }
     };
 
     useEffect(() => {
@@ -19,8 +19,8 @@ const Home = () => {
                 const res = await API.get('/blogs/');
                 setLatestBlogs(res.data.filter(b => b.is_published).slice(0, 3));
 
-                const sportsRes = await API.get('/sports-registrations/');
-                setWinners(sportsRes.data.filter(r => r.status === 'Winner').slice(0, 4));
+                const winnersRes = await API.get('/hall-of-fame/');
+                setWinners(winnersRes.data.slice(0, 4));
             } catch (err) {
                 console.error("Home data fetch error", err);
             }
@@ -139,11 +139,11 @@ const Home = () => {
                             {winners.map(w => (
                                 <div key={w.id} style={{ background: 'rgba(255,255,255,0.03)', borderRadius: '24px', padding: '40px', border: '1px solid rgba(245,158,11,0.2)', textAlign: 'center', transition: '0.3s' }}>
                                     <div style={{ fontSize: '3.5rem', marginBottom: '20px' }}>🥇</div>
-                                    <h3 style={{ fontSize: '1.6rem', color: '#fff', marginBottom: '8px', fontWeight: '800' }}>{w.team_name || w.player_name || w.username}</h3>
-                                    <p style={{ color: '#F59E0B', fontSize: '1rem', fontWeight: '700', marginBottom: '25px', letterSpacing: '1px' }}>{w.tournament_name}</p>
+                                    <h3 style={{ fontSize: '1.6rem', color: '#fff', marginBottom: '8px', fontWeight: '800' }}>{w.winner}</h3>
+                                    <p style={{ color: '#F59E0B', fontSize: '1rem', fontWeight: '700', marginBottom: '25px', letterSpacing: '1px' }}>{w.tournament}</p>
                                     <div style={{ background: 'linear-gradient(135deg, #F59E0B, #D97706)', padding: '20px', borderRadius: '16px', boxShadow: '0 10px 20px rgba(217,119,6,0.2)' }}>
                                         <div style={{ fontSize: '0.75rem', color: 'rgba(255,255,255,0.8)', textTransform: 'uppercase', fontWeight: 'bold', marginBottom: '5px' }}>Total Settlement Won</div>
-                                        <div style={{ fontSize: '1.8rem', fontWeight: '900', color: '#fff' }}>₹{(parseFloat(w.price || 0) + parseFloat(w.winning_amount || 0)).toLocaleString()}</div>
+                                        <div style={{ fontSize: '1.8rem', fontWeight: '900', color: '#fff' }}>₹{parseFloat(w.prize).toLocaleString()}</div>
                                     </div>
                                     <div style={{ marginTop: '20px', fontSize: '0.8rem', color: '#718096', fontWeight: '600' }}>{w.sport} Category</div>
                                 </div>
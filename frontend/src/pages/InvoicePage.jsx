@@ -134,18 +134,9 @@ const InvoicePage = () => {
             }
 
             try {
+                // Prices and totals were fixed by the server when the booking was saved
                 await api.patch(`/bookings/${bookingId}/`, {
-                    payment_status: 'Advance Paid',
-                    total_cost: grandTotal,
-                    advance_amount: advanceAmount,
-                    balance_amount: balanceAmount,
-                    // Snapshot details
-                    catering_package: selectedMenu ? selectedMenu.name : '',
-                    catering_price: selectedMenu ? selectedMenu.price : 0,
-                    decoration_name: Object.values(selectedStyles).map(s => s.name).join(', '),
-                    decoration_price: totalDecorCost,
-                    performer_name: selectedPerformer ? selectedPerformer.name : '',
-                    performer_price: selectedPerformer ? selectedPerformer.price : 0
+                    payment_status: 'Advance Paid'
                 });
                 console.log("Backend updated successfully");
             } catch (error) {
@@ -278,15 +269,11 @@ const InvoicePage = () => {
             if (!currentId) {
                 const payload = {
                     ...eventData,
-                    total_cost: grandTotal,
-                    advance_amount: advanceAmount,
-                    balance_amount: balanceAmount,
+                    // The server prices what was picked; the totals here are only a preview
+                    guests: guestCount || eventData.guests,
                     catering_package: selectedMenu ? selectedMenu.name : '',
-                    catering_price: selectedMenu ? selectedMenu.price : 0,
-                    decoration_name: Object.values(selectedStyles).map(s => s.name).join(', '),
-                    decoration_price: totalDecorCost,
+                    decorations: Object.values(selectedStyles).filter(s => !s.skipped).map(s => s.name),
                     performer_name: selectedPerformer ? selectedPerformer.name : '',
-                    performer_price: selectedPerformer ? selectedPerformer.price : 0,
                     wedding_details: {
                         ...(eventData.wedding_details || {}),
                         guestCount,
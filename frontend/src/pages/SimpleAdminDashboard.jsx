@@ -37,6 +37,7 @@ const SimpleAdminDashboard = () => {
     const [blogForm, setBlogForm] = useState({ title: '', content: '', image: '', author: 'Admin' });
     const [editingBlog, setEditingBlog] = useState(null);
     const [stats, setStats] = useState({ total: 0, pending: 0, approved: 0, revenue: 0 });
+    const [summary, setSummary] = useState(null); // server-side counts and totals from /admin/summary/
     const [loading, setLoading] = useState(true);
     const [inspectingBooking, setInspectingBooking] = useState(null);
     const [managingFixtures, setManagingFixtures] = useState(null);
@@ -112,92 +113,58 @@ const SimpleAdminDashboard = () => {
         return msg.substring(0, 150);
     };
 
+    // Reload when the tab changes; the interval refreshes only the open tab
     useEffect(() => {
         fetchAllData();
         const interval = setInterval(() => fetchAllData(true), 15000);
         return () => clearInterval(interval);
-    }, []);
+    }, [activeTab]);
 
     useEffect(() => {
-        if (activeTab === 'Weddings') calculateWeddingStats(bookings);
-        else if (activeTab === 'Concerts') calculateConcertStats(viewMaster ? concerts : concertBookings);
-        else if (activeTab === 'Festivals') calculateFestivalStats(viewMaster ? festivals : festivalBookings);
-        else if (activeTab === 'Sports') {
-            const revenue = registrations.reduce((acc, curr) => acc + (parseFloat(curr.price) || 0), 0);
-            setStats({
-                total: registrations.length,
-                pending: registrations.filter(r => r.status === 'Confirmed').length,
-                approved: registrations.filter(r => r.status === 'Winner').length,
-                revenue: revenue
-            });
-        } else if (activeTab === 'Employment') {
-            setStats({
-                total: jobApplications.length,
-                pending: jobApplications.filter(j => j.status === 'Applied').length,
-                approved: jobApplications.filter(j => j.status === 'Hired').length,
-                revenue: 0
-            });
-        } else if (activeTab === 'Blogs') {
-            setStats({
-                total: blogs.length,
-                pending: blogs.filter(b => b.is_published).length,
-                approved: blogs.filter(b => !b.is_published).length,
-                revenue: 0
-            });
-        }
-    }, [activeTab, bookings, concertBookings, festivalBookings, registrations, jobApplications, blogs, concerts, festivals, viewMaster]);
+        if (viewMaster && activeTab === 'Concerts') calculateConcertStats(concerts);
+        else if (viewMaster && activeTab === 'Festivals') calculateFestivalStats(festivals);
+        else if (summary) calculateSummaryStats(summary);
+    }, [activeTab, summary, concerts, festivals, viewMaster]);
+
+    // Tab -> the lists it renders. The overview cards come from /admin/summary/,
+    // so a tab only downloads its own rows.
+    const tabLists = {
+        Weddings: [['/bookings/', setBookings]],
+        Concerts: [['/concert-bookings/', setConcertBookings], ['/concerts/', setConcerts]],
+        Festivals: [['/festival-bookings/', setFestivalBookings], ['/festivals/', setFestivals]],
+        Sports: [['/tournaments/', setTournaments], ['/sports-registrations/', setRegistrations], ['/fixtures/', setFixtures]],
+        Employment: [['/careers/applications/', setJobApplications]],
+        Blogs: [['/blogs/', setBlogs]],
+    };
+
+    // Recycle Bin sources -> label
+    const deletedLists = [
+        ['/bookings/?deleted=true', 'Wedding'],
+        ['/concert-bookings/?deleted=true', 'Concert'],
+        ['/festival-bookings/?deleted=true', 'Festival'],
+        ['/tournaments/?deleted=true', 'Tournament'],
+        ['/sports-registrations/?deleted=true', 'Sports Reg'],
+        ['/careers/applications/?deleted=true', 'Job Application'],
+        ['/blogs/?deleted=true', 'Blog'],
+        ['/concerts/?deleted=true', 'Concert Master'],
+        ['/festivals/?deleted=true', 'Festival Master'],
+    ];
 
     const fetchAllData = async (silent = false) => {
         if (!silent) setLoading(true);
         try {
-            const [res1, res2, res3, res4, res5, res6, res7, res8, res9, res10] = await Promise.all([
-                api.get('/bookings/'),
-                api.get('/concert-bookings/'),
-                api.get('/festival-bookings/'),
-                api.get('/tournaments/'),
-                api.get('/sports-registrations/'),
-                api.get('/careers/applications/'),
-                api.get('/blogs/'),
-                api.get('/fixtures/'),
-                api.get('/concerts/'),
-                api.get('/festivals/')
-            ]);
-            setBookings(res1.data);
-            setConcertBookings(res2.data || []);
-            setFestivalBookings(res3.data || []);
-            setTournaments(res4.data || []);
-            setRegistrations(res5.data || []);
-            setJobApplications(res6.data || []);
-            setBlogs(res7.data || []);
-            setFixtures(res8.data || []);
-            setConcerts(res9.data || []);
-            setFestivals(res10.data || []);
-
-            // Fetch Deleted Items for Recycle Bin
-            const [d1, d2, d3, d4, d5, d6, d7, d8, d9] = await Promise.all([
-                api.get('/bookings/?deleted=true'),
-                api.get('/concert-bookings/?deleted=true'),
-                api.get('/festival-bookings/?deleted=true'),
-                api.get('/tournaments/?deleted=true'),
-                api.get('/sports-registrations/?deleted=true'),
-                api.get('/careers/applications/?deleted=true'),
-                api.get('/blogs/?deleted=true'),
-                api.get('/concerts/?deleted=true'),
-                api.get('/festivals/?deleted=true'),
+            const lists = tabLists[activeTab] || [];
+            const [summaryRes, ...listRes] = await Promise.all([
+                api.get('/admin/summary/'),
+                ...lists.map(([path]) => api.get(path))
             ]);
+            setSummary(summaryRes.data);
+            lists.forEach(([, setter], i) => setter(listRes[i].data || []));
 
-            const allDeleted = [
-                ...d1.data.map(i => ({ ...i, _deletedType: 'Wedding' })),
-                ...d2.data.map(i => ({ ...i, _deletedType: 'Concert' })),
-                ...d3.data.map(i => ({ ...i, _deletedType: 'Festival' })),
-                ...d4.data.map(i => ({ ...i, _deletedType: 'Tournament' })),
-                ...d5.data.map(i => ({ ...i, _deletedType: 'Sports Reg' })),
-                ...d6.data.map(i => ({ ...i, _deletedType: 'Job Application' })),
-                ...d7.data.map(i => ({ ...i, _deletedType: 'Blog' })),
-                ...d8.data.map(i => ({ ...i, _deletedType: 'Concert Master' })),
-                ...d9.data.map(i => ({ ...i, _deletedType: 'Festival Master' })),
-            ];
-            setDeletedItems(allDeleted);
+            if (activeTab === 'Trash') {
+                const deleted = await Promise.all(deletedLists.map(([path]) => api.get(path)));
+                setDeletedItems(deleted.flatMap((res, i) => res.data.map(item => ({ ...item, _deletedType: deletedLists[i][1] }))));
+            }
         } catch (error) {
             console.error(error);
         } finally {
@@ -220,49 +187,48 @@ const SimpleAdminDashboard = () => {
 
 
 
-    const calculateWeddingStats = (weddings) => {
+    // Tab -> [summary line, "pending" status, "approved" status]
+    const summaryStatCards = {
+        Weddings: ['weddings', 'Pending', 'Approved'],
+        Concerts: ['concerts', 'Pending', 'Confirmed'],
+        Festivals: ['festivals', 'Confirmed', 'Cancelled'],
+        Sports: ['sports', 'Confirmed', 'Winner'],
+        Employment: ['jobs', 'Applied', 'Hired'],
+    };
+
+    const calculateSummaryStats = (data) => {
+        if (activeTab === 'Blogs') {
+            setStats({ total: data.blogs.count, pending: data.blogs.published, approved: data.blogs.drafts, revenue: 0 });
+            return;
+        }
+        const card = summaryStatCards[activeTab];
+        if (!card) return;
+        const [key, pendingStatus, approvedStatus] = card;
+        const line = data[key];
         setStats({
-            total: weddings.length,
-            pending: weddings.filter(b => b.status === 'Pending').length,
-            approved: weddings.filter(b => b.status === 'Approved').length,
-            revenue: weddings.reduce((acc, curr) => acc + (parseFloat(curr.total_cost) || 0), 0)
+            total: line.count,
+            pending: line.by_status[pendingStatus]?.count || 0,
+            approved: line.by_status[approvedStatus]?.count || 0,
+            revenue: parseFloat(line.revenue) || 0
         });
     };
 
     const calculateConcertStats = (data) => {
-        if (viewMaster) {
-            setStats({
-                total: data.length,
-                pending: data.filter(c => new Date(c.date) > new Date()).length, // Upcoming
-                approved: data.filter(c => new Date(c.date) <= new Date()).length, // Past
-                revenue: 0 // Not applicable for master
-            });
-        } else {
-            setStats({
-                total: data.length,
-                pending: data.filter(c => c.status === 'Pending').length,
-                approved: data.filter(c => c.status === 'Confirmed').length,
-                revenue: data.reduce((acc, curr) => acc + (parseFloat(curr.total_price) || 0), 0)
-            });
-        }
+        setStats({
+            total: data.length,
+            pending: data.filter(c => new Date(c.date) > new Date()).length, // Upcoming
+            approved: data.filter(c => new Date(c.date) <= new Date()).length, // Past
+            revenue: 0 // Not applicable for master
+        });
     };
 
     const calculateFestivalStats = (data) => {
-        if (viewMaster) {
-            setStats({
-                total: data.length,
-                pending: data.filter(f => new Date(f.startDate) > new Date()).length, // Upcoming
-                approved: data.filter(f => new Date(f.startDate) <= new Date()).length, // Past/Live
-                revenue: 0 // Not applicable for master
-            });
-        } else {
-            setStats({
-                total: data.length,
-                pending: data.filter(b => b.status === 'Confirmed').length,
-                approved: data.filter(b => b.status === 'Cancelled').length,
-                revenue: data.reduce((acc, curr) => acc + (parseFloat(curr.total_price) || 0), 0)
-            });
-        }
+        setStats({
+            total: data.length,
+            pending: data.filter(f => new Date(f.startDate) > new Date()).length, // Upcoming
+            approved: data.filter(f => new Date(f.startDate) <= new Date()).length, // Past/Live
+            revenue: 0 // Not applicable for master
+        });
     };
 
     const handleStatusUpdate = async (id, newStatus) => {
@@ -378,6 +344,16 @@ const SimpleAdminDashboard = () => {
         }
     };
 
+    const handleGenerateBracket = async () => {
+        try {
+            const res = await api.post(`/tournaments/${managingFixtures.id}/generate-bracket/`);
+            fetchAllData();
+            setCustomAlert({ show: true, title: 'SUCCESS', message: `Bracket generated: ${res.data.length} fixtures.` });
+        } catch (err) {
+            setCustomAlert({ show: true, title: 'ERROR', message: sanitizeError(err) });
+        }
+    };
+
     const handleSelectWinner = async (fixtureId, winnerId) => {
         try {
             await api.patch(`/fixtures/${fixtureId}/`, {
@@ -1105,6 +1081,7 @@ const SimpleAdminDashboard = () => {
                                     />
                                     <input type="time" style={inputStyle} value={newFixture.time} onChange={e => setNewFixture({ ...newFixture, time: e.target.value })} />
                                     <button onClick={handleCreateFixture} style={layoutStyles.actionBtnPrimary}>ADD</button>
+                                    <button onClick={handleGenerateBracket} style={layoutStyles.actionBtnPrimary}>AUTO BRACKET</button>
                                 </div>
 
                                 <div style={{ maxHeight: '400px', overflowY: 'auto' }}>
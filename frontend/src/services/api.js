@@ -38,4 +38,33 @@ API.interceptors.response.use(
   }
 );
 
+// --- Cursor pagination helpers ---
+// List endpoints accept ?page_size= and return { next, previous, results }.
+// streamPages yields one page (array of rows) at a time, following `next` links.
+export async function* streamPages(url, { pageSize = 50, params = {} } = {}) {
+  let response = await API.get(url, { params: { ...params, page_size: pageSize } });
+  while (true) {
+    yield response.data.results;
+    if (!response.data.next) break;
+    response = await API.get(response.data.next);
+  }
+}
+
+export const fetchAllPages = async (url, options) => {
+  const rows = [];
+  for await (const page of streamPages(url, options)) {
+    rows.push(...page);
+  }
+  return rows;
+};
+
+// Stores an image in the backend's content-addressed media store and returns its URL,
+// so forms can save a short reference instead of a base64 data URL.
+export const uploadImage = async (file) => {
+  const form = new FormData();
+  form.append("file", file);
+  const res = await API.post("admin/media/", form);
+  return res.data.url;
+};
+
 export default API;